@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple, Union
+
+import creatures_creator as cc
+import item_creator as ic
+import main as rpg
+import output_sink as osk
+import rng_service as rs
+import simulator as sim
+
+AskFunction = Callable[[str], Awaitable[str]]
+
+
+class AsyncDecisionPolicy(ABC):
+    """Базовый класс асинхронной стратегии, ожидающей решения игрока без блокировки цикла событий."""
+
+    @abstractmethod
+    async def npc_decision(self) -> Optional[int]:
+        """Выбираем класс игрового персонажа."""
+        pass
+
+    @abstractmethod
+    async def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Выбираем действие при встрече с чудовищем: 1 - атаковать, 2 - отступить, 3 - сменить оружие."""
+        pass
+
+    @abstractmethod
+    async def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Выбираем номер оружия для атаки из доступного игровому персонажу."""
+        pass
+
+    @abstractmethod
+    async def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Решаем, забрать ли найденный предмет."""
+        pass
+
+    @abstractmethod
+    async def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Решаем, загрузить ли сохранение после гибели игрового персонажа."""
+        pass
+
+
+class PromptPolicy(AsyncDecisionPolicy):
+    """Стратегия, запрашивающая решения у игрока через асинхронный источник ввода.
+
+    Источник ввода - сопрограмма, получающая текст запроса и возвращающая ответ игрока,
+    например, строку, прочитанную из сетевого соединения.
+
+    """
+
+    def __init__(self, ask: AskFunction, sink: Optional[osk.OutputSink] = None) -> None:
+        """Конструктор параметров стратегии."""
+        self.ask = ask
+        self.sink = sink if sink is not None else osk.null_sink
+
+    async def choose(self, request: str, choices: Tuple[int, ...]) -> int:
+        """Запрашиваем у игрока один из допустимых вариантов, повторяя запрос при некорректном вводе."""
+        while True:
+            self.sink.flush()
+            try:
+                decision = int(await self.ask(request))
+                if decision not in choices:
+                    raise ValueError()
+            except ValueError:
+                self.sink.emit("error", "Неккоректный ввод! Повторите!")
+            else:
+                return decision
+
+    async def npc_decision(self) -> Optional[int]:
+        """Запрашиваем у игрока класс игрового персонажа."""
+        self.sink.emit(
+            "prompt", "Выберете КЛАСС персонажа, которым будете проходить игру."
+        )
+        return await self.choose("1 - Мечник. 2 - Лучник. 3 - Маг. ", (1, 2, 3))
+
+    async def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Запрашиваем у игрока действие при встрече с чудовищем."""
+        return await self.choose(
+            f"У рыцаря {npc_info.get_health_info()} жизней, "
+            f"используемое оружие: '{npc_info.get_weapon_info()}': {npc_info.get_attack_info()}! "
+            f"1 - Атаковать. 2 - Отступить. 3 - Выбрать другое оружие для атаки. ",
+            (1, 2, 3),
+        )
+
+    async def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Запрашиваем у игрока оружие для атаки."""
+        weapons = npc_info.get_weapons()
+        return await self.choose(
+            "Выберете оружие: "
+            + "".join(
+                f"{n + 1} - {item}: {item.get_damage_info()}. "
+                for n, item in enumerate(weapons)
+            ),
+            tuple(range(1, len(weapons) + 1)),
+        )
+
+    async def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Запрашиваем у игрока решение о найденном предмете."""
+        if totem:
+            self.sink.emit(
+                "prompt",
+                "Вам повезло, вы нашли ТОТЕМ Корлуна Могучего, "
+                "способного обмануть смерть раз в 3 месяца, "
+                "\nно вы не Корлун и можете использовать ТОТЕМ лишь однажды, "
+                "чтобы повернуть время вспять и вернуться к жизни!",
+            )
+            return await self.choose(
+                "1 - Сохранить игру, взяв ТОТЕМ с собой! 2 - Оставить на месте. ",
+                (1, 2),
+            )
+        self.sink.emit(
+            "prompt",
+            "Найден предмет: {}! Сила атаки {} \nСумка героя: {}.",
+            weapon_info,
+            weapon_info.get_damage_info(),
+            npc_info.show_bag(),
+        )
+        return await self.choose(
+            "1 - Взять найденный предемет. 2 - Оставить на месте. ", (1, 2)
+        )
+
+    async def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Запрашиваем у игрока решение о загрузке сохранения, если в инвентаре есть тотем."""
+        if not npc_info.check_item_in_bag(ic.Totem()):
+            return False
+        self.sink.emit("prompt", "ЗАГРУЗИТЬ сохранение?")
+        return await self.choose("1 - Да. 2 - Нет. ", (1, 2)) == 1
+
+
+async def play_session(
+    policy: Any,
+    sink: Optional[osk.OutputSink] = None,
+    seed: Optional[int] = None,
+) -> sim.GameOutcome:
+    """Проводим одну партию в цикле событий asyncio и возвращаем её итог.
+
+    Стратегия может быть как асинхронной, так и обычной, например, ботом из модуля simulator.
+
+    """
+    if sink is None:
+        sink = osk.null_sink
+    rng = rs.GameRandom(seed)
+    npc_choice = await rpg.DecisionRequest("npc_decision", {}).ask_async(policy)
+    npc = rpg.create_npc(
+        npc_choice, rpg.initial_npc_hp, rpg.initial_npc_attack, sink=sink, rng=rng
+    )
+    game = rpg.Game(
+        rpg.create_event_list(npc, cc.Storage(npc)),
+        policy=policy,
+        sink=sink,
+        rng=rng,
+    )
+    victory = True
+    try:
+        while game.monster_counter != rpg.victory_monster_count:
+            await game.run_async()
+    except rpg.GameOver:
+        victory = False
+    if victory:
+        sink.emit("separator", "-------------------")
+        sink.emit("victory", "ПОБЕДА")
+    sink.flush()
+    return sim.GameOutcome(victory, game.monster_counter, game.totem_loads, game.turns)
+
+
+async def run_sessions(
+    policies: Iterable[Any], seed: Optional[int] = None
+) -> List[sim.GameOutcome]:
+    """Проводим партии нескольких игроков одновременно в одном цикле событий."""
+    policies = list(policies)
+    return list(
+        await asyncio.gather(
+            *(
+                play_session(policy, seed=game_seed)
+                for policy, game_seed in zip(
+                    policies, rs.game_seeds(seed, len(policies))
+                )
+            )
+        )
+    )
+
+
+async def console_ask(request: str) -> str:
+    """Читаем ответ игрока из терминала, не блокируя цикл событий."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, request)
+
+
+if __name__ == "__main__":
+    terminal = osk.TerminalSink()
+    asyncio.run(play_session(PromptPolicy(console_ask, terminal), terminal))
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy
+
+import creatures_creator as cc
+import main as rpg
+
+SWORDSMAN: int = cc.SWORDSMAN
+ARCHER: int = cc.ARCHER
+WIZARD: int = cc.WIZARD
+
+HERO_WINS: int = 1
+MONSTER_WINS: int = -1
+MUTUAL_DEATH: int = 0
+
+dodge_probability: float = 0.5
+odds_cache_size: int = 4096
+
+
+class BattleResults(NamedTuple):
+    """Итоги серии боёв: победитель, количество раундов и оставшиеся жизни сторон."""
+
+    winner: numpy.ndarray
+    rounds: numpy.ndarray
+    hero_hp: numpy.ndarray
+    monster_hp: numpy.ndarray
+
+
+class BattleOdds(NamedTuple):
+    """Точное распределение исхода боя и ожидаемые значения его показателей.
+
+    Ожидаемые жизни сторон учитывают погибшую сторону с нулём жизней.
+
+    """
+
+    win: float
+    loss: float
+    draw: float
+    hero_hp: float
+    monster_hp: float
+    rounds: float
+
+
+def class_code(creature: Any) -> int:
+    """Получаем код класса воина (Мечник, Лучник, Маг) для людей и чудовищ."""
+    return int(creature.class_code)
+
+
+def resolve_battles(
+    hero_hp: Any,
+    hero_attack: Any,
+    monster_hp: Any,
+    monster_attack: Any,
+    hero_class: Any,
+    monster_class: Any,
+    rng: Optional[numpy.random.Generator] = None,
+) -> BattleResults:
+    """Проводим одновременно N независимых боёв до гибели одной или обеих сторон.
+
+    Правила совпадают с боем объектов игры: в каждом раунде стороны наносят удары одновременно,
+    игровой персонаж уворачивается от удара с вероятностью 50%, если чудовище одного с ним класса,
+    при одновременной гибели сторон бой считается взаимной гибелью.
+    На каждом раунде обрабатываются только продолжающиеся бои.
+
+    """
+    if rng is None:
+        rng = numpy.random.default_rng()
+    arrays = numpy.broadcast_arrays(
+        hero_hp, hero_attack, monster_hp, monster_attack, hero_class, monster_class
+    )
+    hero_hp, hero_attack, monster_hp, monster_attack = (
+        numpy.array(array, dtype=numpy.int64) for array in arrays[:4]
+    )
+    same_class = arrays[4] == arrays[5]
+    rounds = numpy.zeros(hero_hp.shape, dtype=numpy.int64)
+
+    flat_hero_hp = hero_hp.reshape(-1)
+    flat_monster_hp = monster_hp.reshape(-1)
+    flat_rounds = rounds.reshape(-1)
+    flat_hero_attack = hero_attack.reshape(-1)
+    flat_monster_attack = monster_attack.reshape(-1)
+    flat_same_class = same_class.reshape(-1)
+
+    fighting = numpy.flatnonzero((flat_hero_hp > 0) & (flat_monster_hp > 0))
+    if numpy.any(
+        (flat_hero_attack[fighting] <= 0) & (flat_monster_attack[fighting] <= 0)
+    ):
+        raise ValueError("Бой не может закончиться: обе стороны не наносят урона.")
+    while fighting.size:
+        received = flat_monster_attack[fighting]
+        dodged = flat_same_class[fighting] & (
+            rng.random(fighting.size) < dodge_probability
+        )
+        flat_hero_hp[fighting] -= numpy.where(dodged, 0, received)
+        flat_monster_hp[fighting] -= flat_hero_attack[fighting]
+        flat_rounds[fighting] += 1
+        fighting = fighting[
+            (flat_hero_hp[fighting] > 0) & (flat_monster_hp[fighting] > 0)
+        ]
+
+    winner = numpy.where(
+        hero_hp > 0, HERO_WINS, numpy.where(monster_hp > 0, MONSTER_WINS, MUTUAL_DEATH)
+    )
+    return BattleResults(winner, rounds, hero_hp, monster_hp)
+
+
+def random_battles(
+    n_battles: int,
+    hero_hp: int,
+    hero_attack: int,
+    hero_class: int,
+    rng: Optional[numpy.random.Generator] = None,
+    monster_health: Tuple[int, int] = rpg.initial_monster_hp_range,
+    monster_attack: Tuple[int, int] = rpg.initial_monster_attack_range,
+) -> BattleResults:
+    """Проводим N боёв игрового персонажа с чудовищами, параметры которых выбираются как в событии «Бой»."""
+    if rng is None:
+        rng = numpy.random.default_rng()
+    monster_hp = rng.integers(monster_health[0], monster_health[1] + 1, n_battles)
+    monster_attack_value = rng.integers(
+        monster_attack[0], monster_attack[1] + 1, n_battles
+    )
+    monster_class = rng.integers(SWORDSMAN, WIZARD + 1, n_battles)
+    return resolve_battles(
+        hero_hp,
+        hero_attack,
+        monster_hp,
+        monster_attack_value,
+        hero_class,
+        monster_class,
+        rng,
+    )
+
+
+@functools.lru_cache(maxsize=odds_cache_size)
+def battle_odds(
+    hero_hp: int,
+    hero_attack: int,
+    monster_hp: int,
+    monster_attack: int,
+    same_class: bool,
+) -> BattleOdds:
+    """Точно рассчитываем исход боя игрового персонажа с чудовищем по правилам боя объектов игры.
+
+    Чудовище теряет одинаковое количество жизней в каждом раунде, поэтому состояние боя
+    после раунда определяется количеством пропущенных игровым персонажем ударов.
+    Распределение этого количества рассчитывается по раундам, пока бой не закончится.
+    Результаты запоминаются в кэше ограниченного размера, повторный запрос - поиск в словаре.
+
+    """
+    if hero_hp <= 0 or monster_hp <= 0:
+        return BattleOdds(
+            float(hero_hp > 0),
+            float(hero_hp <= 0 < monster_hp),
+            float(hero_hp <= 0 and monster_hp <= 0),
+            float(max(hero_hp, 0)),
+            float(max(monster_hp, 0)),
+            0.0,
+        )
+    if hero_attack <= 0 and monster_attack <= 0:
+        raise ValueError("Бой не может закончиться: обе стороны не наносят урона.")
+    dodge = dodge_probability if same_class else 0.0
+    if hero_attack <= 0:
+        hits = -(-hero_hp // monster_attack)
+        return BattleOdds(0.0, 1.0, 0.0, 0.0, float(monster_hp), hits / (1 - dodge))
+    win = loss = draw = hero_left = monster_left = rounds = 0.0
+    fighting = {hero_hp: 1.0}
+    for n_round in range(1, -(-monster_hp // hero_attack) + 1):
+        monster_left_now = monster_hp - n_round * hero_attack
+        outcomes: Dict[int, float] = {}
+        for hp, probability in fighting.items():
+            if dodge:
+                outcomes[hp] = outcomes.get(hp, 0.0) + probability * dodge
+            hit = hp - monster_attack
+            outcomes[hit] = outcomes.get(hit, 0.0) + probability * (1 - dodge)
+        fighting = {}
+        for hp, probability in outcomes.items():
+            if hp > 0 and monster_left_now > 0:
+                fighting[hp] = fighting.get(hp, 0.0) + probability
+                continue
+            rounds += n_round * probability
+            if hp > 0:
+                win += probability
+                hero_left += hp * probability
+            elif monster_left_now > 0:
+                loss += probability
+                monster_left += monster_left_now * probability
+            else:
+                draw += probability
+        if not fighting:
+            break
+    return BattleOdds(win, loss, draw, hero_left, monster_left, rounds)
+
+
+def creature_odds(human: Any, monster: Any) -> BattleOdds:
+    """Рассчитываем исход боя объектов игры по их текущим показателям."""
+    return battle_odds(
+        human.get_health_info(),
+        human.get_attack_info(),
+        monster.get_health_info(),
+        monster.get_attack_info(),
+        class_code(human) == class_code(monster),
+    )
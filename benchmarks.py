@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import creatures_creator as cc
+import item_creator as ic
+import main as rpg
+import rng_service as rs
+import simulator as sim
+
+
+default_number: int = 2000
+default_repeat: int = 5
+default_processes: int = 5
+default_threshold: float = 0.25
+default_baseline_path: str = "benchmarks_baseline.json"
+benchmark_seed: int = 2021
+calibration_case: str = "calibration"
+bag_sizes: Tuple[int, ...] = (1, 3, 5)
+history_depths: Tuple[int, ...] = (1, 8, 64)
+
+Case = Callable[[], Callable[[], Any]]
+
+
+class Regression(NamedTuple):
+    """Замедление теста производительности относительно эталонного результата."""
+
+    name: str
+    baseline: float
+    current: float
+
+    def ratio(self) -> float:
+        """Получаем отношение текущего времени к эталонному."""
+        return self.current / self.baseline
+
+
+def create_hero() -> cc.HumanArcher:
+    """Создаём игрового персонажа с начальным оружием и фиксированным источником случайных чисел."""
+    npc = cc.HumanFactory(15, 15, rs.GameRandom(benchmark_seed)).create_archer()
+    npc.add_item_to_bag(ic.Sword(10), initial_weapon=True)
+    return npc
+
+
+def filled_hero(bag_size: int) -> cc.HumanArcher:
+    """Создаём игрового персонажа с заданным количеством предметов в инвентаре."""
+    npc = create_hero()
+    for item in (ic.Bow(12), ic.Arrow(), ic.SpellBook(9), ic.Totem())[: bag_size - 1]:
+        npc.add_item_to_bag(item)
+    return npc
+
+
+def calibration() -> Callable[[], Any]:
+    """Эталонная нагрузка на интерпретатор, не зависящая от кода игры.
+
+    Время остальных тестов сравнивается с эталоном с поправкой на изменение времени этой нагрузки,
+    поэтому общее замедление или ускорение машины не считается замедлением кода.
+
+    """
+    items = list(range(64))
+    return lambda: sorted({str(n): n for n in items}.items())
+
+
+def game_turn() -> Callable[[], Any]:
+    """Ход партии бота: Game.run с переходом к следующему событию."""
+    seeds = itertools.count(benchmark_seed)
+    policy = sim.AttackPolicy()
+    game = sim.new_game(policy, rs.GameRandom(next(seeds)))
+
+    def run() -> None:
+        nonlocal game
+        try:
+            game.run()
+        except rpg.GameOver:
+            game = sim.new_game(policy, rs.GameRandom(next(seeds)))
+            return
+        if game.monster_counter == rpg.victory_monster_count:
+            game = sim.new_game(policy, rs.GameRandom(next(seeds)))
+
+    return run
+
+
+def transition() -> Callable[[], Any]:
+    """Переход партии к другому объекту-событию."""
+    game = sim.new_game(sim.AttackPolicy(), rs.GameRandom(benchmark_seed))
+    events = game.event_list
+    return lambda: game.transition_to(events[game.turns % len(events)])
+
+
+def event_start(event_class: Any) -> Case:
+    """Получаем тест запуска объекта-события заданного класса."""
+
+    def case() -> Callable[[], Any]:
+        game = sim.new_game(sim.AttackPolicy(), rs.GameRandom(benchmark_seed))
+        event = next(
+            event for event in game.event_list if isinstance(event, event_class)
+        )
+        memento = event.npc.save()
+
+        def run() -> None:
+            event.npc.restore(memento)
+            game.transition_to(event)
+            try:
+                event.start()
+            except rpg.GameOver:
+                pass
+
+        return run
+
+    return case
+
+
+def add_item(bag_size: int) -> Case:
+    """Получаем тест добавления предмета в инвентарь заданного размера."""
+
+    def case() -> Callable[[], Any]:
+        npc = filled_hero(bag_size)
+        return lambda: npc.add_item_to_bag(ic.Sword(11))
+
+    return case
+
+
+def check_item(bag_size: int) -> Case:
+    """Получаем тест поиска предмета в инвентаре заданного размера."""
+
+    def case() -> Callable[[], Any]:
+        npc = filled_hero(bag_size)
+        totem = ic.Totem()
+        return lambda: npc.check_item_in_bag(totem)
+
+    return case
+
+
+def select_weapon(bag_size: int) -> Case:
+    """Получаем тест выбора оружия из инвентаря заданного размера.
+
+    Как и в бою, номер оружия запрашивается у стратегии-бота, которая оставляет текущее оружие.
+
+    """
+
+    def case() -> Callable[[], Any]:
+        npc = filled_hero(bag_size)
+        policy = sim.AttackPolicy()
+        request = rpg.DecisionRequest("weapon_decision", dict(npc_info=npc))
+        return lambda: npc.equip_weapon(request.ask(policy))
+
+    return case
+
+
+def storage_backup(depth: int) -> Case:
+    """Получаем тест сохранения при заполненной истории заданной глубины."""
+
+    def case() -> Callable[[], Any]:
+        storage = cc.Storage(create_hero(), capacity=depth)
+        for _ in range(depth):
+            storage.backup()
+        return storage.backup
+
+    return case
+
+
+def storage_undo(depth: int) -> Case:
+    """Получаем тест загрузки сохранения при истории заданной глубины."""
+
+    def case() -> Callable[[], Any]:
+        storage = cc.Storage(create_hero(), capacity=depth)
+        for _ in range(depth):
+            storage.backup()
+
+        def run() -> None:
+            storage.undo()
+            storage.backup()
+
+        return run
+
+    return case
+
+
+def item_factories() -> Callable[[], Any]:
+    """Создание предметов всеми фабриками предметов."""
+    rng = rs.GameRandom(benchmark_seed)
+
+    def run() -> None:
+        ic.SwordFactory(rng).create_unique_item()
+        ic.BowFactory(rng).create_unique_item()
+        ic.MagicAcademy(rng).create_unique_item()
+        ic.ArrowFactory().create_standart_item()
+        ic.MysteriousPlace().create_standart_item()
+        ic.AppleTree(rng).create_standart_item()
+
+    return run
+
+
+def monster_factory() -> Callable[[], Any]:
+    """Создание чудовища по коду класса."""
+    factory = cc.MonsterFactory(20, 25)
+    return lambda: factory.create_by_code(cc.ARCHER)
+
+
+def monster_batch() -> Callable[[], Any]:
+    """Выбор пакета описаний чудовищ."""
+    rng = rs.GameRandom(benchmark_seed)
+    return lambda: cc.MonsterFactory.create_random_batch(16, (10, 25), (10, 30), rng)
+
+
+def benchmark_cases() -> Dict[str, Case]:
+    """Перечисляем тесты производительности горячих участков игры."""
+    cases: Dict[str, Case] = {
+        calibration_case: calibration,
+        "game.run": game_turn,
+        "game.transition_to": transition,
+        "event_battle.start": event_start(rpg.EventBattle),
+        "event_apple.start": event_start(rpg.EventApple),
+        "event_sword.start": event_start(rpg.EventSword),
+        "event_bow.start": event_start(rpg.EventBow),
+        "event_spell_book.start": event_start(rpg.EventSpellBook),
+        "event_arrow.start": event_start(rpg.EventArrow),
+        "event_totem.start": event_start(rpg.EventTotem),
+        "item_factories": item_factories,
+        "monster_factory.create_by_code": monster_factory,
+        "monster_factory.create_random_batch": monster_batch,
+    }
+    for size in bag_sizes:
+        cases[f"add_item_to_bag[{size}]"] = add_item(size)
+        cases[f"check_item_in_bag[{size}]"] = check_item(size)
+        cases[f"select_weapon[{size}]"] = select_weapon(size)
+    for depth in history_depths:
+        cases[f"storage.backup[{depth}]"] = storage_backup(depth)
+        cases[f"storage.undo[{depth}]"] = storage_undo(depth)
+    return cases
+
+
+def measure(run: Callable[[], Any], number: int, repeat: int) -> float:
+    """Измеряем лучшее из нескольких повторений среднее время одного вызова в наносекундах."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None,
+    number: int = default_number,
+    repeat: int = default_repeat,
+) -> Dict[str, float]:
+    """Проводим тесты производительности и получаем время одного вызова в наносекундах.
+
+    Повторения чередуются между тестами, чтобы кратковременная загрузка машины
+    не искажала результат одного теста сильнее остальных. Решения принимают
+    стратегии-боты, а сообщения игры получает пустой приёмник, поэтому тесты
+    не обращаются к терминалу.
+
+    """
+    cases = benchmark_cases()
+    results: Dict[str, float] = {}
+    runs = {name: cases[name]() for name in (names if names is not None else cases)}
+    for _ in range(repeat):
+        for name, run in runs.items():
+            current = measure(run, number, 1)
+            results[name] = min(results.get(name, current), current)
+    return results
+
+
+def run_in_processes(
+    names: Optional[Iterable[str]] = None,
+    number: int = default_number,
+    repeat: int = default_repeat,
+    processes: int = default_processes,
+) -> Dict[str, float]:
+    """Проводим тесты в нескольких новых процессах интерпретатора и получаем медиану результатов.
+
+    Время одного и того же теста заметно различается между процессами из-за размещения
+    объектов в памяти, поэтому эталон и подтверждение замедления не опираются на один процесс.
+
+    """
+    arguments = [(None if names is None else list(names), number, repeat)] * processes
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        runs = pool.starmap(run_benchmarks, arguments)
+    if calibration_case not in runs[0]:
+        return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+    # Результаты каждого процесса приводятся к медианному времени эталонной нагрузки.
+    calibration_time = statistics.median(run[calibration_case] for run in runs)
+    return {
+        name: statistics.median(
+            run[name] * calibration_time / run[calibration_case] for run in runs
+        )
+        for name in runs[0]
+    }
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = default_threshold,
+) -> List[Regression]:
+    """Находим тесты, время которых превышает эталонное больше чем на заданную долю.
+
+    Если в результатах и эталоне есть эталонная нагрузка, эталонное время остальных тестов
+    масштабируется на отношение её текущего времени к эталонному.
+
+    """
+    scale = 1.0
+    if calibration_case in results and calibration_case in baseline:
+        scale = results[calibration_case] / baseline[calibration_case]
+    return [
+        Regression(name, baseline[name] * scale, current)
+        for name, current in results.items()
+        if name != calibration_case
+        and name in baseline
+        and current > baseline[name] * scale * (1 + threshold)
+    ]
+
+
+def save_results(results: Dict[str, float], path: str) -> None:
+    """Записываем результаты тестов производительности в файл JSON."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_results(path: str) -> Dict[str, float]:
+    """Читаем результаты тестов производительности из файла JSON."""
+    with open(path, encoding="utf-8") as file:
+        return dict(json.load(file))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Тесты производительности игры.")
+    parser.add_argument("--output", default=None, help="файл JSON для результатов")
+    parser.add_argument("--baseline", default=default_baseline_path)
+    parser.add_argument("--threshold", type=float, default=default_threshold)
+    parser.add_argument("--number", type=int, default=default_number)
+    parser.add_argument("--repeat", type=int, default=default_repeat)
+    parser.add_argument("--processes", type=int, default=default_processes)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="сохранить результаты как эталон"
+    )
+    arguments = parser.parse_args()
+    if arguments.save_baseline:
+        results = run_in_processes(
+            number=arguments.number,
+            repeat=arguments.repeat,
+            processes=arguments.processes,
+        )
+    else:
+        results = run_benchmarks(number=arguments.number, repeat=arguments.repeat)
+    for name, value in results.items():
+        print(f"{name:<40}{value:>12.0f} нс")
+    if arguments.output is not None:
+        save_results(results, arguments.output)
+    if arguments.save_baseline:
+        save_results(results, arguments.baseline)
+    else:
+        baseline = load_results(arguments.baseline)
+        regressions = compare(results, baseline, arguments.threshold)
+        if regressions:
+            # Замедление засчитывается, только если оно подтверждается повторным замером.
+            names = [calibration_case] + [regression.name for regression in regressions]
+            results = run_in_processes(
+                names, arguments.number, arguments.repeat, arguments.processes
+            )
+            regressions = compare(results, baseline, arguments.threshold)
+        for regression in regressions:
+            print(
+                f"ЗАМЕДЛЕНИЕ {regression.name}: {regression.baseline:.0f} -> "
+                f"{regression.current:.0f} нс (x{regression.ratio():.2f})"
+            )
+        sys.exit(1 if regressions else 0)
@@ -1,9 +1,32 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Union, Tuple
-
-from numpy.random import choice
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    Tuple,
+    Type,
+)
+
+import numpy
+
+import item_creator as ic
+import rng_service as rs
+
+SWORDSMAN: int = 1
+ARCHER: int = 2
+WIZARD: int = 3
+class_names: Dict[int, str] = {SWORDSMAN: "Мечник", ARCHER: "Лучник", WIZARD: "Маг"}
+default_storage_capacity: int = 8
+default_history_page_size: int = 10
 
 
 class AbstractFactory(ABC):
@@ -45,31 +68,78 @@ class MonsterFactory(AbstractFactory):
         """Создаём Мага."""
         return MonsterWizard(self.health, self.attack_value)
 
+    def create_by_code(
+        self, class_code: int
+    ) -> Union[MonsterSwordsman, MonsterArcher, MonsterWizard]:
+        """Создаём воина по коду его класса."""
+        if class_code == SWORDSMAN:
+            return self.create_swordsman()
+        elif class_code == ARCHER:
+            return self.create_archer()
+        return self.create_wizard()
+
+    @staticmethod
+    def create_batch(health: Any, attack_value: Any, class_code: Any) -> MonsterBatch:
+        """Создаём пакет чудовищ по массивам уровней жизни, сил атаки и кодов классов."""
+        return MonsterBatch(health, attack_value, class_code)
+
+    @staticmethod
+    def create_random_batch(
+        count: int,
+        health_range: Tuple[int, int],
+        attack_range: Tuple[int, int],
+        rng: Optional[rs.GameRandom] = None,
+    ) -> MonsterBatch:
+        """Создаём пакет чудовищ случайных классов со случайными уровнями жизни и силами атаки."""
+        uniform = (rng if rng is not None else rs.shared_random).random_block(
+            (3, count)
+        )
+        ranges = numpy.array([health_range, attack_range, (SWORDSMAN, WIZARD)])
+        low = ranges[:, :1]
+        values = low + (uniform * (ranges[:, 1:] - low + 1)).astype(numpy.int64)
+        return MonsterBatch(values[0], values[1], values[2])
+
 
 class HumanFactory(AbstractFactory):
     """Фабрика людей - войнов."""
 
-    def __init__(self, initial_hp: int, initial_attack_value: int) -> None:
+    def __init__(
+        self,
+        initial_hp: int,
+        initial_attack_value: int,
+        rng: Optional[rs.GameRandom] = None,
+    ) -> None:
         """Конструктор параметров людей-воинов."""
         self.health = initial_hp
         self.attack_value = initial_attack_value
+        self.rng = rng
 
     def create_swordsman(self) -> HumanSwordsman:
         """Создаём Мечника."""
-        return HumanSwordsman(self.health, self.attack_value)
+        return HumanSwordsman(self.health, self.attack_value, self.rng)
 
     def create_archer(self) -> HumanArcher:
         """Создаём Лучника."""
-        return HumanArcher(self.health, self.attack_value)
+        return HumanArcher(self.health, self.attack_value, self.rng)
 
     def create_wizard(self) -> HumanWizard:
         """Создаём Мага."""
-        return HumanWizard(self.health, self.attack_value)
+        return HumanWizard(self.health, self.attack_value, self.rng)
+
+    def create_by_code(
+        self, class_code: int
+    ) -> Union[HumanSwordsman, HumanArcher, HumanWizard]:
+        """Создаём воина по коду его класса."""
+        return human_classes[class_code](self.health, self.attack_value, self.rng)
 
 
 class AbstractSwordsman(ABC):
     """Базовый интерфейс абстрактного класса "Мечник"."""
 
+    __slots__ = ()
+
+    class_code: int = SWORDSMAN
+
     @abstractmethod
     def get_health_info(self) -> int:
         """Базовый метод, вызов которого, возвращает текущей уровень жизни Мечника."""
@@ -84,6 +154,10 @@ class AbstractSwordsman(ABC):
 class AbstractArcher(ABC):
     """Базовый интерфейс абстрактного класса "Лучник"."""
 
+    __slots__ = ()
+
+    class_code: int = ARCHER
+
     @abstractmethod
     def get_health_info(self) -> int:
         """Базовый метод, вызов которого, возвращает текущей уровень жизни Лучника."""
@@ -98,6 +172,10 @@ class AbstractArcher(ABC):
 class AbstractWizard(ABC):
     """Базовый интерфейс абстрактного класса "Маг"."""
 
+    __slots__ = ()
+
+    class_code: int = WIZARD
+
     @abstractmethod
     def get_health_info(self) -> int:
         """Базовый метод, вызов которого, возвращает текущей уровень жизни Мага."""
@@ -112,6 +190,8 @@ class AbstractWizard(ABC):
 class MonsterSwordsman(AbstractSwordsman):
     """Класс для представления монстра-мечника."""
 
+    __slots__ = ("health", "attack_value")
+
     def __init__(self, hp: int, attack_value: int) -> None:
         """Конструктор параметров монстра-мечника."""
         self.health = hp
@@ -138,6 +218,8 @@ class MonsterSwordsman(AbstractSwordsman):
 class MonsterArcher(AbstractArcher):
     """Класс для представления монстра-лучника."""
 
+    __slots__ = ("health", "attack_value")
+
     def __init__(self, hp: int, attack_value: int) -> None:
         """Конструктор параметров монстра-лучника."""
         self.health = hp
@@ -164,6 +246,8 @@ class MonsterArcher(AbstractArcher):
 class MonsterWizard(AbstractWizard):
     """Класс для представления монстра-мага."""
 
+    __slots__ = ("health", "attack_value")
+
     def __init__(self, hp: int, attack_value: int) -> None:
         """Конструктор параметров монстра-мага."""
         self.health = hp
@@ -187,314 +271,255 @@ class MonsterWizard(AbstractWizard):
         return "Маг"
 
 
-class HumanSwordsman(AbstractSwordsman):
-    """Класс для представления человека-мечника."""
+class MonsterBatch:
+    """Класс для представления пакета чудовищ в виде структуры массивов.
 
-    def __init__(self, hp: int, attack_value: int):
-        """Конструктор параметров человека-мечника."""
-        self._health = hp
-        self._attack_value = attack_value
-        self._weapon: Union[None, str] = None
-        self._bag: List[Any] = []
+    Уровни жизни, силы атаки и коды классов чудовищ хранятся в массивах NumPy,
+    поэтому создание пакета не требует создания объекта на каждое чудовище.
+    Строки пакета доступны в виде объектов с интерфейсом монстров-воинов.
 
-    def get_health_info(self) -> int:
-        """Получаем текущее значение уровня жизни."""
-        return self._health
+    """
 
-    def get_attack_info(self) -> int:
-        """Получаем текущее значение силы атаки."""
-        return self._attack_value
+    __slots__ = ("health", "attack_value", "class_code")
 
-    def get_weapon_info(self) -> Any[str]:
-        """Получаем информацию о наименовании текущего оружия."""
-        return self._weapon
+    def __init__(self, health: Any, attack_value: Any, class_code: Any) -> None:
+        """Конструктор параметров пакета чудовищ."""
+        self.health = numpy.array(health, dtype=numpy.int64)
+        self.attack_value = numpy.array(attack_value, dtype=numpy.int64)
+        self.class_code = numpy.array(class_code, dtype=numpy.int64)
+        if not self.health.shape == self.attack_value.shape == self.class_code.shape:
+            raise ValueError("Размеры массивов параметров чудовищ не совпадают.")
 
-    def add_item_to_bag(self, item: Any, initial_weapon: bool = False) -> None:
-        """Добавляем предметы в инвентарь. Обновляем информацию о предметах в инвентаре."""
-        if initial_weapon:
-            self._weapon = item.__str__()
-            self._attack_value = item.get_damage_info()
+    def __len__(self) -> int:
+        """Получаем количество чудовищ в пакете."""
+        return len(self.health)
 
-        item_index = next(
-            (i for i, x in enumerate(self._bag) if x.__str__() == item.__str__()), None
-        )
-        if item_index is None:
-            self._bag.append(item)
-        elif item_index is not None and item.__str__() == self._weapon:
-            self._bag[item_index] = item
-            self._attack_value = item.get_damage_info()
-        else:
-            self._bag[item_index] = item
+    def __getitem__(
+        self, index: int
+    ) -> Union[MonsterSwordsmanRow, MonsterArcherRow, MonsterWizardRow]:
+        """Получаем строку пакета в виде объекта с интерфейсом монстра-воина."""
+        return monster_row_classes[int(self.class_code[index])](self, index)
 
-    def remove_item_from_bag(self, item: Union[Any]) -> None:
-        """Удаляем предметы из инвентаря."""
-        item_index = next(
-            i for i, x in enumerate(self._bag) if isinstance(x, type(item))
-        )
-        del self._bag[item_index]
+    def __iter__(
+        self,
+    ) -> Iterator[Union[MonsterSwordsmanRow, MonsterArcherRow, MonsterWizardRow]]:
+        """Перебираем строки пакета."""
+        return (self[index] for index in range(len(self)))
 
-    def show_bag(self) -> List[str]:
-        """Представляем предметы инвентаря списком их наименований."""
-        return [f"{item.__str__()}: {item.get_damage_info()}" for item in self._bag]
+    def take_damage(self, index: int, damage: int) -> int:
+        """Наносим урон чудовищу. Получаем новое значение его уровня жизни."""
+        self.health[index] -= damage
+        return int(self.health[index])
 
-    def check_item_in_bag(self, item: Any) -> bool:
-        """Проверяем наличие предмета в инвентаре."""
-        item_index = next(
-            (i for i, x in enumerate(self._bag) if x.__str__() == item.__str__()), None
-        )
-        if item_index is None:
-            return False
-        else:
-            return True
+    def create_monster(
+        self, index: int
+    ) -> Union[MonsterSwordsman, MonsterArcher, MonsterWizard]:
+        """Создаём отдельный объект монстра-воина по строке пакета."""
+        return MonsterFactory(
+            int(self.health[index]), int(self.attack_value[index])
+        ).create_by_code(int(self.class_code[index]))
 
-    @staticmethod
-    def __check_completeness(npc_bag: list) -> list:
-        """Проверяем инвентарь воина на наличие боеприпасов и оружия их использующего.
 
-        При успешной проверки возвращаем список доступного для использования оружия.
-        В список не включаются не боевые предметы.
+class MonsterSwordsmanRow(AbstractSwordsman):
+    """Класс для представления монстра-мечника, хранящегося в строке пакета чудовищ."""
 
-        """
-        if not any(item.__str__() == "ЛУК" for item in npc_bag) or not any(
-            item.__str__() == "СТРЕЛЫ" for item in npc_bag
-        ):
-            return [
-                item
-                for item in npc_bag
-                if item.__str__() != "ЛУК"
-                and item.__str__() != "СТРЕЛЫ"
-                and item.__str__() != "ТОТЕМ"
-            ]
-        else:
-            return [
-                item
-                for item in npc_bag
-                if item.__str__() != "СТРЕЛЫ" and item.__str__() != "ТОТЕМ"
-            ]
+    __slots__ = ("_batch", "_index")
 
-    def select_weapon(self) -> None:
-        """Из имеющегося в инвентаре оружия выбираем доступное для атаки."""
-        while True:
-            try:
-                npc_bag_for_select = self.__check_completeness(self._bag)
-                readable_bag = [
-                    f"{n + 1} - {item.__str__()}: {item.get_damage_info()}"
-                    for n, item in enumerate(npc_bag_for_select)
-                ]
-                request = "Выберете оружие: "
-                for _ in range(len(readable_bag)):
-                    request = request + "{}. "
-                decision = int(input(request.format(*readable_bag)))
-                if decision > 3 or decision < 1:
-                    raise ValueError()
-                self._attack_value = npc_bag_for_select[decision - 1].get_damage_info()
-                self._weapon = npc_bag_for_select[decision - 1].__str__()
-            except ValueError:
-                print("Неккоректный ввод! Повторите!")
-            else:
-                break
-        return
+    def __init__(self, batch: MonsterBatch, index: int) -> None:
+        """Конструктор параметров строки пакета."""
+        self._batch = batch
+        self._index = index
 
-    def increase_health(self, hp: int) -> None:
-        """Увеличиваем уровень здоровья на заданное значение."""
-        self._health = self._health + hp
+    def get_health_info(self) -> int:
+        """Получаем текущее значение уровня жизни монстра-мечника."""
+        return int(self._batch.health[self._index])
 
-    def get_attack(
-        self, monster: Union[MonsterSwordsman, MonsterArcher, MonsterWizard]
-    ) -> None:
-        """Атакуем противника.
+    def get_attack_info(self) -> int:
+        """Получаем текущее значение силы атаки монстра-мечника."""
+        return int(self._batch.attack_value[self._index])
 
-        Можем увернуться от его встречной атаки, если противник Мечник.
-        Получаем новое значение уровня жизни после атаки.
+    def get_attack(self, human: Union[HumanSwordsman, HumanArcher, HumanWizard]) -> int:
+        """Атакуем противника. Получаем новое значение уровня жизни монстра-мечника после атаки."""
+        return self._batch.take_damage(self._index, human.get_attack_info())
 
-        """
-        if type(self).__mro__[1] == type(monster).__mro__[1]:
-            dodge_or_not = choice((monster.get_attack_info(), 0), p=[0.5, 0.5])
-            self._health = self._health - dodge_or_not
-            if dodge_or_not == 0:
-                print(
-                    "Вы мастерски увернулись от атаки, нанеся чудовищу серъёзный урон!"
-                )
-        else:
-            self._health = self._health - monster.get_attack_info()
-        return
+    def __str__(self) -> str:
+        """Получаем наименование класса, к которому относится воин."""
+        return "Мечник"
 
-    def save(self) -> ConcreteMemento:
-        """Сохраняем состояние (текущие параметры) человека-мечника в объект-снимок."""
-        return ConcreteMemento(
-            self._health, self._attack_value, self._weapon, tuple(self._bag)
-        )
 
-    def restore(self, memento: ConcreteMemento) -> None:
-        """Восстанавливает состояние человека-мечника из объекта снимка."""
-        self._health = memento.get_state()[0]
-        self._attack_value = memento.get_state()[1]
-        self._weapon = memento.get_state()[2]
-        self._bag = list(memento.get_state()[3])
+class MonsterArcherRow(AbstractArcher):
+    """Класс для представления монстра-лучника, хранящегося в строке пакета чудовищ."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: MonsterBatch, index: int) -> None:
+        """Конструктор параметров строки пакета."""
+        self._batch = batch
+        self._index = index
+
+    def get_health_info(self) -> int:
+        """Получаем текущее значение уровня жизни монстра-лучника."""
+        return int(self._batch.health[self._index])
+
+    def get_attack_info(self) -> int:
+        """Получаем текущее значение силы атаки монстра-лучника."""
+        return int(self._batch.attack_value[self._index])
+
+    def get_attack(self, human: Union[HumanSwordsman, HumanArcher, HumanWizard]) -> int:
+        """Атакуем противника. Получаем новое значение уровня жизни монстра-лучника после атаки."""
+        return self._batch.take_damage(self._index, human.get_attack_info())
 
     def __str__(self) -> str:
         """Получаем наименование класса, к которому относится воин."""
-        return "Мечник"
+        return "Лучник"
 
 
-class HumanArcher(AbstractArcher):
-    """Класс для представления человека-лучника."""
+class MonsterWizardRow(AbstractWizard):
+    """Класс для представления монстра-мага, хранящегося в строке пакета чудовищ."""
 
-    def __init__(self, hp: int, attack_value: int):
-        """Конструктор параметров человека-лучника."""
-        self._health = hp
-        self._attack_value = attack_value
-        self._weapon: Union[None, str] = None
-        self._bag: List[Any] = []
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: MonsterBatch, index: int) -> None:
+        """Конструктор параметров строки пакета."""
+        self._batch = batch
+        self._index = index
 
     def get_health_info(self) -> int:
-        """Получаем текущее значение уровня жизни."""
-        return self._health
+        """Получаем текущее значение уровня жизни монстра-мага."""
+        return int(self._batch.health[self._index])
 
     def get_attack_info(self) -> int:
-        """Получаем текущее значение силы атаки."""
-        return self._attack_value
+        """Получаем текущее значение силы атаки монстра-мага."""
+        return int(self._batch.attack_value[self._index])
 
-    def get_weapon_info(self) -> Any[str]:
-        """Получаем информацию о наименовании текущего оружия."""
-        return self._weapon
+    def get_attack(self, human: Union[HumanSwordsman, HumanArcher, HumanWizard]) -> int:
+        """Атакуем противника. Получаем новое значение уровня жизни монстра-мага после атаки."""
+        return self._batch.take_damage(self._index, human.get_attack_info())
 
-    def add_item_to_bag(self, item: Any, initial_weapon: bool = False) -> None:
-        """Добавляем предметы в инвентарь. Обновляем информацию о предметах в инвентаре."""
-        if initial_weapon:
-            self._weapon = item.__str__()
-            self._attack_value = item.get_damage_info()
-        item_index = next(
-            (i for i, x in enumerate(self._bag) if x.__str__() == item.__str__()), None
-        )
-        if item_index is None:
-            self._bag.append(item)
-        elif item_index is not None and item.__str__() == self._weapon:
-            self._bag[item_index] = item
-            self._attack_value = item.get_damage_info()
-        else:
-            self._bag[item_index] = item
+    def __str__(self) -> str:
+        """Получаем наименование класса, к которому относится воин."""
+        return "Маг"
 
-    def remove_item_from_bag(self, item: Any) -> None:
-        """Удаляем предметы из инвентаря."""
-        item_index = next(
-            i for i, x in enumerate(self._bag) if isinstance(x, type(item))
-        )
-        del self._bag[item_index]
 
-    def show_bag(self) -> List[str]:
-        """Представляем предметы инвентаря списком их наименований."""
-        return [f"{item.__str__()}: {item.get_damage_info()}" for item in self._bag]
+monster_row_classes: Dict[
+    int,
+    Union[Type[MonsterSwordsmanRow], Type[MonsterArcherRow], Type[MonsterWizardRow]],
+] = {
+    SWORDSMAN: MonsterSwordsmanRow,
+    ARCHER: MonsterArcherRow,
+    WIZARD: MonsterWizardRow,
+}
 
-    def check_item_in_bag(self, item: Any) -> bool:
-        """Проверяем наличие предмета в инвентаре."""
-        item_index = next(
-            (i for i, x in enumerate(self._bag) if x.__str__() == item.__str__()), None
-        )
-        if item_index is None:
-            return False
-        else:
-            return True
 
-    @staticmethod
-    def __check_completeness(npc_bag: list) -> list:
-        """Проверяем инвентарь воина на наличие боеприпасов и оружия их использующего.
+class Inventory:
+    """Класс для представления инвентаря игрового персонажа.
 
-        При успешной проверки возвращаем список доступного для использования оружия.
-        В список не включаются не боевые предметы.
+    Предметы хранятся по их наименованию, поэтому поиск предмета выполняется за O(1).
+    Инвентарь неизменяем: добавление и удаление предмета возвращают новый инвентарь,
+    разделяющий с прежним сами предметы, поэтому снимок состояния игрового персонажа
+    хранит лишь ссылку на инвентарь, а восстановление сводится к замене ссылки.
+    Список доступного для атаки оружия вычисляется один раз для каждого инвентаря:
+    лук доступен только при наличии стрел, стрелы и тотем оружием не считаются.
 
-        """
-        if not any(item.__str__() == "ЛУК" for item in npc_bag) or not any(
-            item.__str__() == "СТРЕЛЫ" for item in npc_bag
-        ):
-            return [
-                item
-                for item in npc_bag
-                if item.__str__() != "ЛУК"
-                and item.__str__() != "СТРЕЛЫ"
-                and item.__str__() != "ТОТЕМ"
-            ]
-        else:
-            return [
+    """
+
+    __slots__ = ("_items", "_weapons")
+
+    not_weapons: Tuple[str, ...] = ("СТРЕЛЫ", "ТОТЕМ")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """Конструктор параметров инвентаря."""
+        self._items: Dict[str, Any] = {item.__str__(): item for item in items}
+        self._weapons: Optional[Tuple[Any, ...]] = None
+
+    @classmethod
+    def _from_dict(cls, items: Dict[str, Any]) -> Inventory:
+        """Создаём инвентарь из готового словаря предметов без его копирования."""
+        inventory = cls.__new__(cls)
+        inventory._items = items
+        inventory._weapons = None
+        return inventory
+
+    def with_item(self, item: Any) -> Inventory:
+        """Получаем инвентарь с добавленным предметом, заменяющим предмет того же наименования."""
+        items = dict(self._items)
+        items[item.__str__()] = item
+        return self._from_dict(items)
+
+    def without_item(self, kind: str) -> Inventory:
+        """Получаем инвентарь без предмета с заданным наименованием."""
+        items = dict(self._items)
+        del items[kind]
+        return self._from_dict(items)
+
+    def get(self, kind: str) -> Any:
+        """Получаем предмет по его наименованию."""
+        return self._items.get(kind)
+
+    def weapons(self) -> Tuple[Any, ...]:
+        """Получаем доступное для атаки оружие."""
+        if self._weapons is None:
+            bow_ready = "ЛУК" in self._items and "СТРЕЛЫ" in self._items
+            self._weapons = tuple(
                 item
-                for item in npc_bag
-                if item.__str__() != "СТРЕЛЫ" and item.__str__() != "ТОТЕМ"
-            ]
+                for kind, item in self._items.items()
+                if kind not in self.not_weapons and (bow_ready or kind != "ЛУК")
+            )
+        return self._weapons
 
-    def select_weapon(self) -> None:
-        """Из имеющегося в инвентаре оружия выбираем доступное для атаки."""
-        while True:
-            try:
-                npc_bag_for_select = self.__check_completeness(self._bag)
-                readable_bag = [
-                    f"{n + 1} - {item.__str__()}: {item.get_damage_info()}"
-                    for n, item in enumerate(npc_bag_for_select)
-                ]
-                request = "Выберете оружие: "
-                for _ in range(len(readable_bag)):
-                    request = request + "{}. "
-                decision = int(input(request.format(*readable_bag)))
-                if decision > 3 or decision < 1:
-                    raise ValueError()
-                self._attack_value = npc_bag_for_select[decision - 1].get_damage_info()
-                self._weapon = npc_bag_for_select[decision - 1].__str__()
-            except ValueError:
-                print("Неккоректный ввод! Повторите!")
-            else:
-                break
-        return
+    def __contains__(self, kind: object) -> bool:
+        """Проверяем наличие предмета по его наименованию."""
+        return kind in self._items
 
-    def increase_health(self, hp: int) -> None:
-        """Увеличиваем уровень здоровья на заданное значение."""
-        self._health = self._health + hp
+    def __iter__(self) -> Iterator[Any]:
+        """Перебираем предметы в порядке их добавления."""
+        return iter(self._items.values())
 
-    def get_attack(
-        self, monster: Union[MonsterSwordsman, MonsterArcher, MonsterWizard]
-    ) -> None:
-        """Атакуем противника.
+    def __len__(self) -> int:
+        """Получаем количество предметов в инвентаре."""
+        return len(self._items)
 
-        Можем увернуться от его встречной атаки, если противник Лучник.
-        Получаем новое значение уровня жизни после атаки.
 
-        """
-        if type(self).__mro__[1] == type(monster).__mro__[1]:
-            dodge_or_not = choice((monster.get_attack_info(), 0), p=[0.5, 0.5])
-            self._health = self._health - dodge_or_not
-            if dodge_or_not == 0:
-                print(
-                    "Вы мастерски увернулись от атаки, нанеся чудовищу серъёзный урон!"
-                )
-        else:
-            self._health = self._health - monster.get_attack_info()
-        return
+empty_inventory = Inventory()
 
-    def save(self) -> ConcreteMemento:
-        """Сохраняем состояние (текущие параметры) человека-лучника в объект-снимок."""
-        return ConcreteMemento(
-            self._health, self._attack_value, self._weapon, tuple(self._bag)
-        )
 
-    def restore(self, memento: ConcreteMemento) -> None:
-        """Восстанавливает состояние (текущие параметры) человека-лучника из объекта-снимка."""
-        self._health = memento.get_state()[0]
-        self._attack_value = memento.get_state()[1]
-        self._weapon = memento.get_state()[2]
-        self._bag = list(memento.get_state()[3])
+class ClassProfile(NamedTuple):
+    """Описание класса людей-воинов: код класса, наименование и оружие, к которому воин склонен."""
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится воин."""
-        return "Лучник"
+    code: int
+    name: str
+    weapon_kind: str
 
 
-class HumanWizard(AbstractWizard):
-    """Класс для представления человека-мага."""
+class_profiles: Dict[int, ClassProfile] = {
+    SWORDSMAN: ClassProfile(SWORDSMAN, "Мечник", ic.Sword.kind),
+    ARCHER: ClassProfile(ARCHER, "Лучник", ic.Bow.kind),
+    WIZARD: ClassProfile(WIZARD, "Маг", ic.SpellBook.kind),
+}
+
+
+class Human:
+    """Класс для представления человека-воина, общий для всех классов воинов.
+
+    Особенности класса воина задаются его описанием из таблицы class_profiles:
+    код класса сравнивается при проверке возможности увернуться от атаки,
+    а оружие, к которому воин склонен, определяет шанс найти уникальное оружие.
+
+    """
+
+    __slots__ = ("_health", "_attack_value", "_weapon", "_bag", "_random")
+
+    profile: ClassProfile
+    class_code: int
+    weapon_affinity: str
 
-    def __init__(self, hp: int, attack_value: int):
-        """Конструктор параметров человека-мага."""
+    def __init__(self, hp: int, attack_value: int, rng: Optional[rs.GameRandom] = None):
+        """Конструктор параметров человека-воина."""
         self._health = hp
         self._attack_value = attack_value
         self._weapon: Union[None, str] = None
-        self._bag: List[Any] = []
+        self._bag = empty_inventory
+        self._random = rng if rng is not None else rs.shared_random
 
     def get_health_info(self) -> int:
         """Получаем текущее значение уровня жизни."""
@@ -513,69 +538,41 @@ class HumanWizard(AbstractWizard):
         if initial_weapon:
             self._weapon = item.__str__()
             self._attack_value = item.get_damage_info()
-
-        item_index = next(
-            (i for i, x in enumerate(self._bag) if x.__str__() == item.__str__()), None
-        )
-        if item_index is None:
-            self._bag.append(item)
-        elif item_index is not None and item.__str__() == self._weapon:
-            self._bag[item_index] = item
+        elif item.__str__() in self._bag and item.__str__() == self._weapon:
             self._attack_value = item.get_damage_info()
-        else:
-            self._bag[item_index] = item
+        self._bag = self._bag.with_item(item)
 
     def remove_item_from_bag(self, item: Any) -> None:
         """Удаляем предметы из инвентаря."""
-        item_index = next(
-            i for i, x in enumerate(self._bag) if isinstance(x, type(item))
-        )
-        del self._bag[item_index]
+        self._bag = self._bag.without_item(item.__str__())
 
-    def show_bag(self) -> list:
+    def show_bag(self) -> List[str]:
         """Представляем предметы инвентаря списком их наименований."""
         return [f"{item.__str__()}: {item.get_damage_info()}" for item in self._bag]
 
     def check_item_in_bag(self, item: Any) -> bool:
         """Проверяем наличие предмета в инвентаре."""
-        item_index = next(
-            (i for i, x in enumerate(self._bag) if x.__str__() == item.__str__()), None
-        )
-        if item_index is None:
-            return False
-        else:
-            return True
+        return item.__str__() in self._bag
 
-    @staticmethod
-    def __check_completeness(npc_bag: list) -> list:
-        """Проверяем инвентарь воина на наличие боеприпасов и оружия их использующего.
+    def get_item_info(self, kind: str) -> Any:
+        """Получаем предмет инвентаря по его наименованию."""
+        return self._bag.get(kind)
 
-        При успешной проверки возвращаем список доступного для использования оружия.
-        В список не включаются не боевые предметы.
+    def get_weapons(self) -> Tuple[Any, ...]:
+        """Получаем оружие из инвентаря, доступное для атаки."""
+        return self._bag.weapons()
 
-        """
-        if not any(item.__str__() == "ЛУК" for item in npc_bag) or not any(
-            item.__str__() == "СТРЕЛЫ" for item in npc_bag
-        ):
-            return [
-                item
-                for item in npc_bag
-                if item.__str__() != "ЛУК"
-                and item.__str__() != "СТРЕЛЫ"
-                and item.__str__() != "ТОТЕМ"
-            ]
-        else:
-            return [
-                item
-                for item in npc_bag
-                if item.__str__() != "СТРЕЛЫ" and item.__str__() != "ТОТЕМ"
-            ]
+    def equip_weapon(self, decision: int) -> None:
+        """Берём для атаки оружие с заданным номером из доступного."""
+        weapon = self._bag.weapons()[decision - 1]
+        self._attack_value = weapon.get_damage_info()
+        self._weapon = weapon.__str__()
 
     def select_weapon(self) -> None:
         """Из имеющегося в инвентаре оружия выбираем доступное для атаки."""
         while True:
             try:
-                npc_bag_for_select = self.__check_completeness(self._bag)
+                npc_bag_for_select = self._bag.weapons()
                 readable_bag = [
                     f"{n + 1} - {item.__str__()}: {item.get_damage_info()}"
                     for n, item in enumerate(npc_bag_for_select)
@@ -584,10 +581,9 @@ class HumanWizard(AbstractWizard):
                 for _ in range(len(readable_bag)):
                     request = request + "{}. "
                 decision = int(input(request.format(*readable_bag)))
-                if decision > 3 or decision < 1:
+                if decision > len(npc_bag_for_select) or decision < 1:
                     raise ValueError()
-                self._attack_value = npc_bag_for_select[decision - 1].get_damage_info()
-                self._weapon = npc_bag_for_select[decision - 1].__str__()
+                self.equip_weapon(decision)
             except ValueError:
                 print("Неккоректный ввод! Повторите!")
             else:
@@ -600,45 +596,77 @@ class HumanWizard(AbstractWizard):
 
     def get_attack(
         self, monster: Union[MonsterSwordsman, MonsterArcher, MonsterWizard]
-    ) -> None:
+    ) -> bool:
         """Атакуем противника.
 
-        Можем увернуться от его встречной атаки, если противник - мечник.
-        Получаем новое значение уровня жизни после атаки.
+        Можем увернуться от его встречной атаки, если противник того же класса.
+        Получаем новое значение уровня жизни после атаки и признак того, что удалось увернуться.
 
         """
-        if type(self).__mro__[1] == type(monster).__mro__[1]:
-            dodge_or_not = choice((monster.get_attack_info(), 0), p=[0.5, 0.5])
-            self._health = self._health - dodge_or_not
-            if dodge_or_not == 0:
-                print(
-                    "Вы мастерски увернулись от атаки, нанеся чудовищу серъёзный урон!"
-                )
-        else:
-            self._health = self._health - monster.get_attack_info()
-        return
+        if self.class_code == monster.class_code and self._random.chance(0.5):
+            return True
+        self._health = self._health - monster.get_attack_info()
+        return False
 
     def save(self) -> ConcreteMemento:
-        """Сохраняем состояние (текущие параметры) человека-мага в объект-снимок."""
+        """Сохраняем состояние (текущие параметры) человека-воина в объект-снимок."""
         return ConcreteMemento(
-            self._health, self._attack_value, self._weapon, tuple(self._bag)
+            self._health, self._attack_value, self._weapon, self._bag
         )
 
     def restore(self, memento: ConcreteMemento) -> None:
-        """Восстанавливает состояние (текущие параметры) человека-мага из объекта-снимка."""
+        """Восстанавливает состояние (текущие параметры) человека-воина из объекта-снимка."""
         self._health = memento.get_state()[0]
         self._attack_value = memento.get_state()[1]
         self._weapon = memento.get_state()[2]
-        self._bag = list(memento.get_state()[3])
+        self._bag = memento.get_state()[3]
 
     def __str__(self) -> str:
         """Получаем наименование класса, к которому относится воин."""
-        return "Маг"
+        return self.profile.name
+
+
+class HumanSwordsman(Human, AbstractSwordsman):
+    """Класс для представления человека-мечника."""
+
+    __slots__ = ()
+
+    profile = class_profiles[SWORDSMAN]
+    weapon_affinity = profile.weapon_kind
+
+
+class HumanArcher(Human, AbstractArcher):
+    """Класс для представления человека-лучника."""
+
+    __slots__ = ()
+
+    profile = class_profiles[ARCHER]
+    weapon_affinity = profile.weapon_kind
+
+
+class HumanWizard(Human, AbstractWizard):
+    """Класс для представления человека-мага."""
+
+    __slots__ = ()
+
+    profile = class_profiles[WIZARD]
+    weapon_affinity = profile.weapon_kind
+
+
+human_classes: Dict[
+    int, Union[Type[HumanSwordsman], Type[HumanArcher], Type[HumanWizard]]
+] = {
+    SWORDSMAN: HumanSwordsman,
+    ARCHER: HumanArcher,
+    WIZARD: HumanWizard,
+}
 
 
 class Memento(ABC):
     """Базовый класс объкта-снимка для хранения состояния (параметров) игрового персонажа."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self) -> str:
         """Базовый метод для реализации отображения сохранённого состояния (параметров) игрового персонажа."""
@@ -648,8 +676,10 @@ class Memento(ABC):
 class ConcreteMemento(Memento):
     """Класс объкта-снимка для хранения состояния (параметров) игрового персонажа."""
 
+    __slots__ = ("_health", "_attack_value", "_weapon", "_bag")
+
     def __init__(
-        self, health: int, attack_value: int, weapon: Any[str], bag: tuple
+        self, health: int, attack_value: int, weapon: Any[str], bag: Inventory
     ) -> None:
         """Конструктор объкта-снимка."""
         self._health = health
@@ -657,46 +687,88 @@ class ConcreteMemento(Memento):
         self._weapon = weapon
         self._bag = bag
 
-    def get_state(self) -> Tuple[int, int, Any[str], Tuple[Any, ...]]:
+    def get_state(self) -> Tuple[int, int, Any[str], Inventory]:
         """Создатель использует этот метод, когда восстанавливает своё состояние."""
         return self._health, self._attack_value, self._weapon, self._bag
 
     def get_name(self) -> str:
         """Остальные методы используются Опекуном для отображения метаданных."""
-        return f"({self._health}, {self._attack_value}, {self._weapon}, {self._bag})"
+        return f"({self._health}, {self._attack_value}, {self._weapon}, {tuple(self._bag)})"
 
 
 class Storage:
     """Класс для представления хранилища объёктов-снимков.
 
     Управлят процессами сохранения и восстановления состояния игрового персонажа.
+    Хранилище работает как кольцевой буфер заданной ёмкости: при его заполнении
+    новый снимок вытесняет самый старый, поэтому объём занимаемой памяти не растёт со временем игры.
 
     """
 
     def __init__(
-        self, originator: Union[HumanSwordsman, HumanArcher, HumanWizard]
+        self,
+        originator: Union[HumanSwordsman, HumanArcher, HumanWizard],
+        capacity: int = default_storage_capacity,
     ) -> None:
         """Конструктор парметров объекта-хранилища."""
-        self._mementos: List[Any] = []
+        if capacity < 1:
+            raise ValueError(f"Некорректная ёмкость хранилища: {capacity}")
+        self._mementos: deque[Any] = deque(maxlen=capacity)
         self._originator = originator
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        """Получаем количество хранимых снимков."""
+        return len(self._mementos)
 
     def backup(self) -> None:
         """Сохраняем в объект-снимок текущее состояние (параметры) игрового персонажа."""
-        print("Игра сохранена!")
+        if len(self._mementos) == self._mementos.maxlen:
+            self.evicted += 1
         self._mementos.append(self._originator.save())
 
     def undo(self) -> None:
-        """Восстанавливаем из объекта-снимка состояние (параметры) игрового персонажа."""
-        if not len(self._mementos):
+        """Восстанавливаем из объекта-снимка состояние (параметры) игрового персонажа.
+
+        Снимки, из которых не удалось восстановить состояние, отбрасываются,
+        и восстановление продолжается из предыдущих.
+
+        """
+        while self._mementos:
+            memento = self._mementos.pop()
+            try:
+                self._originator.restore(memento)
+            except Exception:
+                continue
             return
 
-        memento = self._mementos.pop()
-        try:
-            self._originator.restore(memento)
-        except Exception:
-            self.undo()
+    def snapshots(self) -> Tuple[Any, ...]:
+        """Получаем хранимые объекты-снимки, начиная с самого старого."""
+        return tuple(self._mementos)
+
+    def restore_snapshots(self, mementos: Iterable[Any], evicted: int = 0) -> None:
+        """Заменяем содержимое хранилища заданными объектами-снимками."""
+        self._mementos.clear()
+        self._mementos.extend(mementos)
+        self.evicted = evicted
+
+    def history(
+        self, page_size: int = default_history_page_size
+    ) -> Iterator[List[str]]:
+        """Получаем историю сохранений постранично, начиная с самого старого снимка.
+
+        Описание снимков формируется только для запрошенных страниц.
+
+        """
+        mementos = iter(self._mementos)
+        while True:
+            page = [memento.get_name() for memento in islice(mementos, page_size)]
+            if not page:
+                return
+            yield page
 
     def show_history(self) -> None:
         """Показываем историю сохранений."""
-        for memento in self._mementos:
-            print(memento.get_name())
+        for page in self.history():
+            for name in page:
+                print(name)
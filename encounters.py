@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Iterable, NamedTuple, Optional, Tuple, Union
+
+import creatures_creator as cc
+import rng_service as rs
+
+default_batch_size: int = 16
+
+
+class EncounterSpec(NamedTuple):
+    """Описание чудовища, которое встретит игровой персонаж: класс, уровень жизни и сила атаки."""
+
+    class_code: int
+    health: int
+    attack_value: int
+
+    def class_name(self) -> str:
+        """Получаем наименование класса чудовища."""
+        return cc.class_names[self.class_code]
+
+    def create_monster(
+        self,
+    ) -> Union[cc.MonsterSwordsman, cc.MonsterArcher, cc.MonsterWizard]:
+        """Создаём объект чудовища по его описанию."""
+        return cc.MonsterFactory(self.health, self.attack_value).create_by_code(
+            self.class_code
+        )
+
+
+class EncounterStream:
+    """Класс бесконечного потока описаний чудовищ.
+
+    Описания выбираются пакетами через MonsterFactory.create_random_batch
+    и выдаются по одному, по мере того как игровой персонаж встречает чудовищ.
+    Ещё не выданные описания текущего пакета доступны в pending, что позволяет
+    сохранить и восстановить состояние потока.
+
+    """
+
+    def __init__(
+        self,
+        health_range: Tuple[int, int],
+        attack_range: Tuple[int, int],
+        rng: Optional[rs.GameRandom] = None,
+        batch_size: int = default_batch_size,
+        pending: Iterable[EncounterSpec] = (),
+    ) -> None:
+        """Конструктор параметров потока."""
+        self.health_range = health_range
+        self.attack_range = attack_range
+        self.rng = rng
+        self.batch_size = batch_size
+        self.pending: Deque[EncounterSpec] = deque(pending)
+
+    def __iter__(self) -> EncounterStream:
+        """Поток является собственным итератором."""
+        return self
+
+    def __next__(self) -> EncounterSpec:
+        """Получаем описание следующего чудовища, при необходимости выбирая новый пакет."""
+        if not self.pending:
+            batch = cc.MonsterFactory.create_random_batch(
+                self.batch_size, self.health_range, self.attack_range, self.rng
+            )
+            self.pending.extend(
+                EncounterSpec(class_code, health, attack_value)
+                for class_code, health, attack_value in zip(
+                    batch.class_code.tolist(),
+                    batch.health.tolist(),
+                    batch.attack_value.tolist(),
+                )
+            )
+        return self.pending.popleft()
+
+
+def encounter_stream(
+    health_range: Tuple[int, int],
+    attack_range: Tuple[int, int],
+    rng: Optional[rs.GameRandom] = None,
+    batch_size: int = default_batch_size,
+) -> EncounterStream:
+    """Создаём бесконечный поток описаний чудовищ."""
+    return EncounterStream(health_range, attack_range, rng, batch_size)
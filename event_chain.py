@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import argparse
+from typing import Dict, Sequence
+
+import numpy
+
+import main as rpg
+import rng_service as rs
+import simulator as sim
+
+
+class EventChain:
+    """Класс цепи Маркова, описывающей смену объектов-событий игры.
+
+    Строка матрицы переходов - распределение события следующего хода после заданного события,
+    начальное распределение - распределение события первого хода.
+    Показатели цепи рассчитываются методами линейной алгебры без проведения партий.
+
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        matrix: numpy.ndarray,
+        initial: numpy.ndarray,
+        battle: int,
+    ) -> None:
+        """Конструктор параметров цепи. Задаём номер события «Бой» среди состояний цепи."""
+        self.names = tuple(names)
+        self.matrix = numpy.asarray(matrix, dtype=float)
+        self.initial = numpy.asarray(initial, dtype=float)
+        self.battle = battle
+        if self.matrix.shape != (len(self.names), len(self.names)):
+            raise ValueError(
+                "Размер матрицы переходов не совпадает с количеством событий."
+            )
+        if not numpy.allclose(self.matrix.sum(axis=1), 1.0):
+            raise ValueError("Строки матрицы переходов должны быть распределениями.")
+
+    @classmethod
+    def from_game(cls, game: rpg.Game) -> EventChain:
+        """Строим цепь по объектам-событиям игры и весам, с которыми они выбирают следующее событие.
+
+        События, выбирающие следующее событие равновероятно, отмечены признаком uniform_next.
+
+        """
+        rows = []
+        for event in game.event_list:
+            sampler = (
+                game.uniform_event_sampler if event.uniform_next else game.event_sampler
+            )
+            rows.append(normalized(sampler.weights))
+        battle = next(
+            n
+            for n, event in enumerate(game.event_list)
+            if isinstance(event, rpg.EventBattle)
+        )
+        return cls(
+            [type(event).__name__ for event in game.event_list],
+            numpy.array(rows),
+            normalized(game.event_sampler.weights),
+            battle,
+        )
+
+    def stationary(self) -> numpy.ndarray:
+        """Рассчитываем стационарное распределение цепи: долю ходов каждого события в длинной партии."""
+        size = len(self.names)
+        system = numpy.vstack((self.matrix.T - numpy.eye(size), numpy.ones(size)))
+        right = numpy.zeros(size + 1)
+        right[-1] = 1.0
+        return numpy.linalg.lstsq(system, right, rcond=None)[0]
+
+    def transient_matrix(self, battles: int, battle_win: float) -> numpy.ndarray:
+        """Строим матрицу переходов между состояниями «событие, количество побед» до нужного числа побед.
+
+        Ход события «Бой» увеличивает количество побед с заданной вероятностью.
+        Переходы в состояние с нужным числом побед завершают партию и в матрицу не входят.
+
+        """
+        size = len(self.names)
+        won = numpy.zeros(size)
+        won[self.battle] = battle_win
+        stay = self.matrix * (1.0 - won)[:, None]
+        advance = self.matrix * won[:, None]
+        transient = numpy.zeros((size * battles, size * battles))
+        for count in range(battles):
+            block = slice(count * size, (count + 1) * size)
+            transient[block, block] = stay
+            if count + 1 < battles:
+                following = slice((count + 1) * size, (count + 2) * size)
+                transient[block, following] = advance
+        return transient
+
+    def expected_visits(
+        self, battles: int = rpg.victory_monster_count, battle_win: float = 1.0
+    ) -> numpy.ndarray:
+        """Рассчитываем ожидаемое количество ходов каждого события до нужного числа побед.
+
+        Гибель игрового персонажа не учитывается: цепь описывает лишь смену событий.
+
+        """
+        if battles <= 0:
+            return numpy.zeros(len(self.names))
+        if not 0.0 < battle_win <= 1.0:
+            raise ValueError(f"Некорректная вероятность победы в бою: {battle_win}")
+        transient = self.transient_matrix(battles, battle_win)
+        start = numpy.zeros(len(transient))
+        start[: len(self.names)] = self.initial
+        visits = numpy.linalg.solve(numpy.eye(len(transient)) - transient.T, start)
+        return visits.reshape(battles, len(self.names)).sum(axis=0)
+
+    def expected_turns(
+        self, battles: int = rpg.victory_monster_count, battle_win: float = 1.0
+    ) -> float:
+        """Рассчитываем ожидаемое количество ходов до нужного числа побед."""
+        return float(self.expected_visits(battles, battle_win).sum())
+
+    def visit_counts(
+        self, battles: int = rpg.victory_monster_count, battle_win: float = 1.0
+    ) -> Dict[str, float]:
+        """Получаем ожидаемое количество ходов каждого события по их наименованиям."""
+        return dict(zip(self.names, self.expected_visits(battles, battle_win).tolist()))
+
+    def report(
+        self, battles: int = rpg.victory_monster_count, battle_win: float = 1.0
+    ) -> str:
+        """Формируем текстовый отчёт о цепи."""
+        lines = [
+            f"Ожидаемое количество ходов до {battles} побед: "
+            f"{self.expected_turns(battles, battle_win):.2f}",
+            f"{'Событие':<16}{'ходов':>10}{'доля':>10}",
+        ]
+        for name, visits, share in zip(
+            self.names,
+            self.expected_visits(battles, battle_win).tolist(),
+            self.stationary().tolist(),
+        ):
+            lines.append(f"{name:<16}{visits:>10.2f}{share:>10.3f}")
+        return "\n".join(lines)
+
+
+def normalized(weights: Sequence[float]) -> numpy.ndarray:
+    """Приводим веса к распределению вероятностей."""
+    array = numpy.asarray(weights, dtype=float)
+    return array / array.sum()
+
+
+def game_chain() -> EventChain:
+    """Строим цепь для игрового сценария, создавая партию бота без обращения к терминалу."""
+    return EventChain.from_game(sim.new_game(sim.AttackPolicy(), rs.GameRandom(0)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Анализ цепи смены событий игры.")
+    parser.add_argument("--battles", type=int, default=rpg.victory_monster_count)
+    parser.add_argument("--battle-win", type=float, default=1.0)
+    arguments = parser.parse_args()
+    print(game_chain().report(arguments.battles, arguments.battle_win))
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+histogram_buckets: int = 32
+_waiting: ContextVar[List[int]] = ContextVar("_waiting")
+
+
+def bucket(duration_ns: int) -> int:
+    """Получаем номер интервала гистограммы: интервалы удваиваются, начиная с 1 мкс."""
+    return min((duration_ns // 1000).bit_length(), histogram_buckets - 1)
+
+
+class EventStats:
+    """Статистика запусков объектов-событий одного класса."""
+
+    __slots__ = (
+        "calls",
+        "wall_ns",
+        "cpu_ns",
+        "wait_ns",
+        "decisions",
+        "wall_histogram",
+        "cpu_histogram",
+    )
+
+    def __init__(self) -> None:
+        """Конструктор параметров статистики."""
+        self.calls = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.wait_ns = 0
+        self.decisions = 0
+        self.wall_histogram = [0] * histogram_buckets
+        self.cpu_histogram = [0] * histogram_buckets
+
+    def add(self, wall_ns: int, cpu_ns: int, wait_ns: int, decisions: int) -> None:
+        """Учитываем очередной запуск объекта-события."""
+        self.calls += 1
+        self.wall_ns += wall_ns
+        self.cpu_ns += cpu_ns
+        self.wait_ns += wait_ns
+        self.decisions += decisions
+        self.wall_histogram[bucket(wall_ns)] += 1
+        self.cpu_histogram[bucket(cpu_ns)] += 1
+
+    def compute_ns(self) -> int:
+        """Получаем время вычислений без ожидания решений игрока."""
+        return self.wall_ns - self.wait_ns
+
+
+class EventProfiler:
+    """Класс профилировщика ходов игры.
+
+    Для каждого класса объектов-событий учитывает количество запусков, гистограммы
+    реального и процессорного времени, время ожидания решений игрока и время вычислений,
+    а также переходы к событию следующего хода. Подключается к игре параметром profiler;
+    без профилировщика игра выполняет лишь одну дополнительную проверку на ход.
+
+    """
+
+    def __init__(self) -> None:
+        """Конструктор параметров профилировщика."""
+        self.stats: Dict[str, EventStats] = {}
+        self.transitions: Counter[Tuple[str, str]] = Counter()
+
+    def event_stats(self, event: Any) -> EventStats:
+        """Получаем статистику класса объекта-события."""
+        name = type(event).__name__
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = EventStats()
+        return stats
+
+    def transition(self, previous: Any, event: Any) -> None:
+        """Учитываем переход игры от одного объекта-события к другому."""
+        self.transitions[type(previous).__name__, type(event).__name__] += 1
+
+    def ask(self, request: Any, policy: Any) -> Any:
+        """Запрашиваем решение игрока, учитывая время ожидания ответа."""
+        wait_start = time.perf_counter_ns()
+        try:
+            return request.ask(policy)
+        finally:
+            waiting = _waiting.get()
+            waiting[0] += time.perf_counter_ns() - wait_start
+            waiting[1] += 1
+
+    async def ask_async(self, request: Any, policy: Any) -> Any:
+        """Ожидаем решение игрока в цикле событий asyncio, учитывая время ожидания ответа."""
+        wait_start = time.perf_counter_ns()
+        try:
+            return await request.ask_async(policy)
+        finally:
+            waiting = _waiting.get()
+            waiting[0] += time.perf_counter_ns() - wait_start
+            waiting[1] += 1
+
+    def run_event(self, game: Any, event: Any) -> None:
+        """Запускаем объект-событие, измеряя время его работы.
+
+        Решения игрока объект-событие запрашивает через методы ask и ask_async профилировщика,
+        время ожидания накапливается отдельно для каждой задачи asyncio.
+
+        """
+        waiting = [0, 0]
+        token = _waiting.set(waiting)
+        wall_start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        try:
+            event.start()
+            self.transition(event, game.current_event)
+        finally:
+            self.event_stats(event).add(
+                time.perf_counter_ns() - wall_start,
+                time.thread_time_ns() - cpu_start,
+                waiting[0],
+                waiting[1],
+            )
+            _waiting.reset(token)
+
+    async def run_event_async(self, game: Any, event: Any) -> None:
+        """Запускаем объект-событие в цикле событий asyncio, измеряя время его работы.
+
+        Процессорное время учитывается всего потока, поэтому включает работу других партий,
+        выполнявшихся во время ожидания решения игрока.
+
+        """
+        waiting = [0, 0]
+        token = _waiting.set(waiting)
+        wall_start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        try:
+            await event.start_async()
+            self.transition(event, game.current_event)
+        finally:
+            self.event_stats(event).add(
+                time.perf_counter_ns() - wall_start,
+                time.thread_time_ns() - cpu_start,
+                waiting[0],
+                waiting[1],
+            )
+            _waiting.reset(token)
+
+    def report(self) -> str:
+        """Формируем текстовый отчёт профилирования."""
+        lines = [
+            f"{'Событие':<16}{'вызовы':>8}{'время, мкс':>12}{'ЦП, мкс':>10}"
+            f"{'ввод, мкс':>11}{'расчёт, мкс':>13}{'решения':>9}"
+        ]
+        for name, stats in sorted(
+            self.stats.items(), key=lambda item: item[1].wall_ns, reverse=True
+        ):
+            lines.append(
+                f"{name:<16}{stats.calls:>8}{stats.wall_ns // 1000:>12}"
+                f"{stats.cpu_ns // 1000:>10}{stats.wait_ns // 1000:>11}"
+                f"{stats.compute_ns() // 1000:>13}{stats.decisions:>9}"
+            )
+        lines.append("Переходы:")
+        for (source, target), count in self.transitions.most_common():
+            lines.append(f"  {source} -> {target}: {count}")
+        return "\n".join(lines)
+
+    def stacks(self, root: str = "Game.run") -> List[str]:
+        """Получаем свёрнутые стеки для построения flame graph, время в микросекундах."""
+        lines = []
+        for name, stats in self.stats.items():
+            for part, duration_ns in (
+                ("compute", stats.compute_ns()),
+                ("input", stats.wait_ns),
+            ):
+                if duration_ns // 1000:
+                    lines.append(f"{root};{name};{part} {duration_ns // 1000}")
+        return lines
+
+    def histogram(self, name: str, cpu: bool = False) -> Optional[List[int]]:
+        """Получаем гистограмму времени запусков объектов-событий заданного класса."""
+        stats = self.stats.get(name)
+        if stats is None:
+            return None
+        return list(stats.cpu_histogram if cpu else stats.wall_histogram)
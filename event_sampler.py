@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy
+
+import rng_service as rs
+
+default_block_size: int = 32
+alias_cache_size: int = 1024
+
+
+@lru_cache(maxsize=alias_cache_size)
+def alias_table(weights: Tuple[float, ...]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Строим таблицу псевдонимов (метод Уолкера - Возе) для заданных весов.
+
+    Таблица строится один раз для каждого набора весов и позволяет выбирать
+    элемент за O(1): одно равномерное число определяет столбец и выбор между
+    самим столбцом и его псевдонимом. Веса реестра событий могут меняться во время игры,
+    поэтому размер кэша таблиц ограничен.
+
+    """
+    size = len(weights)
+    total = sum(weights)
+    if not size or total <= 0 or any(weight < 0 for weight in weights):
+        raise ValueError(f"Некорректные веса событий: {weights}")
+    scaled = [weight * size / total for weight in weights]
+    probability = [0.0] * size
+    alias = list(range(size))
+    small = [n for n, value in enumerate(scaled) if value < 1.0]
+    large = [n for n, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    for n in small + large:
+        probability[n] = 1.0
+    probability_array = numpy.array(probability)
+    alias_array = numpy.array(alias, dtype=numpy.intp)
+    probability_array.setflags(write=False)
+    alias_array.setflags(write=False)
+    return probability_array, alias_array
+
+
+class AliasSampler:
+    """Класс объекта, выбирающего случайный элемент набора с заданными весами за O(1).
+
+    Выбор производится блоками: при исчерпании заранее выбранных элементов
+    сразу выбирается следующий блок заданного размера.
+
+    """
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        weights: Optional[Sequence[float]] = None,
+        block_size: int = default_block_size,
+        rng: Optional[rs.GameRandom] = None,
+    ) -> None:
+        """Конструктор параметров. Без весов элементы выбираются равновероятно."""
+        self.items = tuple(items)
+        self.rng = rng if rng is not None else rs.shared_random
+        if weights is None:
+            weights = (1.0,) * len(self.items)
+        if len(weights) != len(self.items):
+            raise ValueError("Количество весов не совпадает с количеством событий.")
+        self.weights = tuple(weights)
+        self._probability, self._alias = alias_table(self.weights)
+        self.block_size = block_size
+        self._block: List[Any] = []
+
+    def draw(self) -> Any:
+        """Выбираем следующий случайный элемент."""
+        if not self._block:
+            self._block = self.draw_block(self.block_size)
+            self._block.reverse()
+        return self._block.pop()
+
+    def pending(self) -> List[Any]:
+        """Получаем уже выбранные, но ещё не выданные элементы в порядке их выдачи."""
+        return self._block[::-1]
+
+    def restore_pending(self, items: Sequence[Any]) -> None:
+        """Восстанавливаем уже выбранные, но ещё не выданные элементы."""
+        self._block = list(items)[::-1]
+
+    def draw_block(self, size: int) -> List[Any]:
+        """Выбираем блок из заданного количества случайных элементов."""
+        columns = len(self.items)
+        scaled = self.rng.random_block(size) * columns
+        column = numpy.minimum(scaled.astype(numpy.intp), columns - 1)
+        take_alias = scaled - column >= self._probability[column]
+        indices = numpy.where(take_alias, self._alias[column], column)
+        items = self.items
+        return [items[n] for n in indices.tolist()]
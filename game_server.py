@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import async_game as ag
+import output_sink as osk
+import simulator as sim
+
+
+prompt_prefix: str = "? "
+game_over_line: str = "ИГРА ОКОНЧЕНА"
+
+
+class SessionSink(osk.OutputSink):
+    """Приёмник, передающий игровые сообщения сессии в её соединение построчно."""
+
+    def __init__(self, writer: Any) -> None:
+        """Конструктор параметров приёмника."""
+        self.writer = writer
+        self._buffer: List[str] = []
+
+    def emit(self, kind: str, template: str, *args: Any) -> None:
+        """Добавляем сообщение в буфер."""
+        self._buffer.append(osk.render(template, args))
+
+    def flush(self) -> None:
+        """Передаём накопленные сообщения в соединение одной записью."""
+        if self._buffer:
+            self._buffer.append("")
+            self.writer.write("\n".join(self._buffer).encode())
+            self._buffer.clear()
+
+
+class Session:
+    """Класс игровой сессии одного игрока.
+
+    Сессия владеет собственным соединением, приёмником сообщений и стратегией,
+    а игровой персонаж, хранилище сохранений и объект игры со счётчиком побеждённых чудовищ
+    создаются для каждой партии сессии отдельно.
+
+    """
+
+    def __init__(
+        self, session_id: int, reader: Any, writer: Any, seed: Optional[int] = None
+    ) -> None:
+        """Конструктор параметров сессии."""
+        self.session_id = session_id
+        self.reader = reader
+        self.writer = writer
+        self.seed = seed
+        self.sink = SessionSink(writer)
+        self.policy = ag.PromptPolicy(self.ask, self.sink)
+        self.outcome: Optional[sim.GameOutcome] = None
+
+    async def ask(self, request: str) -> str:
+        """Передаём игроку запрос решения и ожидаем строку с ответом.
+
+        Запрос отправляется отдельной строкой, начинающейся с префикса запроса.
+
+        """
+        self.writer.write(f"{prompt_prefix}{request.rstrip()}\n".encode())
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionResetError("Игрок разорвал соединение.")
+        return str(line.decode(errors="replace").strip())
+
+    async def play(self) -> Optional[sim.GameOutcome]:
+        """Проводим партию сессии и сообщаем игроку о её завершении."""
+        self.outcome = await ag.play_session(self.policy, self.sink, self.seed)
+        self.writer.write(f"{game_over_line}\n".encode())
+        await self.writer.drain()
+        return self.outcome
+
+
+class GameServer:
+    """Класс локального игрового сервера, одновременно ведущего множество независимых сессий.
+
+    Сервер работает по строковому протоколу поверх TCP или Unix-сокета: игровые сообщения
+    передаются клиенту строками, запрос решения - строкой с префиксом «? »,
+    а ответ игрока - одной строкой с номером выбранного варианта.
+
+    """
+
+    def __init__(self) -> None:
+        """Конструктор параметров сервера."""
+        self.sessions: Dict[int, Session] = {}
+        self.outcomes: List[sim.GameOutcome] = []
+        self._next_session_id = 0
+        self._server: Any = None
+
+    async def handle(self, reader: Any, writer: Any) -> None:
+        """Ведём сессию игрока, подключившегося к серверу."""
+        self._next_session_id += 1
+        session = Session(self._next_session_id, reader, writer)
+        self.sessions[session.session_id] = session
+        try:
+            outcome = await session.play()
+            if outcome is not None:
+                self.outcomes.append(outcome)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self.sessions[session.session_id]
+            writer.close()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> Any:
+        """Запускаем сервер на TCP-порту. Нулевой порт выбирается системой."""
+        self._server = await asyncio.start_server(self.handle, host, port)
+        return self._server
+
+    async def start_unix(self, path: str) -> Any:
+        """Запускаем сервер на Unix-сокете."""
+        self._server = await asyncio.start_unix_server(self.handle, path)
+        return self._server
+
+    async def close(self) -> None:
+        """Останавливаем приём новых подключений."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+class IdleConnection:
+    """Соединение без сети, в котором игрок выбирает класс персонажа и задумывается над следующим ответом.
+
+    Используется для замера памяти, занимаемой сессией во время партии.
+
+    """
+
+    def __init__(self) -> None:
+        """Конструктор параметров соединения."""
+        self.answered = False
+        self.answer: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+
+    def write(self, data: bytes) -> None:
+        """Отбрасываем переданные данные."""
+        pass
+
+    async def drain(self) -> None:
+        """Данные не накапливаются, ожидать нечего."""
+        pass
+
+    async def readline(self) -> bytes:
+        """Выбираем мечника, а затем ожидаем ответа игрока."""
+        if not self.answered:
+            self.answered = True
+            return b"1\n"
+        return await self.answer
+
+
+async def measure_sessions(count: int) -> float:
+    """Измеряем объём памяти на одну сессию, ожидающую решения игрока."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    connections = [IdleConnection() for _ in range(count)]
+    tasks = [
+        asyncio.ensure_future(Session(n, connection, connection).play())
+        for n, connection in enumerate(connections)
+    ]
+    await asyncio.sleep(0)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return (after - before) / count
+
+
+def session_footprint(count: int = 1000) -> float:
+    """Получаем объём памяти на одну сессию игрового сервера в байтах."""
+    return asyncio.run(measure_sessions(count))
+
+
+async def serve(host: str, port: int, unix_path: Optional[str]) -> None:
+    """Запускаем игровой сервер и обслуживаем игроков до его остановки."""
+    server = GameServer()
+    if unix_path is not None:
+        listener = await server.start_unix(unix_path)
+    else:
+        listener = await server.start_tcp(host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Игровой сервер.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="путь к Unix-сокету")
+    parser.add_argument(
+        "--footprint",
+        type=int,
+        default=0,
+        help="измерить объём памяти на сессию для заданного количества сессий",
+    )
+    arguments = parser.parse_args()
+    if arguments.footprint:
+        print(f"{session_footprint(arguments.footprint):.0f} байт на сессию")
+    else:
+        asyncio.run(serve(arguments.host, arguments.port, arguments.unix))
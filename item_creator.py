@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import random
 from abc import ABC, abstractmethod
-from typing import Any, Union
+from typing import Any, Dict, Optional, Tuple, Union
+
+import rng_service as rs
 
 
 class AbstractFactory(ABC):
@@ -23,38 +24,68 @@ class AbstractFactory(ABC):
         pass
 
 
+class ItemPool:
+    """Пул разделяемых игровых предметов (паттерн «Приспособленец»).
+
+    Предмет полностью описывается своим классом (видом и модификацией) и характеристикой,
+    поэтому одинаковые предметы создаются один раз и далее используются совместно.
+    Полученные из пула предметы не изменяются.
+
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self) -> None:
+        """Конструктор параметров пула."""
+        self._items: Dict[Tuple[Any, ...], Any] = {}
+
+    def get(self, item_class: Any, *args: Any) -> Any:
+        """Получаем предмет заданного класса с заданными характеристиками."""
+        key = (item_class, *args)
+        item = self._items.get(key)
+        if item is None:
+            item = self._items[key] = item_class(*args)
+        return item
+
+    def __len__(self) -> int:
+        """Получаем количество различных предметов в пуле."""
+        return len(self._items)
+
+
 class SwordFactory(AbstractFactory):
     """Фабрика по производству оружия класса «Меч»."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[rs.GameRandom] = None) -> None:
         """Конструктор параметров выпускаемых на фабрике мечей."""
-        self.standart_damage_rate = random.randint(5, 20)
-        self.improved_damage_rate = random.randint(20, 40)
+        rng = rng if rng is not None else rs.shared_random
+        self.standart_damage_rate = rng.randint(5, 20)
+        self.improved_damage_rate = rng.randint(20, 40)
 
     def create_standart_item(self) -> Sword:
         """Базовый метод для выпуска стандартных мечей."""
-        return Sword(self.standart_damage_rate)
+        return item_pool.get(Sword, self.standart_damage_rate)
 
     def create_unique_item(self) -> UniqueSword:
         """Базовый метод для выпуска уникальных мечей."""
-        return UniqueSword(self.improved_damage_rate)
+        return item_pool.get(UniqueSword, self.improved_damage_rate)
 
 
 class BowFactory(AbstractFactory):
     """Фабрика по производству оружия класса «Лук»."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[rs.GameRandom] = None) -> None:
         """Конструктор параметров выпускаемых на фабрике луков."""
-        self.standart_damage_rate = random.randint(5, 20)
-        self.improved_damage_rate = random.randint(20, 40)
+        rng = rng if rng is not None else rs.shared_random
+        self.standart_damage_rate = rng.randint(5, 20)
+        self.improved_damage_rate = rng.randint(20, 40)
 
     def create_standart_item(self) -> Bow:
         """Базовый метод для выпуска стандартных луков."""
-        return Bow(self.standart_damage_rate)
+        return item_pool.get(Bow, self.standart_damage_rate)
 
     def create_unique_item(self) -> UniqueBow:
         """Базовый метод для выпуска уникальных луков."""
-        return UniqueBow(self.improved_damage_rate)
+        return item_pool.get(UniqueBow, self.improved_damage_rate)
 
 
 class ArrowFactory(AbstractFactory):
@@ -62,7 +93,7 @@ class ArrowFactory(AbstractFactory):
 
     def create_standart_item(self) -> Arrow:
         """Базовый метод для выпуска стандартных стрел."""
-        return Arrow()
+        return item_pool.get(Arrow)
 
     def create_unique_item(self) -> Any:
         """Базовый метод для выпуска уникальных стрел."""
@@ -72,30 +103,32 @@ class ArrowFactory(AbstractFactory):
 class MagicAcademy(AbstractFactory):
     """Академия, выпускающая рукописи класса «Книга заклинаний»."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[rs.GameRandom] = None) -> None:
         """Конструктор параметров, выпускаемых в академии книг."""
-        self.standart_damage_rate: int = random.randint(5, 20)
-        self.improved_damage_rate: int = random.randint(20, 40)
+        rng = rng if rng is not None else rs.shared_random
+        self.standart_damage_rate: int = rng.randint(5, 20)
+        self.improved_damage_rate: int = rng.randint(20, 40)
 
     def create_standart_item(self) -> SpellBook:
         """Базовый метод для выпуска стандартных книг с заклинаниямию."""
-        return SpellBook(self.standart_damage_rate)
+        return item_pool.get(SpellBook, self.standart_damage_rate)
 
     def create_unique_item(self) -> UniqueSpellBook:
         """Базовый метод для выпуска уникальных книг с заклинаниямию."""
-        return UniqueSpellBook(self.improved_damage_rate)
+        return item_pool.get(UniqueSpellBook, self.improved_damage_rate)
 
 
 class AppleTree(AbstractFactory):
     """Яблоня с целебными плодами."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[rs.GameRandom] = None) -> None:
         """Конструктор параметров яблони."""
-        self.healing_power: int = random.randint(3, 15)
+        rng = rng if rng is not None else rs.shared_random
+        self.healing_power: int = rng.randint(3, 15)
 
     def create_standart_item(self) -> Apple:
         """Базовый метод создания яблока."""
-        return Apple(self.healing_power)
+        return item_pool.get(Apple, self.healing_power)
 
     def create_unique_item(self) -> Any:
         """Метод для создания уникального по своим свойствам целебного яблока."""
@@ -107,7 +140,7 @@ class MysteriousPlace(AbstractFactory):
 
     def create_standart_item(self) -> Totem:
         """Из ниоткуда возникает стандартный волшебный тотем."""
-        return Totem()
+        return item_pool.get(Totem)
 
     def create_unique_item(self) -> Any:
         """Из ниоткуда возникает уникальный волшебный тотем."""
@@ -117,6 +150,8 @@ class MysteriousPlace(AbstractFactory):
 class AbstractSword(ABC):
     """Базовый класс объекта-оружия "Меч"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -126,6 +161,8 @@ class AbstractSword(ABC):
 class AbstractUniqueSword(ABC):
     """Базовый класс объекта-оружия "Уникальный меч"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -135,6 +172,8 @@ class AbstractUniqueSword(ABC):
 class AbstractBow(ABC):
     """Базовый класс объекта-оружия "Лук"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -144,6 +183,8 @@ class AbstractBow(ABC):
 class AbstractUniqueBow(ABC):
     """Базовый класс объекта-оружия "Уникальный лук"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -153,12 +194,14 @@ class AbstractUniqueBow(ABC):
 class AbstractArrow(ABC):
     """Базовый класс объекта-боеприпаса "Стрелы"."""
 
-    pass
+    __slots__ = ()
 
 
 class AbstractSpellBook(ABC):
     """Базовый класс объекта-рукописи "Книга заклинаний"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -168,6 +211,8 @@ class AbstractSpellBook(ABC):
 class AbstractUniqueSpellBook(ABC):
     """Базовый класс объекта-рукописи "Уникальная книга заклинаний"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -177,6 +222,8 @@ class AbstractUniqueSpellBook(ABC):
 class AbstractApple(ABC):
     """Базовый класс объекта-плода "Яблоко"."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_hp_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
@@ -186,127 +233,113 @@ class AbstractApple(ABC):
 class AbstractTotem(ABC):
     """Базовый класс волшебного объекта "Тотем"."""
 
-    pass
+    __slots__ = ()
 
 
-class Sword(AbstractSword):
-    """Класс обьекта для создания стандартного меча."""
+class DamageItem:
+    """Базовый класс предмета с силой атаки.
+
+    Вид предмета задаётся атрибутом класса kind, общим для стандартной и уникальной
+    модификации. Предметы разделяются пулом item_pool между всеми инвентарями,
+    поэтому сила атаки задаётся при создании и доступна только для чтения.
+
+    """
+
+    __slots__ = ("_damage_rate",)
+
+    kind: str
 
     def __init__(self, damage_rate: int) -> None:
         """Конструктор параметров."""
-        self.damage_rate = damage_rate
+        self._damage_rate = damage_rate
+
+    @property
+    def damage_rate(self) -> int:
+        """Получаем силу атаки предмета."""
+        return self._damage_rate
 
     def get_damage_info(self) -> int:
         """Получаем информацию о силе атаки предмета."""
         return self.damage_rate
 
     def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится оружие."""
-        return "МЕЧ"
+        """Получаем наименование вида, к которому относится предмет."""
+        return self.kind
 
 
-class UniqueSword(AbstractUniqueSword):
-    """Класс обьекта для создания уникального меча."""
+class Sword(DamageItem, AbstractSword):
+    """Класс обьекта для создания стандартного меча."""
 
-    def __init__(self, damage_rate: int) -> None:
-        """Конструктор параметров."""
-        self.damage_rate = damage_rate
+    __slots__ = ()
 
-    def get_damage_info(self) -> int:
-        """Получаем информацию о силе атаки предмета."""
-        return self.damage_rate
+    kind = "МЕЧ"
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится оружие."""
-        return "МЕЧ"
 
+class UniqueSword(DamageItem, AbstractUniqueSword):
+    """Класс обьекта для создания уникального меча."""
 
-class Bow(AbstractBow):
-    """Класс обьекта для создания лука."""
+    __slots__ = ()
 
-    def __init__(self, damage_rate: int) -> None:
-        """Конструктор параметров."""
-        self.damage_rate = damage_rate
+    kind = Sword.kind
 
-    def get_damage_info(self) -> int:
-        """Получаем информацию о силе атаки предмета."""
-        return self.damage_rate
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится оружие."""
-        return "ЛУК"
+class Bow(DamageItem, AbstractBow):
+    """Класс обьекта для создания лука."""
 
+    __slots__ = ()
 
-class UniqueBow(AbstractUniqueBow):
-    """Класс обьекта для создания уникального лука."""
+    kind = "ЛУК"
 
-    def __init__(self, damage_rate: int) -> None:
-        """Конструктор параметров."""
-        self.damage_rate = damage_rate
 
-    def get_damage_info(self) -> int:
-        """Получаем информацию о силе атаки предмета."""
-        return self.damage_rate
+class UniqueBow(DamageItem, AbstractUniqueBow):
+    """Класс обьекта для создания уникального лука."""
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится оружие."""
-        return "ЛУК"
+    __slots__ = ()
+
+    kind = Bow.kind
 
 
-class Arrow(AbstractArrow):
+class Arrow(DamageItem, AbstractArrow):
     """Класс обьекта для создания стрел."""
 
-    def __init__(self) -> None:
-        """Конструктор параметров."""
-        self.damage_rate: int = 0
+    __slots__ = ()
 
-    def get_damage_info(self) -> int:
-        """Получаем информацию о силе атаки предмета."""
-        return self.damage_rate
+    kind = "СТРЕЛЫ"
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится боеприпас."""
-        return "СТРЕЛЫ"
+    def __init__(self) -> None:
+        """Конструктор параметров."""
+        super().__init__(0)
 
 
-class SpellBook(AbstractSpellBook):
+class SpellBook(DamageItem, AbstractSpellBook):
     """Класс обьекта для создания книги заклинаний."""
 
-    def __init__(self, damage_rate: int) -> None:
-        """Конструктор параметров."""
-        self.damage_rate = damage_rate
-
-    def get_damage_info(self) -> int:
-        """Получаем информацию о силе атаки предмета."""
-        return self.damage_rate
+    __slots__ = ()
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится рукопись."""
-        return "КНИГА ЗАКЛИНАНИЙ"
+    kind = "КНИГА ЗАКЛИНАНИЙ"
 
 
-class UniqueSpellBook(AbstractUniqueSpellBook):
+class UniqueSpellBook(DamageItem, AbstractUniqueSpellBook):
     """Класс обьекта для создания уникальной книги заклинаний."""
 
-    def __init__(self, damage_rate: int) -> None:
-        """Конструктор параметров."""
-        self.damage_rate = damage_rate
-
-    def get_damage_info(self) -> int:
-        """Получаем информацию о силе атаки предмета."""
-        return self.damage_rate
+    __slots__ = ()
 
-    def __str__(self) -> str:
-        """Получаем наименование класса, к которому относится рукопись."""
-        return "КНИГА ЗАКЛИНАНИЙ"
+    kind = SpellBook.kind
 
 
 class Apple(AbstractApple):
     """Класс обьекта для создания целебного яблока."""
 
+    __slots__ = ("_healing_power",)
+
     def __init__(self, healing_power: int) -> None:
         """Конструктор параметров."""
-        self.healing_power = healing_power
+        self._healing_power = healing_power
+
+    @property
+    def healing_power(self) -> int:
+        """Получаем целебную силу яблока."""
+        return self._healing_power
 
     def get_hp_info(self) -> int:
         """Получаем информацию о целебной силе яблока."""
@@ -320,6 +353,8 @@ class Apple(AbstractApple):
 class Totem(AbstractTotem):
     """Класс обьекта для создания тотема сохранений."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_damage_info() -> str:
         """Получаем информацию о свойствах волшебного предмета."""
@@ -328,3 +363,6 @@ class Totem(AbstractTotem):
     def __str__(self) -> str:
         """Получаем наименование класса, к которому относится волшебный предмет."""
         return "ТОТЕМ"
+
+
+item_pool = ItemPool()
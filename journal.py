@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Any, BinaryIO, List, NamedTuple, Optional, Tuple, Union
+
+import numpy
+
+import creatures_creator as cc
+import encounters as en
+import main as rpg
+import rng_service as rs
+import save_file as sf
+import simulator as sim
+
+journal_magic: bytes = b"KJNL"
+journal_version: int = 3
+# Позиции ходов в потоках хранятся четырёхбайтовыми целыми независимо от платформы.
+offset_typecode: str = next(code for code in "IL" if array(code).itemsize == 4)
+default_keyframe_interval: int = 32
+header_struct = struct.Struct("<4sBIIIII")
+keyframe_struct = struct.Struct("<IIIBHIBBB")
+encounter_struct = struct.Struct("<Bii")
+
+
+class ReplayError(Exception):
+    """Исключение, сигнализирующее о расхождении повторяемой партии с журналом."""
+
+    pass
+
+
+def little_endian(column: array) -> array:
+    """Получаем столбец журнала с порядком байтов от младшего к старшему.
+
+    Журнал записывается в одном порядке байтов на любой платформе,
+    поэтому партию, записанную на одной машине, можно повторить на другой.
+
+    """
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column
+
+
+class Keyframe(NamedTuple):
+    """Ключевой кадр журнала: полное состояние партии в начале хода.
+
+    Содержит закодированные состояние игрового персонажа и снимки хранилища сохранений,
+    счётчики партии, номер текущего события, а также уже выбранные, но ещё не выданные
+    события и описания чудовищ.
+
+    """
+
+    turn: int
+    monster_counter: int
+    totem_loads: int
+    event_index: int
+    npc: bytes
+    storage: Tuple[bytes, ...]
+    storage_evicted: int
+    event_block: Tuple[int, ...]
+    uniform_block: Tuple[int, ...]
+    encounters: Tuple[en.EncounterSpec, ...]
+
+    def dump(self, stream: BinaryIO) -> None:
+        """Записываем ключевой кадр в двоичный поток."""
+        stream.write(
+            keyframe_struct.pack(
+                self.turn,
+                self.monster_counter,
+                self.totem_loads,
+                self.event_index,
+                len(self.storage),
+                self.storage_evicted,
+                len(self.event_block),
+                len(self.uniform_block),
+                len(self.encounters),
+            )
+        )
+        stream.write(self.npc)
+        stream.write(b"".join(self.storage))
+        stream.write(bytes(self.event_block + self.uniform_block))
+        for spec in self.encounters:
+            stream.write(encounter_struct.pack(*spec))
+
+    @classmethod
+    def load(cls, stream: BinaryIO) -> Keyframe:
+        """Читаем ключевой кадр из двоичного потока."""
+        (
+            turn,
+            monster_counter,
+            totem_loads,
+            event_index,
+            storage_count,
+            storage_evicted,
+            event_count,
+            uniform_count,
+            encounter_count,
+        ) = keyframe_struct.unpack(stream.read(keyframe_struct.size))
+        record_size = sf.record_struct.size
+        npc = stream.read(record_size)
+        storage = tuple(stream.read(record_size) for _ in range(storage_count))
+        event_block = tuple(stream.read(event_count))
+        uniform_block = tuple(stream.read(uniform_count))
+        encounters = tuple(
+            en.EncounterSpec(
+                *encounter_struct.unpack(stream.read(encounter_struct.size))
+            )
+            for _ in range(encounter_count)
+        )
+        return cls(
+            turn,
+            monster_counter,
+            totem_loads,
+            event_index,
+            npc,
+            storage,
+            storage_evicted,
+            event_block,
+            uniform_block,
+            encounters,
+        )
+
+
+class Journal:
+    """Класс журнала партии, в который только дописываются записи.
+
+    Журнал хранит все выданные игре случайные числа в порядке их использования
+    (выбор событий, характеристики предметов и чудовищ, увороты), ответы игрока
+    и для каждого хода - номер разыгранного события и позиции в обоих потоках.
+    Через заданное количество ходов в журнал добавляется ключевой кадр с полным
+    состоянием партии, поэтому переход к любому ходу требует повтора не более
+    этого количества ходов.
+
+    """
+
+    def __init__(self, keyframe_interval: int = default_keyframe_interval) -> None:
+        """Конструктор параметров журнала."""
+        if keyframe_interval < 1:
+            raise ValueError(
+                f"Некорректный интервал ключевых кадров: {keyframe_interval}"
+            )
+        self.keyframe_interval = keyframe_interval
+        self.keyframes: List[Keyframe] = []
+        self.draws = array("d")
+        self.decisions = array("b")
+        self.turn_events = array("B")
+        self.turn_draws = array(offset_typecode)
+        self.turn_decisions = array(offset_typecode)
+
+    def mark_turn(self, event_index: int) -> None:
+        """Отмечаем начало очередного хода."""
+        self.turn_events.append(event_index)
+        self.turn_draws.append(len(self.draws))
+        self.turn_decisions.append(len(self.decisions))
+
+    def __len__(self) -> int:
+        """Получаем количество записанных ходов."""
+        return len(self.turn_events)
+
+    def dump(self, stream: BinaryIO) -> None:
+        """Записываем журнал в двоичный поток."""
+        stream.write(
+            header_struct.pack(
+                journal_magic,
+                journal_version,
+                len(self.draws),
+                len(self.decisions),
+                len(self.turn_events),
+                self.keyframe_interval,
+                len(self.keyframes),
+            )
+        )
+        for column in (
+            self.draws,
+            self.decisions,
+            self.turn_events,
+            self.turn_draws,
+            self.turn_decisions,
+        ):
+            stream.write(little_endian(column).tobytes())
+        for keyframe in self.keyframes:
+            keyframe.dump(stream)
+
+    @classmethod
+    def load(cls, stream: BinaryIO) -> Journal:
+        """Читаем журнал из двоичного потока."""
+        (
+            magic,
+            version,
+            draws,
+            decisions,
+            turns,
+            keyframe_interval,
+            keyframes,
+        ) = header_struct.unpack(stream.read(header_struct.size))
+        if magic != journal_magic or version != journal_version:
+            raise ReplayError("Неизвестный формат журнала.")
+        journal = cls(keyframe_interval)
+        for column, count in (
+            (journal.draws, draws),
+            (journal.decisions, decisions),
+            (journal.turn_events, turns),
+            (journal.turn_draws, turns),
+            (journal.turn_decisions, turns),
+        ):
+            column.frombytes(stream.read(count * column.itemsize))
+            if sys.byteorder == "big":
+                column.byteswap()
+        journal.keyframes = [Keyframe.load(stream) for _ in range(keyframes)]
+        return journal
+
+
+class RecordingRandom(rs.GameRandom):
+    """Источник случайных чисел, записывающий каждое выданное число в журнал."""
+
+    def __init__(self, journal: Journal, seed: Optional[int] = None) -> None:
+        """Конструктор параметров источника."""
+        super().__init__(seed)
+        self.journal = journal
+
+    def random(self) -> float:
+        """Получаем случайное число и записываем его в журнал."""
+        value = super().random()
+        self.journal.draws.append(value)
+        return value
+
+    def random_block(self, size: Union[int, Tuple[int, ...]]) -> numpy.ndarray:
+        """Получаем блок случайных чисел и записываем его в журнал."""
+        block = super().random_block(size)
+        self.journal.draws.frombytes(block.tobytes())
+        return block
+
+
+class ReplayRandom(rs.GameRandom):
+    """Источник, выдающий случайные числа из журнала вместо генератора."""
+
+    def __init__(self, journal: Journal, position: int = 0) -> None:
+        """Конструктор параметров источника."""
+        super().__init__(0, buffer_size=0)
+        self._draws = numpy.frombuffer(journal.draws, dtype=numpy.float64)
+        self._values = journal.draws
+        self.position = position
+
+    def random(self) -> float:
+        """Получаем очередное число из журнала."""
+        try:
+            value = self._values[self.position]
+        except IndexError:
+            raise ReplayError("Журнал случайных чисел исчерпан.") from None
+        self.position += 1
+        return value
+
+    def random_block(self, size: Union[int, Tuple[int, ...]]) -> numpy.ndarray:
+        """Получаем блок чисел из журнала."""
+        count = int(numpy.prod(size))
+        if self.position + count > len(self._draws):
+            raise ReplayError("Журнал случайных чисел исчерпан.")
+        block = self._draws[self.position : self.position + count].reshape(size)
+        self.position += count
+        return block
+
+
+class RecordingPolicy(rpg.DecisionPolicy):
+    """Стратегия, записывающая в журнал решения другой стратегии."""
+
+    def __init__(self, policy: rpg.DecisionPolicy, journal: Journal) -> None:
+        """Конструктор параметров стратегии."""
+        self.policy = policy
+        self.journal = journal
+
+    def record(self, decision: Any) -> Any:
+        """Записываем решение в журнал."""
+        self.journal.decisions.append(int(decision))
+        return decision
+
+    def npc_decision(self) -> Optional[int]:
+        """Записываем выбор класса игрового персонажа."""
+        return self.record(self.policy.npc_decision())
+
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Записываем действие при встрече с чудовищем."""
+        return self.record(self.policy.battle_decision(npc_info))
+
+    def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Записываем выбор оружия для атаки."""
+        return self.record(self.policy.weapon_decision(npc_info))
+
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Записываем решение о найденном предмете."""
+        return self.record(self.policy.item_decision(npc_info, weapon_info, totem))
+
+    def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Записываем решение о загрузке сохранения."""
+        return self.record(self.policy.load_save_decision(npc_info))
+
+
+class ReplayPolicy(rpg.DecisionPolicy):
+    """Стратегия, повторяющая решения игрока из журнала без запросов к нему."""
+
+    def __init__(self, journal: Journal, position: int = 0) -> None:
+        """Конструктор параметров стратегии."""
+        self.decisions = journal.decisions
+        self.position = position
+
+    def next_decision(self) -> int:
+        """Получаем очередное решение из журнала."""
+        try:
+            decision = self.decisions[self.position]
+        except IndexError:
+            raise ReplayError("Журнал решений исчерпан.") from None
+        self.position += 1
+        return decision
+
+    def npc_decision(self) -> Optional[int]:
+        """Повторяем выбор класса игрового персонажа."""
+        return self.next_decision()
+
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Повторяем действие при встрече с чудовищем."""
+        return self.next_decision()
+
+    def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Повторяем выбор оружия для атаки."""
+        return self.next_decision()
+
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Повторяем решение о найденном предмете."""
+        return self.next_decision()
+
+    def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Повторяем решение о загрузке сохранения."""
+        return bool(self.next_decision())
+
+
+def battle_event(game: rpg.Game) -> rpg.EventBattle:
+    """Находим событие «Бой», через которое доступны игровой персонаж и хранилище сохранений."""
+    return next(
+        event for event in game.event_list if isinstance(event, rpg.EventBattle)
+    )
+
+
+def capture_keyframe(game: rpg.Game) -> Keyframe:
+    """Сохраняем полное состояние партии в начале хода в ключевой кадр."""
+    battle = battle_event(game)
+    event_index = game.event_list.index
+    encounters = battle.encounters
+    return Keyframe(
+        game.turns,
+        game.monster_counter,
+        game.totem_loads,
+        event_index(game.current_event),
+        sf.encode(battle.npc.save()),
+        tuple(sf.encode(memento) for memento in battle.life_keeper.snapshots()),
+        battle.life_keeper.evicted,
+        tuple(map(event_index, game.event_sampler.pending())),
+        tuple(map(event_index, game.uniform_event_sampler.pending())),
+        tuple(encounters.pending) if isinstance(encounters, en.EncounterStream) else (),
+    )
+
+
+def apply_keyframe(game: rpg.Game, keyframe: Keyframe) -> None:
+    """Восстанавливаем состояние партии из ключевого кадра."""
+    battle = battle_event(game)
+    events = game.event_list
+    battle.npc.restore(sf.decode(keyframe.npc))
+    battle.life_keeper.restore_snapshots(
+        map(sf.decode, keyframe.storage), keyframe.storage_evicted
+    )
+    battle.encounters = en.EncounterStream(
+        battle.monster_health,
+        battle.monster_attack,
+        game.rng,
+        pending=keyframe.encounters,
+    )
+    game.event_sampler.restore_pending([events[n] for n in keyframe.event_block])
+    game.uniform_event_sampler.restore_pending(
+        [events[n] for n in keyframe.uniform_block]
+    )
+    game.monster_counter = keyframe.monster_counter
+    game.totem_loads = keyframe.totem_loads
+    game.turns = keyframe.turn
+    game.transition_to(events[keyframe.event_index])
+
+
+def play_turn(game: rpg.Game, journal: Journal, check: bool = False) -> None:
+    """Проводим ход партии, отмечая его в журнале или сверяя с ним."""
+    event_index = game.event_list.index(game.current_event)
+    if check:
+        if game.turns >= len(journal):
+            raise ReplayError("Партия продолжается дольше записанной.")
+        if journal.turn_events[game.turns] != event_index:
+            raise ReplayError(f"Ход {game.turns}: событие расходится с журналом.")
+    else:
+        if game.turns % journal.keyframe_interval == 0:
+            journal.keyframes.append(capture_keyframe(game))
+        journal.mark_turn(event_index)
+    game.run()
+
+
+def run_game(game: rpg.Game, journal: Journal, check: bool = False) -> sim.GameOutcome:
+    """Проводим партию до конца, отмечая ходы в журнале или сверяя их с ним."""
+    victory = True
+    try:
+        while game.monster_counter != rpg.victory_monster_count:
+            play_turn(game, journal, check)
+    except rpg.GameOver:
+        victory = False
+    return sim.GameOutcome(victory, game.monster_counter, game.totem_loads, game.turns)
+
+
+def record_game(
+    policy: rpg.DecisionPolicy,
+    seed: Optional[int] = None,
+    keyframe_interval: int = default_keyframe_interval,
+) -> Tuple[sim.GameOutcome, Journal]:
+    """Проводим партию без участия терминала, записывая её журнал."""
+    journal = Journal(keyframe_interval)
+    game = sim.new_game(
+        RecordingPolicy(policy, journal), RecordingRandom(journal, seed)
+    )
+    return run_game(game, journal), journal
+
+
+def replay(journal: Journal, check: bool = True) -> sim.GameOutcome:
+    """Повторяем партию по журналу без запросов к игроку и без вывода сообщений.
+
+    При проверке каждый ход сверяется с записанным, и расхождение, например,
+    после изменения игрового баланса, приводит к исключению ReplayError.
+
+    """
+    game = sim.new_game(ReplayPolicy(journal), ReplayRandom(journal))
+    return run_game(game, journal, check)
+
+
+def seek(journal: Journal, turn: int) -> rpg.Game:
+    """Получаем партию в состоянии на начало заданного хода.
+
+    Состояние восстанавливается из ближайшего предшествующего ключевого кадра,
+    после чего повторяются лишь ходы между кадром и заданным ходом.
+
+    """
+    if not 0 <= turn < len(journal) or not journal.keyframes:
+        raise ReplayError(f"Ход {turn} отсутствует в журнале.")
+    keyframe = journal.keyframes[turn // journal.keyframe_interval]
+    policy = ReplayPolicy(journal)
+    rng = ReplayRandom(journal)
+    game = sim.new_game(policy, rng)
+    apply_keyframe(game, keyframe)
+    policy.position = journal.turn_decisions[keyframe.turn]
+    rng.position = journal.turn_draws[keyframe.turn]
+    while game.turns < turn:
+        play_turn(game, journal, check=True)
+    return game
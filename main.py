@@ -1,48 +1,168 @@
 from __future__ import annotations
 
-import random
-import sys
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple, Union
-
-from numpy.random import choice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import creatures_creator as cc
+import encounters as en
+import event_profiler as ep
+import event_sampler as es
 import item_creator as ic
+import output_sink as osk
+import rng_service as rs
 
 
-monster_counter: int = 0
 initial_monster_hp_range: Tuple[int, int] = (10, 25)
 initial_monster_attack_range: Tuple[int, int] = (10, 30)
 initial_npc_hp: int = 15
 initial_npc_attack: int = 15
+victory_monster_count: int = 10
+event_probabilities: Tuple[float, ...] = (0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3)
+
+
+class DecisionRequest(NamedTuple):
+    """Запрос решения у стратегии: имя метода стратегии и передаваемые ему аргументы."""
+
+    method: str
+    kwargs: Dict[str, Any]
+
+    def ask(self, policy: Any) -> Any:
+        """Получаем решение у стратегии."""
+        return getattr(policy, self.method)(**self.kwargs)
+
+    async def ask_async(self, policy: Any) -> Any:
+        """Получаем решение у стратегии, ожидая его, если стратегия асинхронная."""
+        decision = self.ask(policy)
+        if inspect.isawaitable(decision):
+            decision = await decision
+        return decision
+
+
+Script = Generator[DecisionRequest, Any, None]
+
+
+def uniform_weights(weights: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Получаем равные веса для объектов-событий, выбираемых с ненулевым весом."""
+    return tuple(float(weight > 0) for weight in weights)
+
+
+class GameOver(Exception):
+    """Исключение, сигнализирующее о гибели игрового персонажа без возможности загрузить сохранение."""
+
+    pass
 
 
 class Game:
-    """Класс объекта, определяющий интерфейс управления событиями в игре."""
+    """Класс объекта, определяющий интерфейс управления событиями в игре.
+
+    Решения игрока запрашиваются у объекта-стратегии, а игровые сообщения передаются приёмнику сообщений,
+    что позволяет проводить игру как в терминале, так и без участия человека.
+
+    """
 
     _event: Any
 
-    def __init__(self, event_list: Union[Any]) -> None:
-        """Конструктор параметров интерфейса управления объектами-событиями в игре."""
+    def __init__(
+        self,
+        event_list: Union[Any],
+        policy: Optional[DecisionPolicy] = None,
+        sink: Optional[osk.OutputSink] = None,
+        rng: Optional[rs.GameRandom] = None,
+        profiler: Optional[ep.EventProfiler] = None,
+        registry: Optional[EventRegistry] = None,
+    ) -> None:
+        """Конструктор параметров интерфейса управления объектами-событиями в игре.
+
+        Веса выбора объектов-событий берутся из реестра событий, по умолчанию - из реестра игрового сценария.
+
+        """
         self.event_list = event_list
-        random_event = choice(event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3])
+        self.profiler = profiler
+        self.registry = registry if registry is not None else event_registry
+        self.rng = rng if rng is not None else rs.GameRandom()
+        self.sink = sink if sink is not None else osk.PrintSink()
+        self.policy = policy if policy is not None else ConsolePolicy(self.sink)
+        self.monster_counter = 0
+        self.totem_loads = 0
+        self.turns = 0
+        weights = self.registry.weights(event_list)
+        self.event_sampler = es.AliasSampler(event_list, weights, rng=self.rng)
+        self.uniform_event_sampler = es.AliasSampler(
+            event_list, uniform_weights(weights), rng=self.rng
+        )
+        self._registry_version = self.registry.version
+        random_event = self.event_sampler.draw()
         self.transition_to(random_event)
 
+    @property
+    def current_event(self) -> Any:
+        """Возвращаем текущий объект-событие."""
+        return self._event
+
     def transition_to(self, event: Any) -> None:
         """Меняем объект-событие во время игры."""
         self._event = event
         self._event.game = self
 
+    def compile_events(self) -> None:
+        """Перестраиваем таблицу выбора объектов-событий после изменения реестра событий.
+
+        Таблица заменяется, только если изменились веса объектов-событий этой игры.
+
+        """
+        weights = self.registry.weights(self.event_list)
+        if weights != self.event_sampler.weights:
+            self.event_sampler = es.AliasSampler(self.event_list, weights, rng=self.rng)
+        if uniform_weights(weights) != self.uniform_event_sampler.weights:
+            self.uniform_event_sampler = es.AliasSampler(
+                self.event_list, uniform_weights(weights), rng=self.rng
+            )
+        self._registry_version = self.registry.version
+
     def run(self) -> None:
         """Запускаем функционал переданного в качестве аргумента объекта-события."""
-        self._event.start()
+        self.turns += 1
+        if self._registry_version != self.registry.version:
+            self.compile_events()
+        if self.profiler is None:
+            self._event.start()
+        else:
+            self.profiler.run_event(self, self._event)
+
+    async def run_async(self) -> None:
+        """Запускаем функционал объекта-события в цикле событий asyncio."""
+        self.turns += 1
+        if self._registry_version != self.registry.version:
+            self.compile_events()
+        if self.profiler is None:
+            await self._event.start_async()
+        else:
+            await self.profiler.run_event_async(self, self._event)
 
 
 class Event(ABC):
-    """Базовый класс для представления событий в игре."""
+    """Базовый класс для представления событий в игре.
+
+    Событие описывается генератором, передающим запросы решений игроку и получающим ответы на них.
+    Один и тот же сценарий события проигрывается как обычным циклом игры, так и в цикле событий asyncio,
+    где ожидание решения игрока не блокирует другие партии.
+
+    """
 
     _game = None
+    uniform_next: bool = False
 
     @property
     def game(self) -> Any:
@@ -55,35 +175,171 @@ class Event(ABC):
         self._game = game
 
     @abstractmethod
-    def start(self) -> None:
-        """Базовый метод для запуска разработанного в событии функционал."""
+    def play(self) -> Script:
+        """Базовый метод сценария разработанного в событии функционала."""
         pass
 
+    def next_event(self) -> Event:
+        """Выбираем объект-событие следующего хода: равновероятно или с весами реестра событий."""
+        if self.uniform_next:
+            return self.game.uniform_event_sampler.draw()
+        return self.game.event_sampler.draw()
+
+    def start(self) -> None:
+        """Запускаем работу объекта-события.
+
+        Если к игре подключён профилировщик, решения игрока запрашиваются через него,
+        чтобы учесть время ожидания ответа.
+
+        """
+        policy = self.game.policy
+        profiler = self.game.profiler
+        script = self.play()
+        decision = None
+        try:
+            while True:
+                request = script.send(decision)
+                if profiler is None:
+                    decision = request.ask(policy)
+                else:
+                    decision = profiler.ask(request, policy)
+        except StopIteration:
+            pass
+
+    async def start_async(self) -> None:
+        """Запускаем работу объекта-события, ожидая решения игрока без блокировки цикла событий."""
+        policy = self.game.policy
+        profiler = self.game.profiler
+        script = self.play()
+        decision = None
+        try:
+            while True:
+                request = script.send(decision)
+                if profiler is None:
+                    decision = await request.ask_async(policy)
+                else:
+                    decision = await profiler.ask_async(request, policy)
+        except StopIteration:
+            pass
+
+
+Weight = Union[float, Callable[[Event], float]]
+
+
+class EventEntry(NamedTuple):
+    """Запись реестра событий: класс объекта-события, его вес и способ создания."""
+
+    event_class: Type[Event]
+    weight: Weight
+    create: Callable[[Any, Any], Event]
+
+    def weight_of(self, event: Event) -> float:
+        """Получаем вес объекта-события, в том числе зависящий от игрового персонажа."""
+        return self.weight(event) if callable(self.weight) else self.weight
+
+
+class EventRegistry:
+    """Класс реестра событий игрового сценария.
+
+    Классы объектов-событий регистрируются со своими весами выбора и способом создания
+    по игровому персонажу и хранилищу сохранений. Вес может быть функцией объекта-события,
+    например, зависящей от класса игрового персонажа. Номер версии реестра меняется при каждом
+    изменении, по нему игра перестраивает таблицу выбора объектов-событий только при необходимости.
+
+    """
+
+    def __init__(self) -> None:
+        """Конструктор параметров реестра."""
+        self._entries: Dict[Type[Event], EventEntry] = {}
+        self.version = 0
+
+    def register(
+        self,
+        event_class: Type[Event],
+        weight: Weight,
+        create: Optional[Callable[[Any, Any], Event]] = None,
+    ) -> None:
+        """Регистрируем класс объекта-события или меняем вес уже зарегистрированного.
+
+        По умолчанию объект-событие создаётся по одному игровому персонажу.
+
+        """
+        if create is None:
+
+            def create(npc: Any, life_keeper: Any) -> Event:
+                return event_class(npc)  # type: ignore[call-arg]
+
+        self._entries[event_class] = EventEntry(event_class, weight, create)
+        self.version += 1
+
+    def unregister(self, event_class: Type[Event]) -> None:
+        """Удаляем класс объекта-события из реестра."""
+        del self._entries[event_class]
+        self.version += 1
+
+    def entry(self, event_class: Type[Event]) -> Optional[EventEntry]:
+        """Находим запись реестра для класса объекта-события или его ближайшего предка."""
+        for cls in event_class.__mro__:
+            entry = self._entries.get(cls)
+            if entry is not None:
+                return entry
+        return None
+
+    def weights(self, events: Tuple[Event, ...]) -> Tuple[float, ...]:
+        """Получаем веса выбора объектов-событий. Незарегистрированные объекты-события не выбираются."""
+        weights = []
+        for event in events:
+            entry = self.entry(type(event))
+            weights.append(0.0 if entry is None else entry.weight_of(event))
+        return tuple(weights)
+
+    def create_events(
+        self,
+        npc: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        life_keeper: cc.Storage,
+    ) -> Tuple[Event, ...]:
+        """Создаём объекты-события всех зарегистрированных классов в порядке регистрации."""
+        return tuple(entry.create(npc, life_keeper) for entry in self._entries.values())
+
+    def __iter__(self) -> Iterator[EventEntry]:
+        """Перебираем записи реестра в порядке регистрации."""
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        """Получаем количество зарегистрированных классов объектов-событий."""
+        return len(self._entries)
+
 
 class EventApple(Event):
     """Класс для представления события «Яблочко» в игре.
 
     Игровой персонаж находит яблоко, повышающее значение уровня его жизни.
+    Объект-событие следующего хода выбирается равновероятно.
 
     """
 
+    uniform_next = True
+
     def __init__(
         self, npc: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
     ) -> None:
         """Конструктор параметров объекта-события."""
         self.npc = npc
 
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        print("-------------------")
-        apple = ic.AppleTree().create_standart_item()
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        apple = ic.AppleTree(self.game.rng).create_standart_item()
         self.npc.increase_health(apple.get_hp_info())
-        print(
-            f"Вы нашли яблочко здоровья! +{apple.get_hp_info()} к здоровью героя. "
-            f"У героя {self.npc.get_health_info()} жизней."
+        self.game.sink.emit(
+            "apple",
+            "Вы нашли яблочко здоровья! +{} к здоровью героя. У героя {} жизней.",
+            apple.get_hp_info(),
+            self.npc.get_health_info(),
         )
-        next_event = random.choice(self.game.event_list)
+        next_event = self.next_event()
         self.game.transition_to(next_event)
+        yield from ()
 
 
 class EventSword(Event):
@@ -99,25 +355,30 @@ class EventSword(Event):
         """Конструктор параметров объекта-события."""
         self.npc = npc
 
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        print("-------------------")
-        next_event = choice(self.game.event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3])
-        if issubclass(type(self.npc), cc.AbstractSwordsman):
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        next_event = self.next_event()
+        factory = ic.SwordFactory(self.game.rng)
+        if self.npc.weapon_affinity == ic.Sword.kind:
             swords: Any = (
-                ic.SwordFactory().create_standart_item(),
-                ic.SwordFactory().create_unique_item(),
+                factory.create_standart_item(),
+                factory.create_unique_item(),
+            )
+            discovered_swords = self.game.rng.choice(swords, p=(0.4, 0.6))
+            decision = yield DecisionRequest(
+                "item_decision", dict(npc_info=self.npc, weapon_info=discovered_swords)
             )
-            discovered_swords = choice(swords, p=[0.4, 0.6])
-            decision = item_decision(npc_info=self.npc, weapon_info=discovered_swords)
             if decision == 1:
                 self.npc.add_item_to_bag(discovered_swords)
                 self.game.transition_to(next_event)
             else:
                 self.game.transition_to(next_event)
         else:
-            discovered_sword = ic.SwordFactory().create_standart_item()
-            decision = item_decision(npc_info=self.npc, weapon_info=discovered_sword)
+            discovered_sword = factory.create_standart_item()
+            decision = yield DecisionRequest(
+                "item_decision", dict(npc_info=self.npc, weapon_info=discovered_sword)
+            )
             if decision == 1:
                 self.npc.add_item_to_bag(discovered_sword)
                 self.game.transition_to(next_event)
@@ -138,25 +399,30 @@ class EventBow(Event):
         """Конструктор параметров объекта-события."""
         self.npc = npc
 
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        print("-------------------")
-        next_event = choice(self.game.event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3])
-        if issubclass(type(self.npc), cc.AbstractArcher):
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        next_event = self.next_event()
+        factory = ic.BowFactory(self.game.rng)
+        if self.npc.weapon_affinity == ic.Bow.kind:
             bows: Any = (
-                ic.BowFactory().create_standart_item(),
-                ic.BowFactory().create_unique_item(),
+                factory.create_standart_item(),
+                factory.create_unique_item(),
+            )
+            discovered_bow = self.game.rng.choice(bows, p=(0.4, 0.6))
+            decision = yield DecisionRequest(
+                "item_decision", dict(npc_info=self.npc, weapon_info=discovered_bow)
             )
-            discovered_bow = choice(bows, p=[0.4, 0.6])
-            decision = item_decision(npc_info=self.npc, weapon_info=discovered_bow)
             if decision == 1:
                 self.npc.add_item_to_bag(discovered_bow)
                 self.game.transition_to(next_event)
             else:
                 self.game.transition_to(next_event)
         else:
-            discovered_bow = ic.BowFactory().create_standart_item()
-            decision = item_decision(npc_info=self.npc, weapon_info=discovered_bow)
+            discovered_bow = factory.create_standart_item()
+            decision = yield DecisionRequest(
+                "item_decision", dict(npc_info=self.npc, weapon_info=discovered_bow)
+            )
             if decision == 1:
                 self.npc.add_item_to_bag(discovered_bow)
                 self.game.transition_to(next_event)
@@ -177,18 +443,22 @@ class EventSpellBook(Event):
         """Конструктор параметров объекта - события."""
         self.npc = npc
 
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        print("-------------------")
-        next_event = choice(self.game.event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3])
-        if issubclass(type(self.npc), cc.AbstractWizard):
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        next_event = self.next_event()
+        factory = ic.MagicAcademy(self.game.rng)
+        if self.npc.weapon_affinity == ic.SpellBook.kind:
             books: Any = (
-                ic.MagicAcademy().create_standart_item(),
-                ic.MagicAcademy().create_unique_item(),
+                factory.create_standart_item(),
+                factory.create_unique_item(),
+            )
+            discovered_spell_books: Union[Any] = self.game.rng.choice(
+                books, p=(0.4, 0.6)
             )
-            discovered_spell_books: Union[Any] = choice(books, p=[0.4, 0.6])
-            decision = item_decision(
-                npc_info=self.npc, weapon_info=discovered_spell_books
+            decision = yield DecisionRequest(
+                "item_decision",
+                dict(npc_info=self.npc, weapon_info=discovered_spell_books),
             )
             if decision == 1:
                 self.npc.add_item_to_bag(discovered_spell_books)
@@ -196,9 +466,10 @@ class EventSpellBook(Event):
             else:
                 self.game.transition_to(next_event)
         else:
-            discovered_spell_book = ic.MagicAcademy().create_standart_item()
-            decision = item_decision(
-                npc_info=self.npc, weapon_info=discovered_spell_book
+            discovered_spell_book = factory.create_standart_item()
+            decision = yield DecisionRequest(
+                "item_decision",
+                dict(npc_info=self.npc, weapon_info=discovered_spell_book),
             )
             if decision == 1:
                 self.npc.add_item_to_bag(discovered_spell_book)
@@ -218,12 +489,14 @@ class EventArrow(Event):
         """Конструктор параметров объекта-события."""
         self.npc = npc
 
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        print("-------------------")
-        next_event = choice(self.game.event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3])
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        next_event = self.next_event()
         discovered_arrow = ic.ArrowFactory().create_standart_item()
-        decision = item_decision(npc_info=self.npc, weapon_info=discovered_arrow)
+        decision = yield DecisionRequest(
+            "item_decision", dict(npc_info=self.npc, weapon_info=discovered_arrow)
+        )
         if decision == 1:
             self.npc.add_item_to_bag(discovered_arrow)
 
@@ -250,17 +523,19 @@ class EventTotem(Event):
         self.npc = npc
         self.life_keeper = life_keeper
 
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        print("-------------------")
-        next_event = choice(self.game.event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3])
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        next_event = self.next_event()
         discovered_totem = ic.MysteriousPlace().create_standart_item()
-        decision = item_decision(
-            npc_info=self.npc, weapon_info=discovered_totem, totem=True
+        decision = yield DecisionRequest(
+            "item_decision",
+            dict(npc_info=self.npc, weapon_info=discovered_totem, totem=True),
         )
         if decision == 1:
             self.npc.add_item_to_bag(discovered_totem)
             self.life_keeper.backup()
+            self.game.sink.emit("saved", "Игра сохранена!")
             self.game.transition_to(next_event)
         else:
             self.game.transition_to(next_event)
@@ -281,100 +556,197 @@ class EventBattle(Event):
         life_keeper: Any,
         monster_health: Tuple[int, int],
         monster_attack: Tuple[int, int],
+        encounters: Optional[Iterator[en.EncounterSpec]] = None,
     ) -> None:
-        """Конструктор параметров объекта-события."""
+        """Конструктор параметров объекта-события.
+
+        Чудовища берутся из переданного потока описаний, например, заранее выбранного для повтора игры.
+        Если поток не передан, он создаётся при первом бое на основе генератора случайных чисел игры.
+
+        """
         self.npc = npc
         self.life_keeper = life_keeper
         self.monster_health = monster_health
         self.monster_attack = monster_attack
-
-    def start(self) -> None:
-        """Запускаем работу объекта-события."""
-        try:
-            print("-------------------")
-            next_event = choice(
-                self.game.event_list, p=[0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3]
-            )
-            random_monster_health = random.randint(
-                self.monster_health[0], self.monster_health[1]
-            )
-            random_monster_attack = random.randint(
-                self.monster_attack[0], self.monster_attack[1]
+        self.encounters = encounters
+
+    def exchange_blows(self, monster: Union[Any]) -> None:
+        """Обмениваемся с чудовищем одновременными ударами."""
+        if self.npc.get_attack(monster):
+            self.game.sink.emit(
+                "dodge",
+                "Вы мастерски увернулись от атаки, нанеся чудовищу серъёзный урон!",
             )
-            random_monster: Union[Any] = random.choice(
-                [
-                    cc.MonsterFactory(
-                        random_monster_health, random_monster_attack
-                    ).create_swordsman(),
-                    cc.MonsterFactory(
-                        random_monster_health, random_monster_attack
-                    ).create_archer(),
-                    cc.MonsterFactory(
-                        random_monster_health, random_monster_attack
-                    ).create_wizard(),
-                ]
-            )
-            print(
-                f"БОЙ! Вы встретили чудовище класса '{random_monster.__str__()}'. "
-                f"Жизней {random_monster.get_health_info()}. "
-                f"Сила атаки {random_monster.get_attack_info()}."
+        monster.get_attack(self.npc)
+
+    def choose_action(self) -> Generator[DecisionRequest, Any, Optional[int]]:
+        """Запрашиваем действие игрока, пока он меняет оружие для атаки."""
+        decision = yield DecisionRequest("battle_decision", dict(npc_info=self.npc))
+        while decision == 3:
+            weapon = yield DecisionRequest("weapon_decision", dict(npc_info=self.npc))
+            self.npc.equip_weapon(weapon)
+            decision = yield DecisionRequest("battle_decision", dict(npc_info=self.npc))
+        return decision
+
+    def load_save(self, next_event: Any) -> Script:
+        """Загружаем сохранение, если игрок решил воспользоваться тотемом, иначе завершаем игру."""
+        decision = yield DecisionRequest("load_save_decision", dict(npc_info=self.npc))
+        if decision:
+            self.life_keeper.undo()
+            self.npc.remove_item_from_bag(ic.Totem())
+            self.game.totem_loads += 1
+            self.game.transition_to(next_event)
+        else:
+            raise GameOver()
+
+    def play(self) -> Script:
+        """Разыгрываем объект-событие."""
+        self.game.sink.emit("separator", "-------------------")
+        next_event = self.next_event()
+        if self.encounters is None:
+            self.encounters = en.encounter_stream(
+                self.monster_health, self.monster_attack, self.game.rng
             )
-            decision = battle_decision(npc_info=self.npc)
-            if decision == 1:
-                while (
-                    random_monster.get_health_info() > 0
-                    and self.npc.get_health_info() > 0
-                ):
-                    self.npc.get_attack(random_monster)
-                    random_monster.get_attack(self.npc)
-                    if (
-                        self.npc.get_health_info() > 0
-                        and random_monster.get_health_info() > 0
-                    ):
-                        print(
-                            f"Чудовище РАНЕНО! Осталось жизней {random_monster.get_health_info()}. "
-                            f"Сила атаки {random_monster.get_attack_info()}."
-                        )
-                        decision = battle_decision(npc_info=self.npc)
-                        if decision == 1:
-                            self.npc.get_attack(random_monster)
-                            random_monster.get_attack(self.npc)
-                        elif decision == 2:
-                            break
-                        self.game.transition_to(next_event)
+        encounter = next(self.encounters)
+        self.game.sink.emit(
+            "battle",
+            "БОЙ! Вы встретили чудовище класса '{}'. Жизней {}. Сила атаки {}.",
+            encounter.class_name(),
+            encounter.health,
+            encounter.attack_value,
+        )
+        decision = yield from self.choose_action()
+        if decision == 1:
+            random_monster = encounter.create_monster()
+            while (
+                random_monster.get_health_info() > 0 and self.npc.get_health_info() > 0
+            ):
+                self.exchange_blows(random_monster)
                 if (
-                    self.npc.get_health_info() <= 0
-                    and random_monster.get_health_info() <= 0
+                    self.npc.get_health_info() > 0
+                    and random_monster.get_health_info() > 0
                 ):
-                    print("-------------------")
-                    print(
-                        "ПОРАЖЕНИЕ. Вы избавили мир от великого зла, ценой своей жизни! "
-                        "Ваш подвиг будет согревать сердца людей близлежащей деревни. "
-                        "\nВ вашу честь закатили пирушку и благополучно забыли через год. "
-                        "Возможно, в следующей жизни вам повезёт больше!"
+                    self.game.sink.emit(
+                        "wounded",
+                        "Чудовище РАНЕНО! Осталось жизней {}. Сила атаки {}.",
+                        random_monster.get_health_info(),
+                        random_monster.get_attack_info(),
                     )
-                    if load_save_decision(self.npc):
-                        self.life_keeper.undo()
-                        self.npc.remove_item_from_bag(ic.Totem())
-                        self.game.transition_to(next_event)
-                    else:
-                        sys.exit(0)
-                if self.npc.get_health_info() <= 0:
-                    print("-------------------")
-                    print("ПОРАЖЕНИЕ")
-                    if load_save_decision(self.npc):
-                        self.life_keeper.undo()
-                        self.npc.remove_item_from_bag(ic.Totem())
-                        self.game.transition_to(next_event)
-                    else:
-                        sys.exit(0)
-                global monster_counter
-                monster_counter += 1
-                self.game.transition_to(next_event)
-            elif decision == 2:
-                self.game.transition_to(next_event)
-        except SystemExit:
-            raise
+                    decision = yield from self.choose_action()
+                    if decision == 1:
+                        self.exchange_blows(random_monster)
+                    elif decision == 2:
+                        break
+                    self.game.transition_to(next_event)
+            if (
+                self.npc.get_health_info() <= 0
+                and random_monster.get_health_info() <= 0
+            ):
+                self.game.sink.emit("separator", "-------------------")
+                self.game.sink.emit(
+                    "defeat",
+                    "ПОРАЖЕНИЕ. Вы избавили мир от великого зла, ценой своей жизни! "
+                    "Ваш подвиг будет согревать сердца людей близлежащей деревни. "
+                    "\nВ вашу честь закатили пирушку и благополучно забыли через год. "
+                    "Возможно, в следующей жизни вам повезёт больше!",
+                )
+                yield from self.load_save(next_event)
+            if self.npc.get_health_info() <= 0:
+                self.game.sink.emit("separator", "-------------------")
+                self.game.sink.emit("defeat", "ПОРАЖЕНИЕ")
+                yield from self.load_save(next_event)
+            self.game.monster_counter += 1
+            self.game.transition_to(next_event)
+        elif decision == 2:
+            self.game.transition_to(next_event)
+
+
+class DecisionPolicy(ABC):
+    """Базовый класс стратегии, принимающей решения за игрока."""
+
+    @abstractmethod
+    def npc_decision(self) -> Optional[int]:
+        """Выбираем класс игрового персонажа."""
+        pass
+
+    @abstractmethod
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Выбираем действие при встрече с чудовищем: 1 - атаковать, 2 - отступить, 3 - сменить оружие."""
+        pass
+
+    @abstractmethod
+    def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Выбираем номер оружия для атаки из доступного игровому персонажу."""
+        pass
+
+    @abstractmethod
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Решаем, забрать ли найденный предмет."""
+        pass
+
+    @abstractmethod
+    def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Решаем, загрузить ли сохранение после гибели игрового персонажа."""
+        pass
+
+
+class ConsolePolicy(DecisionPolicy):
+    """Стратегия, запрашивающая решения у игрока через терминал.
+
+    Перед каждым запросом выводятся сообщения, накопленные приёмником сообщений игры.
+
+    """
+
+    def __init__(self, sink: Optional[osk.OutputSink] = None) -> None:
+        """Конструктор параметров стратегии."""
+        self.sink = sink if sink is not None else osk.null_sink
+
+    def npc_decision(self) -> Optional[int]:
+        """Запрашиваем у игрока класс игрового персонажа."""
+        self.sink.flush()
+        return npc_decision()
+
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Запрашиваем у игрока действие при встрече с чудовищем."""
+        self.sink.flush()
+        return battle_decision(npc_info)
+
+    def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Запрашиваем у игрока оружие для атаки."""
+        self.sink.flush()
+        return weapon_decision(npc_info)
+
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Запрашиваем у игрока решение о найденном предмете."""
+        self.sink.flush()
+        return item_decision(npc_info, weapon_info, totem)
+
+    def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Запрашиваем у игрока решение о загрузке сохранения."""
+        self.sink.flush()
+        return load_save_decision(npc_info)
 
 
 def load_save_decision(
@@ -437,15 +809,6 @@ def battle_decision(
                     f"1 - Атаковать. 2 - Отступить. 3 - Выбрать другое оружие для атаки. "
                 )
             )
-            if decision == 3:
-                npc_info.select_weapon()
-                decision = int(
-                    input(
-                        f"У рыцаря {npc_info.get_health_info()} жизней, "
-                        f"используемое оружие {npc_info.get_weapon_info()}: {npc_info.get_attack_info()}! "
-                        f"1 - Атаковать. 2 - Отступить. "
-                    )
-                )
             if decision > 3 or decision < 1:
                 raise ValueError()
         except ValueError:
@@ -455,6 +818,27 @@ def battle_decision(
     return decision
 
 
+def weapon_decision(
+    npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+) -> Optional[int]:
+    """Получаем от игрока номер оружия для атаки из доступного в инвентаре."""
+    weapons = npc_info.get_weapons()
+    request = "Выберете оружие: " + "".join(
+        f"{n + 1} - {item.__str__()}: {item.get_damage_info()}. "
+        for n, item in enumerate(weapons)
+    )
+    while True:
+        try:
+            decision = int(input(request))
+            if decision > len(weapons) or decision < 1:
+                raise ValueError()
+        except ValueError:
+            print("Неккоректный ввод! Повторите!")
+        else:
+            break
+    return decision
+
+
 def item_decision(
     npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
     weapon_info: Union[
@@ -505,57 +889,73 @@ def item_decision(
 
 
 def create_npc(
-    npc_user_choice: Optional[int], npc_hp: int, npc_attack: int
+    npc_user_choice: Optional[int],
+    npc_hp: int,
+    npc_attack: int,
+    sink: Optional[osk.OutputSink] = None,
+    rng: Optional[rs.GameRandom] = None,
 ) -> Any[object]:
     """В зависимости от выбора игрока создаём игрового персонажа.
 
     Добавляем в инвентарь меч со случайным показателем уровня атаки.
 
     """
+    if sink is None:
+        sink = osk.PrintSink()
     npc: Union[None, cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard] = None
-    initial_weapon = ic.SwordFactory().create_standart_item()
-    if npc_user_choice == 1:
-        npc = cc.HumanFactory(npc_hp, npc_attack).create_swordsman()
-        npc.add_item_to_bag(initial_weapon, initial_weapon=True)
-        print(f"Выбран класс: '{npc}'")
-    elif npc_user_choice == 2:
-        npc = cc.HumanFactory(npc_hp, npc_attack).create_archer()
+    initial_weapon = ic.SwordFactory(rng).create_standart_item()
+    if npc_user_choice in cc.class_profiles:
+        npc = cc.HumanFactory(npc_hp, npc_attack, rng).create_by_code(npc_user_choice)
         npc.add_item_to_bag(initial_weapon, initial_weapon=True)
-        print(f"Выбран класс: '{npc}'")
-    elif npc_user_choice == 3:
-        npc = cc.HumanFactory(npc_hp, npc_attack).create_wizard()
-        npc.add_item_to_bag(initial_weapon, initial_weapon=True)
-        print(f"Выбран класс: '{npc}'")
+        sink.emit("npc", "Выбран класс: '{}'", npc)
     return npc
 
 
-def run_game() -> None:
-    """Запускаем игру в соответствии с заданным игровым сценарием."""
+event_registry = EventRegistry()
+event_registry.register(EventApple, event_probabilities[0])
+event_registry.register(EventSword, event_probabilities[1])
+event_registry.register(EventBow, event_probabilities[2])
+event_registry.register(EventSpellBook, event_probabilities[3])
+event_registry.register(EventArrow, event_probabilities[4])
+event_registry.register(EventTotem, event_probabilities[5], EventTotem)
+event_registry.register(
+    EventBattle,
+    event_probabilities[6],
+    lambda npc, life_keeper: EventBattle(
+        npc, life_keeper, initial_monster_hp_range, initial_monster_attack_range
+    ),
+)
+
+
+def create_event_list(
+    npc: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+    life_keeper: cc.Storage,
+    registry: Optional[EventRegistry] = None,
+) -> Tuple[Event, ...]:
+    """Создаём набор объектов-событий игрового сценария для переданного игрового персонажа."""
+    if registry is None:
+        registry = event_registry
+    return registry.create_events(npc, life_keeper)
+
+
+def run_game() -> Game:
+    """Запускаем игру в соответствии с заданным игровым сценарием.
+
+    Состояние партии, включая счётчик побеждённых чудовищ, хранится в возвращаемом объекте игры.
+
+    """
+    rng = rs.GameRandom()
+    my_npc = create_npc(npc_decision(), initial_npc_hp, initial_npc_attack, rng=rng)
+    life_keeper = cc.Storage(my_npc)
+    my_game = Game(create_event_list(my_npc, life_keeper), rng=rng)
     try:
-        my_npc = create_npc(npc_decision(), initial_npc_hp, initial_npc_attack)
-        life_keeper = cc.Storage(my_npc)
-        ev_list = (
-            EventApple(my_npc),
-            EventSword(my_npc),
-            EventBow(my_npc),
-            EventSpellBook(my_npc),
-            EventArrow(my_npc),
-            EventTotem(my_npc, life_keeper),
-            EventBattle(
-                my_npc,
-                life_keeper,
-                initial_monster_hp_range,
-                initial_monster_attack_range,
-            ),
-        )
-        my_game = Game(ev_list)
-        while monster_counter != 10:
+        while my_game.monster_counter != victory_monster_count:
             my_game.run()
-        print("-------------------")
-        print("ПОБЕДА")
-        sys.exit(0)
-    except SystemExit:
-        raise
+    except GameOver:
+        return my_game
+    print("-------------------")
+    print("ПОБЕДА")
+    return my_game
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import creatures_creator as cc
+import item_creator as ic
+
+
+default_object_count: int = 100000
+
+
+class DictLayout:
+    """Объект, хранящий атрибуты в __dict__, как игровые объекты до перехода на __slots__."""
+
+    pass
+
+
+def slot_names(cls: type) -> List[str]:
+    """Получаем имена всех слотов класса с учётом базовых классов."""
+    names: List[str] = []
+    for base in reversed(cls.__mro__):
+        names.extend(getattr(base, "__slots__", ()))
+    return names
+
+
+def dict_twin(obj: Any) -> DictLayout:
+    """Создаём копию объекта с хранением атрибутов в __dict__."""
+    twin = DictLayout()
+    for name in slot_names(type(obj)):
+        setattr(twin, name, getattr(obj, name))
+    return twin
+
+
+def bytes_per_object(factory: Callable[[], Any], count: int) -> float:
+    """Измеряем объём памяти, занимаемый одним созданным фабрикой объектом."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = objects.__sizeof__()
+    del objects
+    return (after - before - list_overhead) / count
+
+
+def sample_objects() -> Iterable[Tuple[str, Callable[[], Any]]]:
+    """Перечисляем измеряемые игровые объекты."""
+    hero_factory = cc.HumanFactory(15, 15)
+    monster_factory = cc.MonsterFactory(20, 25)
+    return (
+        ("Sword", lambda: ic.Sword(12)),
+        ("UniqueBow", lambda: ic.UniqueBow(30)),
+        ("SpellBook", lambda: ic.SpellBook(9)),
+        ("Arrow", ic.Arrow),
+        ("Apple", lambda: ic.Apple(5)),
+        ("Totem", ic.Totem),
+        ("MonsterSwordsman", monster_factory.create_swordsman),
+        ("MonsterArcher", monster_factory.create_archer),
+        ("MonsterWizard", monster_factory.create_wizard),
+        ("HumanSwordsman", hero_factory.create_swordsman),
+        ("HumanArcher", hero_factory.create_archer),
+        ("HumanWizard", hero_factory.create_wizard),
+    )
+
+
+def measure(count: int = default_object_count) -> Dict[str, Tuple[float, float]]:
+    """Измеряем объём памяти на объект при хранении атрибутов в __dict__ и в __slots__."""
+    report = {}
+    for name, factory in sample_objects():
+        report[name] = (
+            bytes_per_object(lambda: dict_twin(factory()), count),
+            bytes_per_object(factory, count),
+        )
+    return report
+
+
+def print_report(report: Dict[str, Tuple[float, float]]) -> None:
+    """Выводим отчёт об объёме памяти на объект."""
+    print(f"{'Объект':<18}{'__dict__, байт':>16}{'__slots__, байт':>17}")
+    for name, (dict_size, slots_size) in report.items():
+        print(f"{name:<18}{dict_size:>16.1f}{slots_size:>17.1f}")
+
+
+if __name__ == "__main__":
+    print_report(measure())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, List, NamedTuple, Optional, TextIO, Tuple
+
+
+default_buffer_lines: int = 64
+
+
+def render(template: str, args: Tuple[Any, ...]) -> str:
+    """Подставляем значения в шаблон игрового сообщения."""
+    return template.format(*args) if args else template
+
+
+class OutputSink(ABC):
+    """Базовый класс приёмника игровых сообщений.
+
+    События передают приёмнику вид сообщения, шаблон и значения для подстановки,
+    а приёмник сам решает, нужно ли формировать текст сообщения.
+
+    """
+
+    @abstractmethod
+    def emit(self, kind: str, template: str, *args: Any) -> None:
+        """Принимаем игровое сообщение."""
+        pass
+
+    def flush(self) -> None:
+        """Выводим накопленные сообщения."""
+        pass
+
+
+class PrintSink(OutputSink):
+    """Приёмник, сразу выводящий каждое сообщение функцией print()."""
+
+    def emit(self, kind: str, template: str, *args: Any) -> None:
+        """Выводим сообщение."""
+        print(render(template, args))
+
+
+class TerminalSink(OutputSink):
+    """Приёмник, выводящий сообщения в поток вывода пакетами строк.
+
+    Сообщения накапливаются в буфере и записываются одной операцией при его заполнении
+    или при явном вызове flush(), например, перед запросом решения у игрока.
+
+    """
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, buffer_lines: int = default_buffer_lines
+    ) -> None:
+        """Конструктор параметров приёмника."""
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_lines = buffer_lines
+        self._buffer: List[str] = []
+
+    def emit(self, kind: str, template: str, *args: Any) -> None:
+        """Добавляем сообщение в буфер."""
+        self._buffer.append(render(template, args))
+        if len(self._buffer) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записываем накопленные сообщения в поток вывода."""
+        if self._buffer:
+            self._buffer.append("")
+            self.stream.write("\n".join(self._buffer))
+            self.stream.flush()
+            self._buffer.clear()
+
+
+class NullSink(OutputSink):
+    """Приёмник, отбрасывающий сообщения без формирования их текста."""
+
+    def emit(self, kind: str, template: str, *args: Any) -> None:
+        """Отбрасываем сообщение."""
+        pass
+
+
+class SinkRecord(NamedTuple):
+    """Запись о игровом сообщении: вид сообщения, шаблон и подставляемые значения."""
+
+    kind: str
+    template: str
+    args: Tuple[Any, ...]
+
+    def text(self) -> str:
+        """Получаем текст сообщения."""
+        return render(self.template, self.args)
+
+
+class StructuredSink(OutputSink):
+    """Приёмник, сохраняющий сообщения в виде записей для последующей обработки."""
+
+    def __init__(self) -> None:
+        """Конструктор параметров приёмника."""
+        self.records: List[SinkRecord] = []
+
+    def emit(self, kind: str, template: str, *args: Any) -> None:
+        """Сохраняем запись о сообщении."""
+        self.records.append(SinkRecord(kind, template, args))
+
+    def texts(self) -> List[str]:
+        """Получаем тексты сохранённых сообщений."""
+        return [record.text() for record in self.records]
+
+
+null_sink = NullSink()
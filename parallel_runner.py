@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy
+
+import main as rpg
+import simulator as sim
+
+
+default_chunk_size: int = 1000
+
+
+class SimulationSummary(NamedTuple):
+    """Сводные итоги серии партий, сыгранных без участия человека."""
+
+    games: int
+    victories: int
+    monsters: int
+    totem_loads: int
+    turns: int
+    monsters_histogram: Tuple[int, ...]
+
+    @classmethod
+    def from_outcomes(cls, outcomes: Iterable[sim.GameOutcome]) -> SimulationSummary:
+        """Подводим итоги по списку партий."""
+        histogram = [0] * (rpg.victory_monster_count + 1)
+        games = victories = monsters = totem_loads = turns = 0
+        for outcome in outcomes:
+            games += 1
+            victories += outcome.victory
+            monsters += outcome.monsters
+            totem_loads += outcome.totem_loads
+            turns += outcome.turns
+            histogram[outcome.monsters] += 1
+        return cls(games, victories, monsters, totem_loads, turns, tuple(histogram))
+
+    def merge(self, other: SimulationSummary) -> SimulationSummary:
+        """Объединяем итоги двух серий партий."""
+        return SimulationSummary(
+            self.games + other.games,
+            self.victories + other.victories,
+            self.monsters + other.monsters,
+            self.totem_loads + other.totem_loads,
+            self.turns + other.turns,
+            tuple(
+                a + b for a, b in zip(self.monsters_histogram, other.monsters_histogram)
+            ),
+        )
+
+
+def chunk_seeds(master_seed: int, n_chunks: int) -> List[int]:
+    """Получаем независимые начальные значения генераторов для каждой порции партий."""
+    return [
+        int(child.generate_state(1)[0])
+        for child in numpy.random.SeedSequence(master_seed).spawn(n_chunks)
+    ]
+
+
+def run_chunk(task: Tuple[int, int, rpg.DecisionPolicy]) -> SimulationSummary:
+    """Разыгрываем порцию партий в процессе-исполнителе."""
+    n_games, seed, policy = task
+    return SimulationSummary.from_outcomes(sim.simulate(n_games, policy, seed))
+
+
+def run_parallel(
+    n_games: int,
+    policy: Optional[rpg.DecisionPolicy] = None,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = default_chunk_size,
+) -> SimulationSummary:
+    """Распределяем партии по пулу процессов и объединяем их итоги.
+
+    Партии делятся на порции фиксированного размера, каждая со своим начальным значением,
+    полученным из общего. Разбиение не зависит от количества процессов, а итоги порций
+    объединяются в порядке их номеров, поэтому результат не зависит от числа исполнителей.
+
+    """
+    if policy is None:
+        policy = sim.AttackPolicy()
+    n_chunks = -(-n_games // chunk_size)
+    tasks = [
+        (min(chunk_size, n_games - n * chunk_size), chunk_seed, policy)
+        for n, chunk_seed in enumerate(chunk_seeds(seed, n_chunks))
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or n_chunks <= 1:
+        summaries = list(map(run_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(run_chunk, tasks))
+    return reduce(
+        SimulationSummary.merge, summaries, SimulationSummary.from_outcomes(())
+    )
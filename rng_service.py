@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import numpy
+
+default_buffer_size: int = 256
+
+
+class GameRandom:
+    """Класс единого источника случайных чисел игры.
+
+    Владеет одним генератором NumPy и выдаёт равномерные числа из заранее заполненного буфера,
+    на основе которых строятся все остальные случайные величины игры.
+    Игры с одинаковым начальным значением генератора полностью воспроизводимы.
+
+    """
+
+    def __init__(
+        self, seed: Optional[int] = None, buffer_size: int = default_buffer_size
+    ) -> None:
+        """Конструктор параметров источника случайных чисел."""
+        self.generator = numpy.random.default_rng(seed)
+        self.buffer_size = buffer_size
+        self._buffer: List[float] = []
+
+    def random(self) -> float:
+        """Получаем случайное число из полуинтервала [0, 1)."""
+        if not self._buffer:
+            self._buffer = self.generator.random(self.buffer_size).tolist()
+        return self._buffer.pop()
+
+    def randint(self, low: int, high: int) -> int:
+        """Получаем случайное целое число из отрезка [low, high]."""
+        return low + int(self.random() * (high - low + 1))
+
+    def chance(self, probability: float) -> bool:
+        """Проверяем, наступило ли событие с заданной вероятностью."""
+        return self.random() < probability
+
+    def choice(self, items: Sequence[Any], p: Optional[Sequence[float]] = None) -> Any:
+        """Выбираем случайный элемент последовательности, равновероятно или с заданными весами."""
+        if p is None:
+            return items[int(self.random() * len(items))]
+        threshold = self.random() * sum(p)
+        cumulative = 0.0
+        for item, weight in zip(items, p):
+            cumulative += weight
+            if threshold < cumulative:
+                return item
+        return items[-1]
+
+    def random_block(self, size: Union[int, Tuple[int, ...]]) -> numpy.ndarray:
+        """Получаем блок случайных чисел из полуинтервала [0, 1) для пакетных вычислений."""
+        return self.generator.random(size)
+
+
+def game_seeds(seed: Optional[int], n_games: int) -> List[int]:
+    """Получаем независимые начальные значения генераторов для серии игр."""
+    return (
+        numpy.random.SeedSequence(seed)
+        .generate_state(n_games, dtype=numpy.uint64)
+        .tolist()
+    )
+
+
+shared_random = GameRandom()
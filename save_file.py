@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Any, Dict, Optional, Tuple, Type
+
+import creatures_creator as cc
+import item_creator as ic
+
+format_version: int = 1
+max_bag_items: int = 5
+item_codes: Dict[Type[Any], int] = {
+    ic.Sword: 1,
+    ic.UniqueSword: 2,
+    ic.Bow: 3,
+    ic.UniqueBow: 4,
+    ic.SpellBook: 5,
+    ic.UniqueSpellBook: 6,
+    ic.Arrow: 7,
+    ic.Totem: 8,
+}
+plain_items: Tuple[Type[Any], ...] = (ic.Arrow, ic.Totem)
+item_classes: Dict[int, Type[Any]] = {code: cls for cls, code in item_codes.items()}
+weapon_kinds: Tuple[Optional[str], ...] = (None, "МЕЧ", "ЛУК", "КНИГА ЗАКЛИНАНИЙ")
+record_struct = struct.Struct("<BiiBB" + "Bh" * max_bag_items)
+
+
+def encode(memento: cc.ConcreteMemento) -> bytes:
+    """Кодируем состояние игрового персонажа из объекта-снимка в запись фиксированной длины.
+
+    Запись содержит версию формата, уровень жизни, силу атаки, код текущего оружия
+    и предметы инвентаря в виде пар «код предмета - сила атаки».
+
+    """
+    health, attack_value, weapon, bag = memento.get_state()
+    if len(bag) > max_bag_items:
+        raise ValueError(f"В инвентаре больше {max_bag_items} предметов.")
+    fields = [
+        format_version,
+        health,
+        attack_value,
+        weapon_kinds.index(weapon),
+        len(bag),
+    ]
+    for item in bag:
+        damage = 0 if type(item) in plain_items else item.get_damage_info()
+        fields.extend((item_codes[type(item)], damage))
+    fields.extend((0, 0) * (max_bag_items - len(bag)))
+    return record_struct.pack(*fields)
+
+
+def decode(record: Any, offset: int = 0) -> cc.ConcreteMemento:
+    """Восстанавливаем объект-снимок из записи, не копируя её из буфера."""
+    fields = record_struct.unpack_from(record, offset)
+    if fields[0] != format_version:
+        raise KeyError("Запись сохранения отсутствует.")
+    items = []
+    for n in range(fields[4]):
+        item_class = item_classes[fields[5 + 2 * n]]
+        if item_class in plain_items:
+            items.append(ic.item_pool.get(item_class))
+        else:
+            items.append(ic.item_pool.get(item_class, fields[6 + 2 * n]))
+    return cc.ConcreteMemento(
+        fields[1], fields[2], weapon_kinds[fields[3]], cc.Inventory(items)
+    )
+
+
+class SlotFile:
+    """Класс файла сохранений из записей фиксированной длины, отображённого в память.
+
+    Запись сохранения с заданным номером находится по смещению, кратному длине записи,
+    поэтому чтение любого сохранения - одно обращение к отображённой памяти без поиска и разбора текста.
+
+    """
+
+    def __init__(self, path: str, slots: int) -> None:
+        """Открываем файл сохранений, при необходимости расширяя его до заданного количества записей."""
+        self.path = path
+        self.slots = slots
+        size = slots * record_struct.size
+        with open(path, "ab"):
+            pass
+        self._file = open(path, "r+b")
+        if os.path.getsize(path) < size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def _offset(self, slot_id: int) -> int:
+        """Получаем смещение записи сохранения в файле."""
+        if not 0 <= slot_id < self.slots:
+            raise IndexError(f"Номер сохранения вне файла: {slot_id}")
+        return slot_id * record_struct.size
+
+    def write(self, slot_id: int, memento: cc.ConcreteMemento) -> None:
+        """Записываем объект-снимок в заданную запись."""
+        offset = self._offset(slot_id)
+        self._map[offset : offset + record_struct.size] = encode(memento)
+
+    def read(self, slot_id: int) -> cc.ConcreteMemento:
+        """Читаем объект-снимок из заданной записи."""
+        return decode(self._map, self._offset(slot_id))
+
+    def clear(self, slot_id: int) -> None:
+        """Освобождаем заданную запись."""
+        offset = self._offset(slot_id)
+        self._map[offset] = 0
+
+    def __contains__(self, slot_id: object) -> bool:
+        """Проверяем, занята ли запись с заданным номером."""
+        if not isinstance(slot_id, int) or not 0 <= slot_id < self.slots:
+            return False
+        return self._map[slot_id * record_struct.size] == format_version
+
+    def flush(self) -> None:
+        """Записываем изменения на диск."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Закрываем файл сохранений."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> SlotFile:
+        """Открываем файл сохранений в блоке with."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Закрываем файл сохранений при выходе из блока with."""
+        self.close()
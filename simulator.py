@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from typing import Any, List, NamedTuple, Optional, Union
+
+import creatures_creator as cc
+import event_profiler as ep
+import item_creator as ic
+import main as rpg
+import output_sink as osk
+import rng_service as rs
+
+
+class GameOutcome(NamedTuple):
+    """Итог партии, сыгранной без участия человека."""
+
+    victory: bool
+    monsters: int
+    totem_loads: int
+    turns: int
+
+
+class AttackPolicy(rpg.DecisionPolicy):
+    """Стратегия-бот: подбирает все предметы, всегда атакует и загружает сохранение при гибели."""
+
+    def __init__(self, npc_class: int = 1) -> None:
+        """Конструктор параметров стратегии. Задаём класс игрового персонажа."""
+        self.npc_class = npc_class
+
+    def npc_decision(self) -> Optional[int]:
+        """Играем заданным классом персонажа."""
+        return self.npc_class
+
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Всегда атакуем чудовище."""
+        return 1
+
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Забираем любой найденный предмет."""
+        return 1
+
+    def load_save_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Any:
+        """Загружаем сохранение, если в инвентаре есть тотем."""
+        return npc_info.check_item_in_bag(ic.Totem())
+
+    def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Оставляем текущее оружие, если оно доступно, иначе берём первое."""
+        for n, weapon in enumerate(npc_info.get_weapons()):
+            if weapon.__str__() == npc_info.get_weapon_info():
+                return n + 1
+        return 1
+
+
+class RetreatPolicy(AttackPolicy):
+    """Стратегия-бот: отступает от чудовища, если уровень жизни ниже заданного порога."""
+
+    def __init__(self, threshold: int = 10, npc_class: int = 1) -> None:
+        """Конструктор параметров стратегии. Задаём порог уровня жизни и класс игрового персонажа."""
+        super().__init__(npc_class)
+        self.threshold = threshold
+
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Атакуем, пока уровень жизни не ниже порога, иначе отступаем."""
+        return 1 if npc_info.get_health_info() >= self.threshold else 2
+
+
+class GreedyWeaponPolicy(AttackPolicy):
+    """Стратегия-бот: подбирает только более сильное оружие и атакует самым сильным из доступного."""
+
+    def best_weapon(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> int:
+        """Получаем номер самого сильного из доступного оружия."""
+        weapons = npc_info.get_weapons()
+        return 1 + max(range(len(weapons)), key=lambda n: weapons[n].get_damage_info())
+
+    def battle_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Меняем оружие, если доступно более сильное, иначе атакуем."""
+        weapons = npc_info.get_weapons()
+        if (
+            weapons
+            and weapons[self.best_weapon(npc_info) - 1].get_damage_info()
+            > npc_info.get_attack_info()
+        ):
+            return 3
+        return 1
+
+    def weapon_decision(
+        self, npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard]
+    ) -> Optional[int]:
+        """Берём самое сильное оружие."""
+        return self.best_weapon(npc_info)
+
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Забираем тотем, стрелы и оружие сильнее имеющегося того же наименования."""
+        if totem or isinstance(weapon_info, ic.Arrow):
+            return 1
+        owned = npc_info.get_item_info(weapon_info.__str__())
+        if owned is None or weapon_info.get_damage_info() > owned.get_damage_info():
+            return 1
+        return 2
+
+
+class TotemPolicy(AttackPolicy):
+    """Стратегия-бот: всегда атакует и подбирает только тотемы."""
+
+    def item_decision(
+        self,
+        npc_info: Union[cc.HumanSwordsman, cc.HumanArcher, cc.HumanWizard],
+        weapon_info: Any,
+        totem: bool = False,
+    ) -> Optional[int]:
+        """Забираем тотем, остальные предметы оставляем на месте."""
+        return 1 if totem else 2
+
+
+def new_game(
+    policy: rpg.DecisionPolicy,
+    rng: rs.GameRandom,
+    sink: osk.OutputSink = osk.null_sink,
+    profiler: Optional[ep.EventProfiler] = None,
+) -> rpg.Game:
+    """Создаём партию: игрового персонажа выбранного стратегией класса, хранилище сохранений и игру."""
+    npc = rpg.create_npc(
+        policy.npc_decision(),
+        rpg.initial_npc_hp,
+        rpg.initial_npc_attack,
+        sink=sink,
+        rng=rng,
+    )
+    life_keeper = cc.Storage(npc)
+    return rpg.Game(
+        rpg.create_event_list(npc, life_keeper),
+        policy=policy,
+        sink=sink,
+        rng=rng,
+        profiler=profiler,
+    )
+
+
+def play_game(policy: rpg.DecisionPolicy, seed: Optional[int] = None) -> GameOutcome:
+    """Проводим одну партию без обращения к терминалу и возвращаем её итог.
+
+    Партии с одинаковым начальным значением генератора случайных чисел совпадают.
+
+    """
+    game = new_game(policy, rs.GameRandom(seed))
+    victory = True
+    try:
+        while game.monster_counter != rpg.victory_monster_count:
+            game.run()
+    except rpg.GameOver:
+        victory = False
+    return GameOutcome(victory, game.monster_counter, game.totem_loads, game.turns)
+
+
+def simulate(
+    n_games: int,
+    policy: Optional[rpg.DecisionPolicy] = None,
+    seed: Optional[int] = None,
+) -> List[GameOutcome]:
+    """Проводим серию партий без участия человека.
+
+    Каждая партия получает собственное начальное значение генератора, полученное из общего,
+    поэтому при заданном общем значении серия воспроизводима.
+
+    """
+    if policy is None:
+        policy = AttackPolicy()
+    return [play_game(policy, game_seed) for game_seed in rs.game_seeds(seed, n_games)]
@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from unittest import TestCase
+
+import async_game as ag
+import creatures_creator as cc
+import output_sink as osk
+import simulator as sim
+
+
+class YieldingPolicy(ag.AsyncDecisionPolicy):
+    """Асинхронный бот, уступающий цикл событий перед каждым решением."""
+
+    def __init__(self) -> None:
+        """Конструктор параметров стратегии."""
+        self.bot = sim.AttackPolicy()
+
+    async def npc_decision(self):
+        """Играем мечником."""
+        await asyncio.sleep(0)
+        return self.bot.npc_decision()
+
+    async def battle_decision(self, npc_info):
+        """Всегда атакуем чудовище."""
+        await asyncio.sleep(0)
+        return self.bot.battle_decision(npc_info)
+
+    async def weapon_decision(self, npc_info):
+        """Оставляем текущее оружие."""
+        await asyncio.sleep(0)
+        return self.bot.weapon_decision(npc_info)
+
+    async def item_decision(self, npc_info, weapon_info, totem=False):
+        """Забираем любой найденный предмет."""
+        await asyncio.sleep(0)
+        return self.bot.item_decision(npc_info, weapon_info, totem)
+
+    async def load_save_decision(self, npc_info):
+        """Загружаем сохранение, если в инвентаре есть тотем."""
+        await asyncio.sleep(0)
+        return self.bot.load_save_decision(npc_info)
+
+
+class AsyncGameTestCase(TestCase):
+    """Юнит тест для проверки асинхронного цикла игры."""
+
+    def test_interleaved_sessions_match_sequential_games(self):
+        """Тест, проверяющий что одновременные партии совпадают с последовательными."""
+        outcomes = asyncio.run(
+            ag.run_sessions((YieldingPolicy() for _ in range(300)), seed=21)
+        )
+        self.assertEqual(outcomes, sim.simulate(300, sim.AttackPolicy(), seed=21))
+
+    def test_prompt_policy_repeats_invalid_input(self):
+        """Тест, проверяющий повторный запрос решения при некорректном вводе."""
+        answers = iter(["abc", "5", "3"])
+        requests = []
+
+        async def ask(request):
+            requests.append(request)
+            return next(answers)
+
+        sink = osk.StructuredSink()
+        policy = ag.PromptPolicy(ask, sink)
+        self.assertEqual(asyncio.run(policy.npc_decision()), 3)
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(
+            [record.kind for record in sink.records], ["prompt", "error", "error"]
+        )
+
+    def test_prompt_policy_skips_load_without_totem(self):
+        """Тест, проверяющий что загрузка без тотема не запрашивается у игрока."""
+
+        async def ask(request):
+            raise AssertionError(request)
+
+        npc = cc.HumanFactory(15, 15).create_archer()
+        self.assertFalse(asyncio.run(ag.PromptPolicy(ask).load_save_decision(npc)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from unittest import TestCase
+
+import numpy
+
+import battle_kernel as bk
+import creatures_creator as cc
+import rng_service as rs
+
+
+def fight_objects(human, monster):
+    """Проводим бой объектов игры до гибели одной или обеих сторон."""
+    rounds = 0
+    while human.get_health_info() > 0 and monster.get_health_info() > 0:
+        human.get_attack(monster)
+        monster.get_attack(human)
+        rounds += 1
+    return human.get_health_info(), monster.get_health_info(), rounds
+
+
+class BattleKernelTestCase(TestCase):
+    """Юнит тест для проверки пакетного расчёта боёв."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.rng = numpy.random.default_rng(7)
+
+    def test_class_code(self):
+        """Тест, проверяющий коды классов людей и чудовищ."""
+        self.assertEqual(
+            bk.class_code(cc.HumanFactory(1, 1).create_archer()), bk.ARCHER
+        )
+        self.assertEqual(
+            bk.class_code(cc.MonsterFactory(1, 1).create_wizard()), bk.WIZARD
+        )
+
+    def test_matches_objects_without_dodge(self):
+        """Тест, проверяющий совпадение с боем объектов, если классы противников различны."""
+        params = self.rng.integers(1, 40, size=(500, 4))
+        results = bk.resolve_battles(
+            params[:, 0],
+            params[:, 1],
+            params[:, 2],
+            params[:, 3],
+            bk.SWORDSMAN,
+            bk.WIZARD,
+        )
+        for n, (hero_hp, hero_attack, monster_hp, monster_attack) in enumerate(params):
+            human = cc.HumanFactory(hero_hp, hero_attack).create_swordsman()
+            monster = cc.MonsterFactory(monster_hp, monster_attack).create_wizard()
+            self.assertEqual(
+                fight_objects(human, monster),
+                (results.hero_hp[n], results.monster_hp[n], results.rounds[n]),
+            )
+
+    def test_outcomes(self):
+        """Тест, проверяющий определение победителя, в том числе при взаимной гибели."""
+        results = bk.resolve_battles(
+            [10, 10, 10], [10, 5, 5], [10, 10, 20], [10, 20, 1], bk.ARCHER, bk.WIZARD
+        )
+        self.assertEqual(
+            results.winner.tolist(), [bk.MUTUAL_DEATH, bk.MONSTER_WINS, bk.HERO_WINS]
+        )
+
+    def test_dodge_rate_matches_objects(self):
+        """Тест, проверяющий что доля побед при совпадении классов совпадает с боем объектов."""
+        n_battles = 4000
+        results = bk.resolve_battles(
+            15, 12, 20, 25, bk.WIZARD, bk.WIZARD, numpy.random.default_rng(1)
+        )
+        self.assertEqual(results.winner.shape, ())
+        rng = rs.GameRandom(1)
+        object_wins = 0
+        for _ in range(n_battles):
+            human = cc.HumanFactory(15, 12, rng).create_wizard()
+            monster = cc.MonsterFactory(20, 25).create_wizard()
+            object_wins += fight_objects(human, monster)[0] > 0
+        kernel_wins = numpy.sum(
+            bk.resolve_battles(
+                numpy.full(n_battles, 15), 12, 20, 25, bk.WIZARD, bk.WIZARD, self.rng
+            ).winner
+            == bk.HERO_WINS
+        )
+        self.assertAlmostEqual(
+            kernel_wins / n_battles, object_wins / n_battles, delta=0.04
+        )
+
+    def test_random_battles(self):
+        """Тест, проверяющий пакетный бой со случайными чудовищами."""
+        results = bk.random_battles(1000, 15, 15, bk.SWORDSMAN, self.rng)
+        self.assertEqual(results.winner.shape, (1000,))
+        self.assertTrue(numpy.all(results.rounds >= 1))
+
+    def test_endless_battle(self):
+        """Тест, проверяющий отказ проводить бой, в котором стороны не наносят урона."""
+        with self.assertRaises(ValueError):
+            bk.resolve_battles(10, 0, 10, 0, bk.ARCHER, bk.WIZARD)
+
+    def test_odds_without_dodge_are_certain(self):
+        """Тест, проверяющий точный расчёт боя противников разных классов."""
+        for hero_hp, hero_attack, monster_hp, monster_attack in self.rng.integers(
+            1, 40, size=(200, 4)
+        ):
+            human = cc.HumanFactory(hero_hp, hero_attack).create_archer()
+            monster = cc.MonsterFactory(monster_hp, monster_attack).create_swordsman()
+            odds = bk.creature_odds(human, monster)
+            hero_left, monster_left, rounds = fight_objects(human, monster)
+            self.assertEqual(
+                (odds.win, odds.loss, odds.draw),
+                (hero_left > 0, monster_left > 0, hero_left <= 0 and monster_left <= 0),
+            )
+            self.assertEqual(odds.hero_hp, max(hero_left, 0))
+            self.assertEqual(odds.monster_hp, max(monster_left, 0))
+            self.assertEqual(odds.rounds, rounds)
+
+    def test_odds_match_kernel_with_dodge(self):
+        """Тест, проверяющий точный расчёт боя противников одного класса по пакетному бою."""
+        odds = bk.battle_odds(30, 3, 40, 7, True)
+        self.assertAlmostEqual(odds.win + odds.loss + odds.draw, 1.0)
+        results = bk.resolve_battles(
+            numpy.full(100000, 30), 3, 40, 7, bk.WIZARD, bk.WIZARD, self.rng
+        )
+        self.assertAlmostEqual(
+            odds.win, numpy.mean(results.winner == bk.HERO_WINS), delta=0.01
+        )
+        self.assertAlmostEqual(
+            odds.draw, numpy.mean(results.winner == bk.MUTUAL_DEATH), delta=0.01
+        )
+        self.assertAlmostEqual(odds.rounds, numpy.mean(results.rounds), delta=0.05)
+        self.assertEqual(bk.battle_odds(15, 12, 20, 25, True)[:3], (0.25, 0.5, 0.25))
+
+    def test_odds_are_memoized(self):
+        """Тест, проверяющий что повторный расчёт берётся из кэша."""
+        bk.battle_odds.cache_clear()
+        first = bk.battle_odds(15, 12, 20, 25, True)
+        self.assertIs(bk.battle_odds(15, 12, 20, 25, True), first)
+        self.assertEqual(bk.battle_odds.cache_info().hits, 1)
+        self.assertEqual(bk.battle_odds(10, 0, 10, 5, True).rounds, 4.0)
+        with self.assertRaises(ValueError):
+            bk.battle_odds(10, 0, 10, 0, False)
+
+
+if __name__ == "__main__":
+    unittest.main()
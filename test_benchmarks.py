@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import benchmarks as bm
+
+
+class BenchmarksTestCase(TestCase):
+    """Юнит тест для проверки набора тестов производительности."""
+
+    def test_all_cases_run(self):
+        """Тест, проверяющий что каждый тест производительности выполняется."""
+        results = bm.run_benchmarks(number=3, repeat=1)
+        self.assertEqual(set(results), set(bm.benchmark_cases()))
+        self.assertTrue(all(value > 0 for value in results.values()))
+
+    def test_run_in_processes(self):
+        """Тест, проверяющий получение медианы результатов нескольких процессов."""
+        names = [bm.calibration_case, "game.transition_to"]
+        results = bm.run_in_processes(names, number=3, repeat=1, processes=2)
+        self.assertEqual(list(results), names)
+        self.assertTrue(all(value > 0 for value in results.values()))
+
+    def test_compare_with_baseline(self):
+        """Тест, проверяющий обнаружение замедления относительно эталона."""
+        baseline = {"game.run": 1000.0, "storage.backup[8]": 500.0}
+        results = {"game.run": 1200.0, "storage.backup[8]": 700.0, "новый": 1.0}
+        regressions = bm.compare(results, baseline, threshold=0.25)
+        self.assertEqual(
+            regressions, [bm.Regression("storage.backup[8]", 500.0, 700.0)]
+        )
+        self.assertAlmostEqual(regressions[0].ratio(), 1.4)
+
+    def test_compare_scales_by_calibration(self):
+        """Тест, проверяющий поправку эталона на общее замедление машины."""
+        baseline = {bm.calibration_case: 100.0, "game.run": 1000.0}
+        results = {bm.calibration_case: 200.0, "game.run": 2400.0}
+        self.assertEqual(bm.compare(results, baseline, threshold=0.25), [])
+        results["game.run"] = 2600.0
+        self.assertEqual(
+            bm.compare(results, baseline, threshold=0.25),
+            [bm.Regression("game.run", 2000.0, 2600.0)],
+        )
+
+    def test_results_round_trip(self):
+        """Тест, проверяющий запись и чтение результатов в формате JSON."""
+        results = bm.run_benchmarks(["game.transition_to"], number=3, repeat=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            bm.save_results(results, path)
+            self.assertEqual(bm.load_results(path), results)
+
+    def test_baseline_covers_cases(self):
+        """Тест, проверяющий что эталон содержит результаты всех тестов."""
+        baseline = bm.load_results(
+            os.path.join(os.path.dirname(bm.__file__), bm.default_baseline_path)
+        )
+        self.assertEqual(set(baseline), set(bm.benchmark_cases()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import itertools
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import creatures_creator as cc
+import encounters as en
+import main as rpg
+import output_sink as osk
+import rng_service as rs
+import simulator as sim
+
+
+class RetreatPolicy(sim.AttackPolicy):
+    """Стратегия, всегда отступающая от чудовища."""
+
+    def battle_decision(self, npc_info):
+        """Всегда отступаем."""
+        return 2
+
+
+class EncountersTestCase(TestCase):
+    """Юнит тест для проверки потока описаний чудовищ."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.npc = cc.HumanFactory(15, 15).create_swordsman()
+        self.npc.add_item_to_bag(rpg.ic.Sword(10), initial_weapon=True)
+
+    def create_battle(self, encounters, policy):
+        """Создаём событие «Бой» с заданным потоком чудовищ."""
+        battle = rpg.EventBattle(
+            self.npc,
+            cc.Storage(self.npc),
+            rpg.initial_monster_hp_range,
+            rpg.initial_monster_attack_range,
+            encounters,
+        )
+        rpg.Game((battle,) * 7, policy=policy, sink=osk.null_sink, rng=rs.GameRandom(0))
+        return battle
+
+    def test_stream_is_reproducible_and_in_range(self):
+        """Тест, проверяющий воспроизводимость потока и границы параметров чудовищ."""
+        first = list(
+            itertools.islice(
+                en.encounter_stream((10, 25), (10, 30), rs.GameRandom(2)), 200
+            )
+        )
+        second = list(
+            itertools.islice(
+                en.encounter_stream((10, 25), (10, 30), rs.GameRandom(2)), 200
+            )
+        )
+        self.assertEqual(first, second)
+        for spec in first:
+            self.assertIn(spec.class_code, cc.class_names)
+            self.assertTrue(10 <= spec.health <= 25 and 10 <= spec.attack_value <= 30)
+
+    def test_monster_is_created_only_for_fight(self):
+        """Тест, проверяющий что при отступлении объект чудовища не создаётся."""
+        battle = self.create_battle(
+            iter([en.EncounterSpec(cc.ARCHER, 20, 12)]), RetreatPolicy()
+        )
+        with patch.object(en.EncounterSpec, "create_monster") as create_monster:
+            battle.start()
+        create_monster.assert_not_called()
+
+    def test_replay_from_prerolled_stream(self):
+        """Тест, проверяющий бой с чудовищем из заранее подготовленного потока."""
+        sink = osk.StructuredSink()
+        battle = self.create_battle(
+            iter([en.EncounterSpec(cc.WIZARD, 5, 1)]), sim.AttackPolicy()
+        )
+        battle.game.sink = sink
+        battle.start()
+        self.assertIn(
+            "БОЙ! Вы встретили чудовище класса 'Маг'. Жизней 5. Сила атаки 1.",
+            sink.texts(),
+        )
+        self.assertEqual(battle.game.monster_counter, 1)
+        self.assertEqual(self.npc.get_health_info(), 14)
+
+
+if __name__ == "__main__":
+    unittest.main()
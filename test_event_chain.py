@@ -0,0 +1,79 @@
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy
+
+import event_chain as ec
+import main as rpg
+import simulator as sim
+
+
+def walk(chain, battles, rng):
+    """Проходим цепь случайным образом до нужного числа побед и получаем посещения событий."""
+    visits = numpy.zeros(len(chain.names), dtype=numpy.int64)
+    state = rng.choice(len(chain.names), p=chain.initial)
+    while True:
+        visits[state] += 1
+        if visits[chain.battle] == battles:
+            return visits
+        state = rng.choice(len(chain.names), p=chain.matrix[state])
+
+
+class EventChainTestCase(TestCase):
+    """Юнит тест для проверки анализа цепи смены событий."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.chain = ec.game_chain()
+
+    def test_matrix_from_game(self):
+        """Тест, проверяющий построение матрицы переходов по событиям игры."""
+        apple = self.chain.names.index("EventApple")
+        numpy.testing.assert_allclose(self.chain.matrix[apple], 1 / 7)
+        numpy.testing.assert_allclose(
+            self.chain.matrix[self.chain.battle], rpg.event_probabilities
+        )
+        self.assertEqual(self.chain.names[self.chain.battle], "EventBattle")
+
+    def test_stationary_distribution(self):
+        """Тест, проверяющий стационарное распределение цепи."""
+        stationary = self.chain.stationary()
+        self.assertAlmostEqual(stationary.sum(), 1.0)
+        numpy.testing.assert_allclose(stationary @ self.chain.matrix, stationary)
+
+    def test_expected_turns_match_random_walks(self):
+        """Тест, проверяющий ожидаемое количество ходов по случайным блужданиям по цепи."""
+        visits = self.chain.visit_counts()
+        self.assertAlmostEqual(visits["EventBattle"], rpg.victory_monster_count)
+        self.assertAlmostEqual(sum(visits.values()), self.chain.expected_turns())
+        rng = numpy.random.default_rng(5)
+        walks = numpy.array([walk(self.chain, 3, rng) for _ in range(4000)])
+        numpy.testing.assert_allclose(
+            walks.mean(axis=0), self.chain.expected_visits(3), rtol=0.05
+        )
+
+    def test_battle_win_probability(self):
+        """Тест, проверяющий учёт вероятности победы в бою."""
+        self.assertAlmostEqual(
+            self.chain.expected_turns(battle_win=0.5),
+            2 * self.chain.expected_turns(),
+        )
+        self.assertEqual(self.chain.expected_turns(0), 0.0)
+        with self.assertRaises(ValueError):
+            self.chain.expected_turns(battle_win=0.0)
+
+    def test_invincible_bot_games_last_expected_turns(self):
+        """Тест, проверяющий что партии неуязвимого бота длятся ожидаемое количество ходов."""
+        with patch.object(rpg, "initial_npc_hp", 10**9):
+            outcomes = sim.simulate(2000, sim.AttackPolicy(), seed=6)
+        self.assertTrue(all(outcome.victory for outcome in outcomes))
+        self.assertAlmostEqual(
+            numpy.mean([outcome.turns for outcome in outcomes]),
+            self.chain.expected_turns(),
+            delta=0.5,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
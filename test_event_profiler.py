@@ -0,0 +1,85 @@
+import asyncio
+import time
+import unittest
+from unittest import TestCase
+
+import event_profiler as ep
+import main as rpg
+import rng_service as rs
+import simulator as sim
+
+
+class SlowPolicy(sim.AttackPolicy):
+    """Бот, обдумывающий каждое решение о предмете."""
+
+    def item_decision(self, npc_info, weapon_info, totem=False):
+        """Забираем предмет после раздумий."""
+        time.sleep(0.002)
+        return 1
+
+
+class EventProfilerTestCase(TestCase):
+    """Юнит тест для проверки профилирования ходов игры."""
+
+    def play(self, policy, seed):
+        """Проводим партию с профилировщиком."""
+        profiler = ep.EventProfiler()
+        game = sim.new_game(policy, rs.GameRandom(seed), profiler=profiler)
+        try:
+            while game.monster_counter != rpg.victory_monster_count:
+                game.run()
+        except rpg.GameOver:
+            pass
+        return game, profiler
+
+    def test_counts_calls_and_transitions(self):
+        """Тест, проверяющий учёт запусков событий и переходов между ними."""
+        game, profiler = self.play(sim.AttackPolicy(), 3)
+        self.assertEqual(
+            sum(stats.calls for stats in profiler.stats.values()), game.turns
+        )
+        self.assertIn(sum(profiler.transitions.values()), (game.turns - 1, game.turns))
+        for stats in profiler.stats.values():
+            self.assertEqual(sum(stats.wall_histogram), stats.calls)
+            self.assertEqual(sum(stats.cpu_histogram), stats.calls)
+        self.assertIn("Переходы:", profiler.report())
+
+    def test_separates_input_wait(self):
+        """Тест, проверяющий разделение времени ожидания решений и вычислений."""
+        game, profiler = self.play(SlowPolicy(), 3)
+        sword = profiler.stats["EventSword"]
+        self.assertGreaterEqual(sword.wait_ns, sword.decisions * 2000000)
+        self.assertLess(sword.compute_ns(), sword.wait_ns)
+        stacks = profiler.stacks()
+        self.assertIn(f"Game.run;EventSword;input {sword.wait_ns // 1000}", stacks)
+
+    def test_profiler_is_optional(self):
+        """Тест, проверяющий что партии с профилировщиком и без него совпадают."""
+        game, profiler = self.play(sim.AttackPolicy(), 8)
+        self.assertEqual(sim.play_game(sim.AttackPolicy(), 8).turns, game.turns)
+
+    def test_async_sessions_count_their_own_decisions(self):
+        """Тест, проверяющий учёт решений одновременных партий в цикле событий asyncio."""
+        _, expected = self.play(SlowPolicy(), 5)
+        profiler = ep.EventProfiler()
+
+        async def play(seed):
+            game = sim.new_game(SlowPolicy(), rs.GameRandom(seed), profiler=profiler)
+            try:
+                while game.monster_counter != rpg.victory_monster_count:
+                    await game.run_async()
+                    await asyncio.sleep(0)
+            except rpg.GameOver:
+                pass
+
+        async def play_both():
+            await asyncio.gather(play(5), play(5))
+
+        asyncio.run(play_both())
+        for name, stats in expected.stats.items():
+            self.assertEqual(profiler.stats[name].decisions, 2 * stats.decisions)
+            self.assertEqual(profiler.stats[name].calls, 2 * stats.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
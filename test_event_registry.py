@@ -0,0 +1,78 @@
+import unittest
+from unittest import TestCase
+
+import creatures_creator as cc
+import main as rpg
+import output_sink as osk
+import rng_service as rs
+import simulator as sim
+
+
+class EventRegistryTestCase(TestCase):
+    """Юнит тест для проверки реестра событий игрового сценария."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.npc = cc.HumanFactory(10**9, 15).create_archer()
+        self.npc.add_item_to_bag(rpg.ic.Sword(10), initial_weapon=True)
+        self.life_keeper = cc.Storage(self.npc)
+        self.registry = rpg.EventRegistry()
+        for entry in rpg.event_registry:
+            self.registry.register(entry.event_class, entry.weight, entry.create)
+
+    def create_game(self):
+        """Создаём партию бота по реестру событий теста."""
+        return rpg.Game(
+            rpg.create_event_list(self.npc, self.life_keeper, self.registry),
+            policy=sim.AttackPolicy(),
+            sink=osk.null_sink,
+            rng=rs.GameRandom(4),
+            registry=self.registry,
+        )
+
+    def played_events(self, game, turns):
+        """Проводим заданное количество ходов и получаем классы разыгранных объектов-событий."""
+        played = []
+        for _ in range(turns):
+            played.append(type(game.current_event))
+            game.run()
+        return played
+
+    def test_default_scenario(self):
+        """Тест, проверяющий реестр игрового сценария."""
+        events = rpg.create_event_list(self.npc, self.life_keeper)
+        self.assertEqual(
+            [type(event) for event in events],
+            [entry.event_class for entry in rpg.event_registry],
+        )
+        self.assertEqual(rpg.event_registry.weights(events), rpg.event_probabilities)
+        self.assertIs(events[-1].life_keeper, self.life_keeper)
+
+    def test_conditional_weight(self):
+        """Тест, проверяющий вес, зависящий от класса игрового персонажа."""
+        self.registry.register(
+            rpg.EventBow,
+            lambda event: 0.0 if isinstance(event.npc, cc.AbstractArcher) else 0.1,
+        )
+        played = self.played_events(self.create_game(), 300)
+        self.assertNotIn(rpg.EventBow, played[1:])
+
+    def test_table_is_rebuilt_on_change_only(self):
+        """Тест, проверяющий перестройку таблицы выбора событий только при изменении реестра."""
+        game = self.create_game()
+        sampler = game.event_sampler
+        self.played_events(game, 5)
+        self.assertIs(game.event_sampler, sampler)
+        self.registry.register(rpg.EventApple, rpg.event_probabilities[0])
+        self.played_events(game, 1)
+        self.assertIs(game.event_sampler, sampler)
+        self.registry.unregister(rpg.EventTotem)
+        self.played_events(game, 1)
+        self.assertIsNot(game.event_sampler, sampler)
+        self.assertEqual(game.event_sampler.weights[5], 0.0)
+        played = self.played_events(game, 300)
+        self.assertNotIn(rpg.EventTotem, played[2:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from unittest import TestCase
+
+import numpy
+
+import event_sampler as es
+import main as rpg
+import rng_service as rs
+
+
+class AliasSamplerTestCase(TestCase):
+    """Юнит тест для проверки выбора событий по таблице псевдонимов."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.rng = rs.GameRandom(11)
+        self.events = tuple(range(len(rpg.event_probabilities)))
+
+    def test_weighted_distribution(self):
+        """Тест, проверяющий что частоты событий совпадают с заданными вероятностями."""
+        sampler = es.AliasSampler(self.events, rpg.event_probabilities, rng=self.rng)
+        draws = numpy.array([sampler.draw() for _ in range(100000)])
+        frequencies = numpy.bincount(draws, minlength=len(self.events)) / draws.size
+        numpy.testing.assert_allclose(frequencies, rpg.event_probabilities, atol=0.005)
+
+    def test_uniform_distribution(self):
+        """Тест, проверяющий равновероятный выбор событий без заданных весов."""
+        sampler = es.AliasSampler(self.events, rng=self.rng)
+        draws = numpy.array(sampler.draw_block(70000))
+        frequencies = numpy.bincount(draws, minlength=len(self.events)) / draws.size
+        numpy.testing.assert_allclose(frequencies, 1 / len(self.events), atol=0.005)
+
+    def test_zero_weight_is_never_drawn(self):
+        """Тест, проверяющий что событие с нулевым весом не выбирается."""
+        sampler = es.AliasSampler("abc", (1, 0, 3), block_size=7, rng=self.rng)
+        self.assertNotIn("b", [sampler.draw() for _ in range(5000)])
+
+    def test_invalid_weights(self):
+        """Тест, проверяющий отказ строить таблицу для некорректных весов."""
+        with self.assertRaises(ValueError):
+            es.AliasSampler("ab", (1, -1))
+        with self.assertRaises(ValueError):
+            es.AliasSampler("ab", (1, 1, 1))
+
+    def test_alias_cache_is_bounded(self):
+        """Тест, проверяющий что кэш таблиц не растёт при постоянно меняющихся весах."""
+        for weight in range(es.alias_cache_size + 100):
+            es.alias_table((1.0, 1.0 + weight))
+        self.assertEqual(es.alias_table.cache_info().currsize, es.alias_cache_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
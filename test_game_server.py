@@ -0,0 +1,83 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import game_server as gs
+
+
+async def bot_client(reader, writer):
+    """Клиент-бот, отвечающий «1» на каждый запрос сервера, пока партия не окончена."""
+    lines = []
+    while True:
+        line = (await reader.readline()).decode()
+        if not line:
+            break
+        lines.append(line.rstrip("\n"))
+        if line.startswith(gs.prompt_prefix):
+            writer.write(b"1\n")
+            await writer.drain()
+    writer.close()
+    return lines
+
+
+class GameServerTestCase(TestCase):
+    """Юнит тест для проверки игрового сервера."""
+
+    def test_tcp_sessions_are_independent(self):
+        """Тест, проверяющий одновременную игру нескольких игроков по TCP."""
+
+        async def scenario():
+            server = gs.GameServer()
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            connections = [
+                await asyncio.open_connection("127.0.0.1", port) for _ in range(20)
+            ]
+            transcripts = await asyncio.gather(
+                *(bot_client(reader, writer) for reader, writer in connections)
+            )
+            await server.close()
+            return server, transcripts
+
+        server, transcripts = asyncio.run(scenario())
+        self.assertEqual(len(server.outcomes), 20)
+        self.assertEqual(server.sessions, {})
+        for transcript in transcripts:
+            self.assertEqual(transcript[-1], gs.game_over_line)
+            self.assertIn("Выбран класс: 'Мечник'", transcript)
+        for outcome in server.outcomes:
+            self.assertEqual(outcome.victory, outcome.monsters == 10)
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "нет Unix-сокетов")
+    def test_unix_socket_session_and_disconnect(self):
+        """Тест, проверяющий игру по Unix-сокету и обрыв соединения игроком."""
+
+        async def scenario(path):
+            server = gs.GameServer()
+            await server.start_unix(path)
+            reader, writer = await asyncio.open_unix_connection(path)
+            transcript = await bot_client(reader, writer)
+            reader, writer = await asyncio.open_unix_connection(path)
+            await reader.readline()
+            writer.close()
+            while server.sessions:
+                await asyncio.sleep(0.01)
+            await server.close()
+            return server, transcript
+
+        with tempfile.TemporaryDirectory() as directory:
+            server, transcript = asyncio.run(
+                scenario(os.path.join(directory, "game.sock"))
+            )
+        self.assertEqual(transcript[-1], gs.game_over_line)
+        self.assertEqual(len(server.outcomes), 1)
+
+    def test_session_footprint(self):
+        """Тест, проверяющий замер памяти на одну сессию."""
+        self.assertGreater(gs.session_footprint(50), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
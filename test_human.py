@@ -0,0 +1,84 @@
+import unittest
+from unittest import TestCase
+
+import creatures_creator as cc
+import item_creator as ic
+import main as rpg
+import rng_service as rs
+import simulator as sim
+
+
+class HumanTestCase(TestCase):
+    """Юнит тест для проверки людей-воинов, построенных по таблице классов."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.factory = cc.HumanFactory(15, 12, rs.GameRandom(3))
+
+    def test_factory_keeps_public_classes(self):
+        """Тест, проверяющий что фабрика создаёт воинов прежних классов."""
+        for code, create, abstract in (
+            (cc.SWORDSMAN, self.factory.create_swordsman, cc.AbstractSwordsman),
+            (cc.ARCHER, self.factory.create_archer, cc.AbstractArcher),
+            (cc.WIZARD, self.factory.create_wizard, cc.AbstractWizard),
+        ):
+            npc = create()
+            self.assertIsInstance(npc, abstract)
+            self.assertIs(type(self.factory.create_by_code(code)), type(npc))
+            self.assertEqual(npc.class_code, code)
+            self.assertEqual(str(npc), cc.class_names[code])
+            self.assertEqual(npc.weapon_affinity, cc.class_profiles[code].weapon_kind)
+            self.assertEqual(npc.get_health_info(), 15)
+
+    def test_dodge_only_same_class(self):
+        """Тест, проверяющий что уворачиваться можно только от воина того же класса."""
+        npc = cc.HumanFactory(10**6, 12, rs.GameRandom(4)).create_archer()
+        other = [
+            npc.get_attack(cc.MonsterFactory(5, 1).create_wizard()) for _ in range(200)
+        ]
+        same = [
+            npc.get_attack(cc.MonsterFactory(5, 1).create_archer()) for _ in range(200)
+        ]
+        self.assertFalse(any(other))
+        self.assertTrue(50 < sum(same) < 150)
+        self.assertEqual(npc.get_health_info(), 10**6 - 200 - (200 - sum(same)))
+
+    def test_memento_round_trip(self):
+        """Тест, проверяющий сохранение и восстановление человека-воина."""
+        npc = self.factory.create_wizard()
+        npc.add_item_to_bag(ic.SpellBook(9), initial_weapon=True)
+        memento = npc.save()
+        npc.increase_health(5)
+        npc.add_item_to_bag(ic.Sword(20))
+        npc.restore(memento)
+        self.assertEqual(npc.get_health_info(), 15)
+        self.assertEqual(npc.show_bag(), ["КНИГА ЗАКЛИНАНИЙ: 9"])
+
+    def test_weapon_affinity_matches_found_items(self):
+        """Тест, проверяющий что уникальное оружие своего вида находит только склонный к нему воин."""
+        found = []
+
+        class RecordingPolicy(sim.AttackPolicy):
+            def item_decision(self, npc_info, weapon_info, totem=False):
+                found.append((npc_info.class_code, type(weapon_info)))
+                return 2
+
+        for event_class, unique, code in (
+            (rpg.EventSword, ic.UniqueSword, cc.SWORDSMAN),
+            (rpg.EventBow, ic.UniqueBow, cc.ARCHER),
+            (rpg.EventSpellBook, ic.UniqueSpellBook, cc.WIZARD),
+        ):
+            for npc_class in (cc.SWORDSMAN, cc.ARCHER, cc.WIZARD):
+                found.clear()
+                game = sim.new_game(RecordingPolicy(npc_class), rs.GameRandom(2))
+                event = next(e for e in game.event_list if type(e) is event_class)
+                for _ in range(50):
+                    game.transition_to(event)
+                    event.start()
+                self.assertEqual(
+                    any(item is unique for _, item in found), npc_class == code
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from unittest import TestCase
+
+import creatures_creator as cc
+import item_creator as ic
+
+
+class InventoryTestCase(TestCase):
+    """Юнит тест для проверки инвентаря игрового персонажа."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.npc = cc.HumanFactory(15, 15).create_archer()
+        self.npc.add_item_to_bag(ic.Sword(10), initial_weapon=True)
+
+    def test_same_kind_replaces_item(self):
+        """Тест, проверяющий замену предмета того же вида и обновление силы атаки текущего оружия."""
+        self.npc.add_item_to_bag(ic.UniqueSword(30))
+        self.assertEqual(self.npc.show_bag(), ["МЕЧ: 30"])
+        self.assertEqual(self.npc.get_attack_info(), 30)
+
+    def test_bow_requires_arrows(self):
+        """Тест, проверяющий что лук доступен для атаки только при наличии стрел."""
+        self.npc.add_item_to_bag(ic.Bow(12))
+        self.npc.add_item_to_bag(ic.Totem())
+        self.assertEqual([str(item) for item in self.npc._bag.weapons()], ["МЕЧ"])
+        self.npc.add_item_to_bag(ic.Arrow())
+        self.assertEqual(
+            [str(item) for item in self.npc._bag.weapons()], ["МЕЧ", "ЛУК"]
+        )
+        self.npc.remove_item_from_bag(ic.Arrow())
+        self.assertEqual([str(item) for item in self.npc._bag.weapons()], ["МЕЧ"])
+
+    def test_check_and_remove(self):
+        """Тест, проверяющий поиск и удаление предмета."""
+        self.npc.add_item_to_bag(ic.Totem())
+        self.assertTrue(self.npc.check_item_in_bag(ic.Totem()))
+        self.npc.remove_item_from_bag(ic.Totem())
+        self.assertFalse(self.npc.check_item_in_bag(ic.Totem()))
+
+    def test_restore_rebuilds_inventory(self):
+        """Тест, проверяющий восстановление инвентаря из объекта-снимка."""
+        memento = self.npc.save()
+        self.npc.add_item_to_bag(ic.SpellBook(7))
+        self.npc.restore(memento)
+        self.assertEqual(self.npc.show_bag(), ["МЕЧ: 10"])
+
+    def test_snapshots_share_inventory(self):
+        """Тест, проверяющий что снимки хранят ссылку на неизменяемый инвентарь."""
+        storage = cc.Storage(self.npc, capacity=50000)
+        for _ in range(50000):
+            storage.backup()
+        memento = self.npc.save()
+        self.assertIs(memento.get_state()[3], self.npc._bag)
+        self.assertEqual(
+            len({id(memento.get_state()[3]) for memento in storage._mementos}), 1
+        )
+        self.npc.add_item_to_bag(ic.Totem())
+        self.assertEqual([str(item) for item in memento.get_state()[3]], ["МЕЧ"])
+        self.npc.restore(memento)
+        self.assertIs(self.npc._bag, memento.get_state()[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from unittest import TestCase
+
+import item_creator as ic
+import rng_service as rs
+
+
+class ItemPoolTestCase(TestCase):
+    """Юнит тест для проверки пула разделяемых игровых предметов."""
+
+    def test_identical_items_are_shared(self):
+        """Тест, проверяющий что одинаковые предметы являются одним объектом."""
+        pool = ic.ItemPool()
+        self.assertIs(pool.get(ic.Sword, 12), pool.get(ic.Sword, 12))
+        self.assertIsNot(pool.get(ic.Sword, 12), pool.get(ic.UniqueSword, 12))
+        self.assertIsNot(pool.get(ic.Sword, 12), pool.get(ic.Sword, 13))
+        self.assertEqual(len(pool), 3)
+
+    def test_factories_use_pool(self):
+        """Тест, проверяющий что фабрики выдают предметы из пула."""
+        rng = rs.GameRandom(8)
+        swords = {ic.SwordFactory(rng).create_standart_item() for _ in range(2000)}
+        self.assertEqual(len(swords), 16)
+        self.assertIs(
+            ic.ArrowFactory().create_standart_item(),
+            ic.ArrowFactory().create_standart_item(),
+        )
+        self.assertIs(
+            ic.MysteriousPlace().create_standart_item(), ic.item_pool.get(ic.Totem)
+        )
+
+    def test_factory_items_keep_damage(self):
+        """Тест, проверяющий характеристики предметов, полученных из пула."""
+        factory = ic.MagicAcademy(rs.GameRandom(9))
+        book = factory.create_unique_item()
+        self.assertIsInstance(book, ic.UniqueSpellBook)
+        self.assertEqual(book.get_damage_info(), factory.improved_damage_rate)
+
+    def test_item_kinds(self):
+        """Тест, проверяющий что вид предмета общий для стандартной и уникальной модификации."""
+        for standart, unique in (
+            (ic.Sword, ic.UniqueSword),
+            (ic.Bow, ic.UniqueBow),
+            (ic.SpellBook, ic.UniqueSpellBook),
+        ):
+            with self.subTest(item_class=standart.__name__):
+                self.assertEqual(unique.kind, standart.kind)
+                self.assertEqual(str(ic.item_pool.get(unique, 30)), standart.kind)
+        self.assertEqual(str(ic.Arrow()), ic.Arrow.kind)
+
+    def test_shared_items_are_read_only(self):
+        """Тест, проверяющий что характеристики разделяемых предметов нельзя изменить."""
+        for item_class in (ic.Sword, ic.UniqueBow, ic.UniqueSpellBook):
+            with self.subTest(item_class=item_class.__name__):
+                with self.assertRaises(AttributeError):
+                    ic.item_pool.get(item_class, 12).damage_rate = 40
+        with self.assertRaises(AttributeError):
+            ic.Arrow().damage_rate = 1
+        with self.assertRaises(AttributeError):
+            ic.item_pool.get(ic.Apple, 5).healing_power = 15
+        self.assertEqual(ic.item_pool.get(ic.Sword, 12).get_damage_info(), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import io
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import journal as jr
+import simulator as sim
+
+
+class JournalTestCase(TestCase):
+    """Юнит тест для проверки журнала партии и её повтора."""
+
+    def test_replay_reproduces_games(self):
+        """Тест, проверяющий что повтор по журналу совпадает с записанной партией."""
+        for seed in range(30):
+            with self.subTest(seed=seed):
+                outcome, journal = jr.record_game(sim.AttackPolicy(), seed)
+                self.assertEqual(outcome, sim.play_game(sim.AttackPolicy(), seed))
+                self.assertEqual(len(journal), outcome.turns)
+                self.assertEqual(jr.replay(journal), outcome)
+
+    def test_replay_from_dump(self):
+        """Тест, проверяющий повтор партии по журналу, прочитанному из файла."""
+        outcome, journal = jr.record_game(sim.AttackPolicy(3), 7)
+        stream = io.BytesIO()
+        journal.dump(stream)
+        stream.seek(0)
+        loaded = jr.Journal.load(stream)
+        self.assertEqual(loaded.decisions[0], 3)
+        with patch("builtins.input") as fake_input, patch(
+            "builtins.print"
+        ) as fake_print:
+            self.assertEqual(jr.replay(loaded), outcome)
+        fake_input.assert_not_called()
+        fake_print.assert_not_called()
+
+    def test_dump_has_fixed_width(self):
+        """Тест, проверяющий что размер записанного журнала не зависит от платформы."""
+        outcome, journal = jr.record_game(sim.AttackPolicy(), 5, 1000)
+        stream = io.BytesIO()
+        journal.dump(stream)
+        keyframe = io.BytesIO()
+        journal.keyframes[0].dump(keyframe)
+        self.assertEqual(
+            len(stream.getvalue()),
+            jr.header_struct.size
+            + 8 * len(journal.draws)
+            + len(journal.decisions)
+            + 9 * outcome.turns
+            + len(keyframe.getvalue()),
+        )
+
+    def test_divergence_is_reported(self):
+        """Тест, проверяющий обнаружение расхождения повтора с журналом."""
+        outcome, journal = jr.record_game(sim.AttackPolicy(), 11)
+        journal.turn_events[1] = (journal.turn_events[1] + 1) % 7
+        with self.assertRaises(jr.ReplayError):
+            jr.replay(journal)
+
+    def test_seek_matches_full_replay(self):
+        """Тест, проверяющий что переход к ходу по ключевым кадрам совпадает с полным повтором."""
+        for seed in (3, 12, 40):
+            outcome, journal = jr.record_game(sim.AttackPolicy(), seed, 4)
+            stream = io.BytesIO()
+            journal.dump(stream)
+            stream.seek(0)
+            journal = jr.Journal.load(stream)
+            self.assertEqual(len(journal.keyframes), -(-outcome.turns // 4))
+            for turn in range(outcome.turns):
+                with self.subTest(seed=seed, turn=turn):
+                    game = jr.seek(journal, turn)
+                    self.assertEqual(game.turns, turn)
+                    self.assertEqual(jr.run_game(game, journal, check=True), outcome)
+        with self.assertRaises(jr.ReplayError):
+            jr.seek(journal, outcome.turns)
+
+
+if __name__ == "__main__":
+    unittest.main()
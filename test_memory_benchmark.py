@@ -0,0 +1,32 @@
+import unittest
+from unittest import TestCase
+
+import memory_benchmark as mb
+
+
+class MemoryBenchmarkTestCase(TestCase):
+    """Юнит тест для проверки компактного представления игровых объектов."""
+
+    def test_objects_have_no_dict(self):
+        """Тест, проверяющий что игровые объекты не хранят атрибуты в __dict__."""
+        for name, factory in mb.sample_objects():
+            with self.subTest(name=name):
+                self.assertFalse(hasattr(factory(), "__dict__"))
+
+    def test_dict_twin_keeps_attributes(self):
+        """Тест, проверяющий что копия объекта с __dict__ сохраняет значения атрибутов."""
+        for name, factory in mb.sample_objects():
+            prototype = factory()
+            twin = mb.dict_twin(prototype)
+            for slot in mb.slot_names(type(prototype)):
+                self.assertIs(getattr(twin, slot), getattr(prototype, slot))
+
+    def test_slots_are_smaller(self):
+        """Тест, проверяющий что объекты со __slots__ занимают меньше памяти."""
+        for name, (dict_size, slots_size) in mb.measure(count=2000).items():
+            with self.subTest(name=name):
+                self.assertLess(slots_size, dict_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest import TestCase
+
+import numpy
+
+import creatures_creator as cc
+import main as rpg
+import rng_service as rs
+
+
+class MonsterBatchTestCase(TestCase):
+    """Юнит тест для проверки пакетного создания чудовищ."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.batch = cc.MonsterFactory.create_batch(
+            [10, 20, 30], [5, 6, 7], [cc.SWORDSMAN, cc.ARCHER, cc.WIZARD]
+        )
+
+    def test_rows_look_like_monsters(self):
+        """Тест, проверяющий что строки пакета ведут себя как монстры-воины."""
+        self.assertEqual(
+            [str(monster) for monster in self.batch], ["Мечник", "Лучник", "Маг"]
+        )
+        self.assertIsInstance(self.batch[1], cc.AbstractArcher)
+        self.assertEqual(self.batch[2].get_attack_info(), 7)
+
+    def test_fight_updates_arrays(self):
+        """Тест, проверяющий что бой со строкой пакета изменяет массивы пакета."""
+        human = cc.HumanFactory(100, 4).create_wizard()
+        monster = self.batch[0]
+        human.get_attack(monster)
+        monster.get_attack(human)
+        self.assertEqual(human.get_health_info(), 95)
+        self.assertEqual(self.batch.health.tolist(), [6, 20, 30])
+
+    def test_dodge_against_row_of_same_class(self):
+        """Тест, проверяющий возможность увернуться от удара чудовища своего класса из пакета."""
+        human = cc.HumanFactory(10**6, 1, rs.GameRandom(3)).create_wizard()
+        dodges = sum(human.get_attack(self.batch[2]) for _ in range(1000))
+        self.assertAlmostEqual(dodges / 1000, 0.5, delta=0.06)
+
+    def test_create_monster(self):
+        """Тест, проверяющий создание отдельного объекта по строке пакета."""
+        monster = self.batch.create_monster(1)
+        self.assertIsInstance(monster, cc.MonsterArcher)
+        self.assertEqual(monster.get_health_info(), 20)
+
+    def test_random_batch(self):
+        """Тест, проверяющий случайные параметры чудовищ в пакете."""
+        batch = cc.MonsterFactory.create_random_batch(
+            10000,
+            rpg.initial_monster_hp_range,
+            rpg.initial_monster_attack_range,
+            rs.GameRandom(1),
+        )
+        self.assertEqual(len(batch), 10000)
+        self.assertEqual(batch.health.min(), rpg.initial_monster_hp_range[0])
+        self.assertEqual(batch.health.max(), rpg.initial_monster_hp_range[1])
+        self.assertEqual(set(numpy.unique(batch.class_code)), {1, 2, 3})
+
+    def test_mismatched_arrays(self):
+        """Тест, проверяющий отказ создавать пакет из массивов разной длины."""
+        with self.assertRaises(ValueError):
+            cc.MonsterFactory.create_batch([1, 2], [1], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
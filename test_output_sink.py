@@ -0,0 +1,56 @@
+import io
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import creatures_creator as cc
+import main as rpg
+import output_sink as osk
+import rng_service as rs
+import simulator as sim
+
+
+class OutputSinkTestCase(TestCase):
+    """Юнит тест для проверки приёмников игровых сообщений."""
+
+    def test_structured_sink_records(self):
+        """Тест, проверяющий сохранение сообщений партии в виде записей."""
+        sink = osk.StructuredSink()
+        rng = rs.GameRandom(2)
+        npc = rpg.create_npc(1, 15, 15, sink=sink, rng=rng)
+        game = rpg.Game(
+            rpg.create_event_list(npc, cc.Storage(npc)),
+            policy=sim.AttackPolicy(),
+            sink=sink,
+            rng=rng,
+        )
+        for _ in range(5):
+            game.run()
+        self.assertEqual(sink.records[0].text(), "Выбран класс: 'Мечник'")
+        self.assertEqual(sum(record.kind == "separator" for record in sink.records), 5)
+        sink.emit("battle", "Жизней {}. Сила атаки {}.", 12, 20)
+        self.assertEqual(sink.records[-1].kind, "battle")
+        self.assertEqual(sink.texts()[-1], "Жизней 12. Сила атаки 20.")
+
+    def test_terminal_sink_batches_lines(self):
+        """Тест, проверяющий вывод сообщений пакетами строк."""
+        stream = io.StringIO()
+        sink = osk.TerminalSink(stream, buffer_lines=3)
+        sink.emit("separator", "-------------------")
+        sink.emit("saved", "Игра сохранена!")
+        self.assertEqual(stream.getvalue(), "")
+        sink.flush()
+        self.assertEqual(stream.getvalue(), "-------------------\nИгра сохранена!\n")
+        for n in range(3):
+            sink.emit("wounded", "Осталось жизней {}.", n)
+        self.assertTrue(stream.getvalue().endswith("Осталось жизней 2.\n"))
+
+    def test_null_sink_skips_formatting(self):
+        """Тест, проверяющий что отброшенные сообщения не форматируются."""
+        with patch.object(osk, "render") as render:
+            osk.null_sink.emit("battle", "Жизней {}.", 12)
+        render.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from unittest import TestCase
+
+import parallel_runner as pr
+import simulator as sim
+
+
+class ParallelRunnerTestCase(TestCase):
+    """Юнит тест для проверки распределённого проведения серии партий."""
+
+    def test_result_does_not_depend_on_workers(self):
+        """Тест, проверяющий что итоги совпадают при любом количестве процессов."""
+        single = pr.run_parallel(
+            250, sim.AttackPolicy(3), seed=5, workers=1, chunk_size=40
+        )
+        multi = pr.run_parallel(
+            250, sim.AttackPolicy(3), seed=5, workers=3, chunk_size=40
+        )
+        self.assertEqual(single, multi)
+        self.assertEqual(single.games, 250)
+        self.assertEqual(sum(single.monsters_histogram), 250)
+
+    def test_summary_matches_outcomes(self):
+        """Тест, проверяющий что итоги порции совпадают с итогами отдельных партий."""
+        seed = pr.chunk_seeds(9, 1)[0]
+        outcomes = sim.simulate(100, seed=seed)
+        summary = pr.run_parallel(100, seed=9, workers=1, chunk_size=100)
+        self.assertEqual(summary.victories, sum(o.victory for o in outcomes))
+        self.assertEqual(summary.turns, sum(o.turns for o in outcomes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest import TestCase
+
+import rng_service as rs
+import simulator as sim
+
+
+class GameRandomTestCase(TestCase):
+    """Юнит тест для проверки единого источника случайных чисел."""
+
+    def test_same_seed_same_draws(self):
+        """Тест, проверяющий воспроизводимость случайных величин при одинаковом начальном значении."""
+        first, second = rs.GameRandom(4), rs.GameRandom(4)
+        self.assertEqual(
+            [first.randint(5, 20) for _ in range(1000)],
+            [second.randint(5, 20) for _ in range(1000)],
+        )
+
+    def test_randint_bounds(self):
+        """Тест, проверяющий что случайное целое не выходит за границы отрезка."""
+        rng = rs.GameRandom(5)
+        self.assertEqual({rng.randint(3, 6) for _ in range(2000)}, {3, 4, 5, 6})
+
+    def test_weighted_choice(self):
+        """Тест, проверяющий выбор элемента с заданными весами."""
+        rng = rs.GameRandom(6)
+        draws = [rng.choice("ab", p=(0.4, 0.6)) for _ in range(20000)]
+        self.assertAlmostEqual(draws.count("a") / len(draws), 0.4, delta=0.02)
+
+    def test_game_is_reproducible(self):
+        """Тест, проверяющий что партии с одинаковым начальным значением совпадают."""
+        for seed in range(20):
+            self.assertEqual(
+                sim.play_game(sim.AttackPolicy(2), seed),
+                sim.play_game(sim.AttackPolicy(2), seed),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
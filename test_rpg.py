@@ -14,6 +14,7 @@ class SwordsmanRpgTestCase(TestCase):
         self.victory_count = 0
         self.fail_count = 0
         self.load_count = 0
+        self.checked_victories = 0
 
     def fake_io_with_asserts(self, *args):
         """Обработка print() и input() в программе с проверками результата."""
@@ -35,11 +36,9 @@ class SwordsmanRpgTestCase(TestCase):
         elif "РАНЕНО" in last_io:
             self.input = "1"
         elif "ПОБЕДА" in last_io:
-            self.assertEqual(rpg.monster_counter, 10)
             self.victory_count += 1
             self.input = "\n"
         elif "ПОРАЖЕНИЕ" in last_io:
-            self.assertTrue(rpg.monster_counter < 10)
             self.fail_count += 1
             self.input = "\n"
         elif "ЗАГРУЗИТЬ" in last_io:
@@ -53,16 +52,14 @@ class SwordsmanRpgTestCase(TestCase):
         """Тест, выполняющий полностью прохождение игры."""
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
-                with self.assertRaises(SystemExit):
-                    rpg.run_game()
+                self.check_outcome(rpg.run_game())
 
     def test_game_e2e_until_at_least_one_victory(self):
         """Тест, проверяющий что в игру возможно когда-нибудь выиграть."""
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
                 while self.victory_count == 0:
-                    with self.assertRaises(SystemExit):
-                        rpg.run_game()
+                    self.check_outcome(rpg.run_game())
         self.assertEqual(self.victory_count, 1)
 
     def test_game_e2e_until_at_least_one_load(self):
@@ -70,12 +67,16 @@ class SwordsmanRpgTestCase(TestCase):
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
                 while self.load_count == 0:
-                    with self.assertRaises(SystemExit):
-                        rpg.run_game()
+                    self.check_outcome(rpg.run_game())
         self.assertGreater(self.load_count, 0)
 
-    def tearDown(self):
-        rpg.monster_counter = 0
+    def check_outcome(self, game):
+        """Проверка счётчика побеждённых чудовищ завершённой партии."""
+        if self.victory_count > self.checked_victories:
+            self.assertEqual(game.monster_counter, 10)
+        else:
+            self.assertLess(game.monster_counter, 10)
+        self.checked_victories = self.victory_count
 
 
 class ArcherRpgTestCase(TestCase):
@@ -87,6 +88,7 @@ class ArcherRpgTestCase(TestCase):
         self.victory_count = 0
         self.fail_count = 0
         self.load_count = 0
+        self.checked_victories = 0
 
     def fake_io_with_asserts(self, *args):
         """Обработка print() и input() в программе с проверками результата."""
@@ -108,11 +110,9 @@ class ArcherRpgTestCase(TestCase):
         elif "РАНЕНО" in last_io:
             self.input = "1"
         elif "ПОБЕДА" in last_io:
-            self.assertEqual(rpg.monster_counter, 10)
             self.victory_count += 1
             self.input = "\n"
         elif "ПОРАЖЕНИЕ" in last_io:
-            self.assertTrue(rpg.monster_counter < 10)
             self.fail_count += 1
             self.input = "\n"
         elif "ЗАГРУЗИТЬ" in last_io:
@@ -126,16 +126,14 @@ class ArcherRpgTestCase(TestCase):
         """Тест, выполняющий полностью прохождение игры."""
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
-                with self.assertRaises(SystemExit):
-                    rpg.run_game()
+                self.check_outcome(rpg.run_game())
 
     def test_game_e2e_until_at_least_one_victory(self):
         """Тест, проверяющий что в игру возможно когда-нибудь выиграть."""
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
                 while self.victory_count == 0:
-                    with self.assertRaises(SystemExit):
-                        rpg.run_game()
+                    self.check_outcome(rpg.run_game())
         self.assertEqual(self.victory_count, 1)
 
     def test_game_e2e_until_at_least_one_load(self):
@@ -143,12 +141,16 @@ class ArcherRpgTestCase(TestCase):
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
                 while self.load_count == 0:
-                    with self.assertRaises(SystemExit):
-                        rpg.run_game()
+                    self.check_outcome(rpg.run_game())
         self.assertGreater(self.load_count, 0)
 
-    def tearDown(self):
-        rpg.monster_counter = 0
+    def check_outcome(self, game):
+        """Проверка счётчика побеждённых чудовищ завершённой партии."""
+        if self.victory_count > self.checked_victories:
+            self.assertEqual(game.monster_counter, 10)
+        else:
+            self.assertLess(game.monster_counter, 10)
+        self.checked_victories = self.victory_count
 
 
 class WizardRpgTestCase(TestCase):
@@ -160,6 +162,7 @@ class WizardRpgTestCase(TestCase):
         self.victory_count = 0
         self.fail_count = 0
         self.load_count = 0
+        self.checked_victories = 0
 
     def fake_io_with_asserts(self, *args):
         """Обработка print() и input() в программе с проверками результата."""
@@ -181,11 +184,9 @@ class WizardRpgTestCase(TestCase):
         elif "РАНЕНО" in last_io:
             self.input = "1"
         elif "ПОБЕДА" in last_io:
-            self.assertEqual(rpg.monster_counter, 10)
             self.victory_count += 1
             self.input = "\n"
         elif "ПОРАЖЕНИЕ" in last_io:
-            self.assertTrue(rpg.monster_counter < 10)
             self.fail_count += 1
             self.input = "\n"
         elif "ЗАГРУЗИТЬ" in last_io:
@@ -199,16 +200,14 @@ class WizardRpgTestCase(TestCase):
         """Тест, выполняющий полностью прохождение игры."""
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
-                with self.assertRaises(SystemExit):
-                    rpg.run_game()
+                self.check_outcome(rpg.run_game())
 
     def test_game_e2e_until_at_least_one_victory(self):
         """Тест, проверяющий что в игру возможно когда-нибудь выиграть."""
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
                 while self.victory_count == 0:
-                    with self.assertRaises(SystemExit):
-                        rpg.run_game()
+                    self.check_outcome(rpg.run_game())
         self.assertEqual(self.victory_count, 1)
 
     def test_game_e2e_until_at_least_one_load(self):
@@ -216,12 +215,16 @@ class WizardRpgTestCase(TestCase):
         with patch("builtins.print", new=self.fake_io_with_asserts):
             with patch("builtins.input", side_effect=lambda _: self.input):
                 while self.load_count == 0:
-                    with self.assertRaises(SystemExit):
-                        rpg.run_game()
+                    self.check_outcome(rpg.run_game())
         self.assertGreater(self.load_count, 0)
 
-    def tearDown(self):
-        rpg.monster_counter = 0
+    def check_outcome(self, game):
+        """Проверка счётчика побеждённых чудовищ завершённой партии."""
+        if self.victory_count > self.checked_victories:
+            self.assertEqual(game.monster_counter, 10)
+        else:
+            self.assertLess(game.monster_counter, 10)
+        self.checked_victories = self.victory_count
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import creatures_creator as cc
+import item_creator as ic
+import save_file as sf
+
+
+class SaveFileTestCase(TestCase):
+    """Юнит тест для проверки двоичного файла сохранений."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.npc = cc.HumanFactory(15, 15).create_archer()
+        self.npc.add_item_to_bag(ic.Sword(10), initial_weapon=True)
+        self.npc.add_item_to_bag(ic.UniqueBow(27))
+        self.npc.add_item_to_bag(ic.Arrow())
+        self.npc.add_item_to_bag(ic.Totem())
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "saves.bin")
+
+    def tearDown(self) -> None:
+        """Удаляем временный каталог."""
+        self.directory.cleanup()
+
+    def test_encode_round_trip(self):
+        """Тест, проверяющий кодирование и декодирование состояния персонажа."""
+        record = sf.encode(self.npc.save())
+        self.assertEqual(len(record), sf.record_struct.size)
+        memento = sf.decode(record)
+        health, attack_value, weapon, bag = memento.get_state()
+        self.assertEqual((health, attack_value, weapon), (15, 10, "МЕЧ"))
+        self.assertEqual(
+            [(str(item), item.get_damage_info()) for item in bag],
+            [("МЕЧ", 10), ("ЛУК", 27), ("СТРЕЛЫ", 0), ("ТОТЕМ", "Воскрешение")],
+        )
+        self.assertIs(bag.get("ЛУК"), ic.item_pool.get(ic.UniqueBow, 27))
+
+    def test_slots_survive_reopen(self):
+        """Тест, проверяющий чтение сохранения после повторного открытия файла."""
+        with sf.SlotFile(self.path, 100000) as slots:
+            slots.write(99999, self.npc.save())
+            self.assertNotIn(5, slots)
+        self.assertEqual(os.path.getsize(self.path), 100000 * sf.record_struct.size)
+        self.npc.increase_health(40)
+        with sf.SlotFile(self.path, 100000) as slots:
+            self.assertIn(99999, slots)
+            self.npc.restore(slots.read(99999))
+            slots.clear(99999)
+            self.assertNotIn(99999, slots)
+            with self.assertRaises(KeyError):
+                slots.read(99999)
+            with self.assertRaises(IndexError):
+                slots.read(100000)
+        self.assertEqual(self.npc.get_health_info(), 15)
+        self.assertEqual(self.npc.get_weapon_info(), "МЕЧ")
+        self.assertTrue(self.npc.check_item_in_bag(ic.Totem()))
+
+
+if __name__ == "__main__":
+    unittest.main()
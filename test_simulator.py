@@ -0,0 +1,76 @@
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import creatures_creator as cc
+import item_creator as ic
+import main as rpg
+import simulator as sim
+
+
+class SimulatorTestCase(TestCase):
+    """Юнит тест для проверки игры без участия человека."""
+
+    def test_simulate_does_not_use_terminal(self):
+        """Тест, проверяющий что симуляция не обращается к print() и input()."""
+        with patch("builtins.print") as fake_print:
+            with patch("builtins.input") as fake_input:
+                outcomes = sim.simulate(50, sim.AttackPolicy(2), seed=1)
+        fake_print.assert_not_called()
+        fake_input.assert_not_called()
+        self.assertEqual(len(outcomes), 50)
+
+    def test_simulate_outcomes(self):
+        """Тест, проверяющий согласованность итогов партий."""
+        for outcome in sim.simulate(200, seed=2):
+            if outcome.victory:
+                self.assertEqual(outcome.monsters, rpg.victory_monster_count)
+            else:
+                self.assertLess(outcome.monsters, rpg.victory_monster_count)
+            self.assertGreaterEqual(outcome.turns, outcome.monsters)
+
+    def test_simulate_is_reproducible(self):
+        """Тест, проверяющий что серии партий с одинаковым начальным значением совпадают."""
+        for npc_class in (1, 2, 3):
+            self.assertEqual(
+                sim.simulate(100, sim.AttackPolicy(npc_class), seed=3),
+                sim.simulate(100, sim.AttackPolicy(npc_class), seed=3),
+            )
+
+    def test_bots_do_not_use_terminal(self):
+        """Тест, проверяющий что встроенные боты играют без print() и input()."""
+        bots = (
+            sim.RetreatPolicy(12),
+            sim.GreedyWeaponPolicy(2),
+            sim.TotemPolicy(3),
+        )
+        with patch("builtins.print") as fake_print:
+            with patch("builtins.input") as fake_input:
+                for bot in bots:
+                    for outcome in sim.simulate(50, bot, seed=4):
+                        self.assertGreaterEqual(outcome.turns, outcome.monsters)
+        fake_print.assert_not_called()
+        fake_input.assert_not_called()
+
+    def test_greedy_bot_switches_to_best_weapon(self):
+        """Тест, проверяющий что жадный бот меняет оружие на самое сильное."""
+        npc = cc.HumanFactory(15, 15).create_wizard()
+        npc.add_item_to_bag(ic.Sword(10), initial_weapon=True)
+        npc.add_item_to_bag(ic.SpellBook(14))
+        bot = sim.GreedyWeaponPolicy()
+        self.assertEqual(bot.battle_decision(npc), 3)
+        npc.equip_weapon(bot.weapon_decision(npc))
+        self.assertEqual(npc.get_attack_info(), 14)
+        self.assertEqual(bot.battle_decision(npc), 1)
+        self.assertEqual(bot.item_decision(npc, ic.SpellBook(12)), 2)
+        self.assertEqual(bot.item_decision(npc, ic.Sword(11)), 1)
+
+    def test_retreat_bot_threshold(self):
+        """Тест, проверяющий отступление бота при уровне жизни ниже порога."""
+        npc = cc.HumanFactory(15, 15).create_archer()
+        self.assertEqual(sim.RetreatPolicy(15).battle_decision(npc), 1)
+        self.assertEqual(sim.RetreatPolicy(16).battle_decision(npc), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
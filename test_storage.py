@@ -0,0 +1,79 @@
+import tracemalloc
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import creatures_creator as cc
+import item_creator as ic
+
+
+class StorageTestCase(TestCase):
+    """Юнит тест для проверки хранилища снимков состояния игрового персонажа."""
+
+    def setUp(self) -> None:
+        """Начальные условия для тестов."""
+        self.npc = cc.HumanFactory(15, 15).create_swordsman()
+        self.npc.add_item_to_bag(ic.Sword(12), initial_weapon=True)
+
+    def test_capacity_evicts_oldest(self):
+        """Тест, проверяющий вытеснение самых старых снимков."""
+        storage = cc.Storage(self.npc, capacity=3)
+        for _ in range(5):
+            self.npc.increase_health(1)
+            storage.backup()
+        self.assertEqual(len(storage), 3)
+        self.assertEqual(storage.evicted, 2)
+        self.assertEqual(
+            [name[:8] for name in next(storage.history())],
+            ["(18, 12,", "(19, 12,", "(20, 12,"],
+        )
+
+    def test_undo_skips_broken_mementos_iteratively(self):
+        """Тест, проверяющий восстановление после множества повреждённых снимков без рекурсии."""
+        storage = cc.Storage(self.npc, capacity=5000)
+        for _ in range(5000):
+            storage.backup()
+        self.npc.increase_health(10)
+        with patch.object(
+            cc.HumanSwordsman,
+            "restore",
+            side_effect=[ValueError()] * 4999 + [None],
+        ) as broken_restore:
+            storage.undo()
+        self.assertEqual(broken_restore.call_count, 5000)
+        self.assertEqual(len(storage), 0)
+        storage.backup()
+        self.npc.increase_health(10)
+        storage.undo()
+        self.assertEqual(self.npc.get_health_info(), 25)
+
+    def test_history_pages_are_lazy(self):
+        """Тест, проверяющий постраничное формирование истории сохранений."""
+        storage = cc.Storage(self.npc, capacity=25)
+        for _ in range(25):
+            storage.backup()
+        with patch.object(
+            cc.ConcreteMemento, "get_name", return_value="снимок"
+        ) as get_name:
+            pages = storage.history(page_size=10)
+            self.assertEqual(len(next(pages)), 10)
+            self.assertEqual(get_name.call_count, 10)
+            self.assertEqual([len(page) for page in pages], [10, 5])
+
+    def test_soak_memory_is_constant(self):
+        """Тест, проверяющий что память хранилища не растёт при частых сохранениях."""
+        storage = cc.Storage(self.npc)
+        for _ in range(1000):
+            storage.backup()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(20000):
+            storage.backup()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.assertEqual(len(storage), cc.default_storage_capacity)
+        self.assertLess(after - before, 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()